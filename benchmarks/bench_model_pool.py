@@ -0,0 +1,102 @@
+"""WhisperModelPool throughput over processes x cpu_threads on one machine.
+
+python benchmarks/bench_model_pool.py --audio speech.wav --model small --processes 1 2 4 8
+"""
+
+import time
+import argparse
+import numpy as np
+
+from faster_whisper import decode_audio
+
+from sjaipy.asr.batched import WHISPER_SR
+from sjaipy.asr.model_pool import WhisperModelPool
+from sjaipy.evaluator.sharded import available_cpus
+
+
+def make_clips(path: str, clip_seconds: float, num_clips: int) -> list[np.ndarray]:
+    audio = decode_audio(path, sampling_rate=WHISPER_SR)
+    size = int(clip_seconds * WHISPER_SR)
+    clips = [audio[start : start + size] for start in range(0, len(audio), size)]
+    clips = [clip for clip in clips if len(clip) > 0]
+    # 파일이 짧으면 반복해서 채움
+    return [clips[i % len(clips)] for i in range(num_clips)]
+
+
+def run(pool: WhisperModelPool, clips: list[np.ndarray], batch_size: int) -> float:
+    start = time.perf_counter()
+    if batch_size > 1:
+        futures = [
+            pool.submit_batch(clips[i : i + batch_size])
+            for i in range(0, len(clips), batch_size)
+        ]
+    else:
+        futures = [pool.submit(clip) for clip in clips]
+    for future in futures:
+        future.result()
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--audio", required=True, help="speech file to cut into clips")
+    parser.add_argument("--model", default="small")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--language", default=None)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="*",
+        default=None,
+        help="cpu_threads per process; default: cores / processes",
+    )
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--clip-seconds", type=float, default=15.0)
+    parser.add_argument("--clips", type=int, default=64)
+    parser.add_argument("--no-pin", action="store_true")
+    args = parser.parse_args(argv)
+
+    cpus = available_cpus()
+    clips = make_clips(args.audio, args.clip_seconds, args.clips)
+    audio_seconds = sum(len(clip) for clip in clips) / WHISPER_SR
+    print(f"{len(cpus)} cpus, {len(clips)} clips, {audio_seconds:.0f}s of audio")
+
+    results = []
+    for processes in args.processes:
+        if processes > len(cpus):
+            continue
+        for threads in args.threads or [len(cpus) // processes]:
+            load_start = time.perf_counter()
+            with WhisperModelPool(
+                args.model,
+                processes,
+                cpu_threads=threads,
+                pin=not args.no_pin,
+                cpus=cpus,
+                batch_size=args.batch_size,
+                compute_type=args.compute_type,
+                transcribe_kwargs={"language": args.language},
+            ) as pool:
+                load_time = time.perf_counter() - load_start
+                # 첫 요청의 지연(메모리 할당 등)을 측정에서 제외
+                run(pool, clips[: processes * max(args.batch_size, 1)], args.batch_size)
+                elapsed = run(pool, clips, args.batch_size)
+            results.append((processes, threads, elapsed))
+            print(
+                f"processes={processes:2d} threads={threads:2d} "
+                f"load={load_time:6.1f}s elapsed={elapsed:7.2f}s "
+                f"rtf={elapsed / audio_seconds:.4f} "
+                f"throughput={audio_seconds / elapsed:6.1f}x"
+            )
+
+    if results:
+        processes, threads, elapsed = min(results, key=lambda x: x[2])
+        print(
+            f"best: processes={processes} threads={threads} "
+            f"({audio_seconds / elapsed:.1f}x real time)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Native scorer vs `sctk sclite` on a synthetic corpus.
+
+python benchmarks/bench_scorer.py --sentences 10000 --words 20
+
+Native timings on one Xeon core, Python 3.11, default corpus (~20 words per
+sentence, 15% errors): 10k sentences 0.29s, 100k sentences 3.0s. The sclite
+column and the speedup are printed only where `sctk` is installed; they have
+not been measured yet.
+"""
+
+import time
+import shutil
+import argparse
+import numpy as np
+
+from sjaipy.evaluator.scorer import score_trn
+from sjaipy.evaluator.sclite_utils import TRNFormat, parse_sclite_summary, sclite_trn
+
+
+def make_corpus(
+    num_sentences: int, num_words: int, vocab_size: int, error_rate: float, seed: int
+) -> tuple[list[TRNFormat], list[TRNFormat]]:
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"W{i}" for i in range(vocab_size)])
+    refs, hyps = [], []
+    for i in range(num_sentences):
+        ref = rng.choice(vocab, size=rng.integers(1, 2 * num_words)).tolist()
+        hyp = []
+        for word in ref:
+            r = rng.random()
+            if r < error_rate / 3:
+                continue  # deletion
+            if r < 2 * error_rate / 3:
+                hyp.append(str(rng.choice(vocab)))  # substitution
+            elif r < error_rate:
+                hyp.extend([word, str(rng.choice(vocab))])  # insertion
+            else:
+                hyp.append(word)
+        refs.append(TRNFormat(id=f"utt_{i:06d}", text=" ".join(ref)))
+        hyps.append(TRNFormat(id=f"utt_{i:06d}", text=" ".join(hyp)))
+    return refs, hyps
+
+
+def timeit(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=10_000)
+    parser.add_argument("--words", type=int, default=20)
+    parser.add_argument("--vocab", type=int, default=5_000)
+    parser.add_argument("--error-rate", type=float, default=0.15)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    ref, hyp = make_corpus(
+        args.sentences, args.words, args.vocab, args.error_rate, args.seed
+    )
+
+    native_time, native = timeit(lambda: score_trn(ref, hyp), args.repeat)
+    print(f"native: {native_time:.3f}s {native}")
+
+    if shutil.which("sctk") is None:
+        print("sclite: skipped (sctk is not installed)")
+        return
+
+    sclite_time, sclite = timeit(
+        lambda: parse_sclite_summary(sclite_trn(ref, hyp)), args.repeat
+    )
+    print(f"sclite: {sclite_time:.3f}s {sclite}")
+    print(f"speedup: {sclite_time / native_time:.1f}x, equal: {native == sclite}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import time
+import numpy as np
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generator, NamedTuple, Sequence
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+from sjaipy.asr.model_pool import WhisperModelPool
+from sjaipy.asr.whisper_utils import segments_to_text
+from sjaipy.audio.resampler import resample
+from sjaipy.evaluator.sclite_utils import TRNFormat
+
+if TYPE_CHECKING:
+    from sjaipy.datasets import Dataset
+
+WHISPER_SR = 16_000
+# Whisper 한 창의 길이(초)
+CHUNK_LENGTH = 30
+MAX_CHUNK_SAMPLES = CHUNK_LENGTH * WHISPER_SR
+
+
+class TranscriptionStats(NamedTuple):
+    num_samples: int
+    audio_seconds: float
+    elapsed_seconds: float
+
+    @property
+    def rtf(self) -> float:
+        """real-time factor, 전사 시간 / 오디오 길이"""
+        return self.elapsed_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+
+class BatchedTranscriber:
+    """faster-whisper 의 BatchedInferencePipeline 으로 Dataset 을 전사하는 드라이버
+
+    30초 이하 발화는 `batch_size` 개씩 한 오디오로 이어 붙이고, 발화마다
+    `clip_timestamps` 구간을 주어 인코더/디코더의 한 배치로 처리한다. 파이프라인이
+    짧은 구간을 30초 창 하나로 합치지 않도록 각 구간을 창 길이의 절반 넘게 무음으로
+    채우며, Whisper 는 어차피 30초 창으로 패딩하므로 연산량은 같다. 30초보다 긴
+    발화는 파이프라인의 VAD 분할로 따로 전사한다.
+
+    오디오 적재와 디코딩은 별도 스레드 풀에서 돌아, `num_workers` 개 배치를 동시에
+    디코딩하는 동안 `prefetch` 개 스레드가 다음 배치의 오디오를 미리 적재한다. 결과는
+    데이터셋 순서대로 내보낸다. model 로 WhisperModelPool 을 넘기면 배치를 풀의
+    워커 프로세스들이 나눠 전사한다.
+    """
+
+    def __init__(
+        self,
+        model: str | WhisperModel | WhisperModelPool,
+        batch_size: int = 8,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        device: str = "cpu",
+        compute_type: str = "default",
+        prefetch: int = 2,
+        transcribe_kwargs: dict[str, Any] | None = None,
+        progress: Callable[[TranscriptionStats], None] | None = None,
+    ):
+        """
+        Args:
+            model (str | WhisperModel | WhisperModelPool): 모델 이름/경로 또는 이미 만든
+                WhisperModel/WhisperModelPool. 이미 만든 모델을 넘기면 `cpu_threads`,
+                `device`, `compute_type` 은 무시되고, 풀이면 `num_workers` 는 풀의 프로세스
+                수가 된다.
+            batch_size (int, optional): 한 번에 디코딩할 발화(창) 수. Defaults to 8.
+            cpu_threads (int, optional): CTranslate2 연산 스레드 수. 0 이면 자동. Defaults to 0.
+            num_workers (int, optional): 동시에 디코딩할 배치 수. Defaults to 1.
+            device (str, optional): "cpu", "cuda", "auto". Defaults to "cpu".
+            compute_type (str, optional): CTranslate2 양자화 형식. Defaults to "default".
+            prefetch (int, optional): 디코딩보다 앞서 오디오를 적재할 배치 수(적재 스레드 수).
+                0 이면 한 스레드가 디코딩 차례가 된 배치만 적재한다. Defaults to 2.
+            transcribe_kwargs (dict[str, Any] | None, optional): BatchedInferencePipeline.transcribe
+                에 넘길 인자 (language, beam_size 등). 언어가 섞인 데이터셋은 language 를 지정.
+            progress (Callable[[TranscriptionStats], None] | None, optional): 배치가 끝날
+                때마다 누적 통계로 호출되는 함수
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        if num_workers <= 0:
+            raise ValueError("num_workers must be a positive integer")
+        if prefetch < 0:
+            raise ValueError("prefetch must be non-negative")
+        self._pool = model if isinstance(model, WhisperModelPool) else None
+        if self._pool is not None:
+            model, num_workers = None, self._pool.num_processes
+        elif isinstance(model, str):
+            model = WhisperModel(
+                model,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+            )
+        self._model = model
+        self._pipeline = BatchedInferencePipeline(model) if model is not None else None
+        self._batch_size = batch_size
+        self._num_workers = num_workers
+        self._prefetch = prefetch
+        self._transcribe_kwargs = dict(transcribe_kwargs or {})
+        self._progress = progress
+        self._stats = TranscriptionStats(0, 0.0, 0.0)
+
+    @property
+    def model(self) -> WhisperModel | None:
+        """로컬 모델. 풀을 쓰면 None."""
+        return self._model
+
+    @property
+    def stats(self) -> TranscriptionStats:
+        """마지막 `iter`/`run` 의 누적 통계"""
+        return self._stats
+
+    def __call__(self, audio: np.ndarray) -> str:
+        """16kHz 오디오 하나를 전사. EvaluationPipeline 의 transcriber 로 쓸 수 있다."""
+        if self._pool is not None:
+            return self._pool(audio)
+        segments, _ = self._pipeline.transcribe(
+            _as_whisper_audio(audio),
+            batch_size=self._batch_size,
+            **self._transcribe_kwargs,
+        )
+        return segments_to_text(segments)
+
+    def run(self, dataset: Dataset) -> list[TRNFormat]:
+        return list(self.iter(dataset))
+
+    def iter(self, dataset: Dataset) -> Generator[TRNFormat, Any, None]:
+        """데이터셋 순서대로 전사 결과(TRNFormat)를 내보내는 제너레이터"""
+        batches = [
+            range(start, min(start + self._batch_size, len(dataset)))
+            for start in range(0, len(dataset), self._batch_size)
+        ]
+        window = self._num_workers + self._prefetch
+        start = time.perf_counter()
+        self._stats = TranscriptionStats(0, 0.0, 0.0)
+
+        # (적재, 전사) Future 쌍. 전사 작업은 자기 배치의 적재 결과를 기다림
+        pending: deque[tuple[Future, Future]] = deque()
+        with (
+            ThreadPoolExecutor(
+                max_workers=max(self._prefetch, 1), thread_name_prefix="batched-load"
+            ) as loader,
+            ThreadPoolExecutor(
+                max_workers=self._num_workers, thread_name_prefix="batched-transcribe"
+            ) as executor,
+        ):
+            try:
+                for batch in batches:
+                    loaded = loader.submit(self._load, dataset, batch)
+                    pending.append((loaded, executor.submit(self._transcribe, loaded)))
+                    if len(pending) >= window:
+                        yield from self._collect(pending.popleft()[1], start)
+                while pending:
+                    yield from self._collect(pending.popleft()[1], start)
+            finally:
+                for loaded, future in pending:
+                    future.cancel()
+                    loaded.cancel()
+
+    def _collect(self, future: Future, start: float) -> list[TRNFormat]:
+        results, seconds = future.result()
+        self._stats = TranscriptionStats(
+            self._stats.num_samples + len(results),
+            self._stats.audio_seconds + seconds,
+            time.perf_counter() - start,
+        )
+        self._progress is not None and self._progress(self._stats)
+        return results
+
+    def _load(
+        self, dataset: Dataset, indices: Sequence[int]
+    ) -> tuple[list[str], list[np.ndarray]]:
+        samples = dataset.get_batch(indices)
+        audios = [
+            _as_whisper_audio(resample(sample.audio, dataset.sr, WHISPER_SR))
+            for sample in samples
+        ]
+        return [sample.id for sample in samples], audios
+
+    def _transcribe(self, loaded: Future) -> tuple[list[TRNFormat], float]:
+        ids, audios = loaded.result()
+        texts = self.transcribe_batch(audios)
+        results = [TRNFormat(id=id, text=text) for id, text in zip(ids, texts)]
+        return results, sum(len(audio) for audio in audios) / WHISPER_SR
+
+    def transcribe_batch(self, audios: Sequence[np.ndarray]) -> list[str]:
+        """16kHz 오디오 여러 개를 전사해 같은 순서의 문자열 리스트를 반환"""
+        if self._pool is not None:
+            return self._pool.transcribe_batch(audios)
+        texts = [""] * len(audios)
+        short = []
+        for k, audio in enumerate(audios):
+            if len(audio) <= MAX_CHUNK_SAMPLES:
+                short.append(k)
+            else:
+                texts[k] = self(audio)
+        if not short:
+            return texts
+
+        audio, offsets = _pack([audios[k] for k in short])
+        bounds = offsets / WHISPER_SR
+        segments, _ = self._pipeline.transcribe(
+            audio,
+            clip_timestamps=[
+                {"start": float(bounds[i]), "end": float(bounds[i + 1])}
+                for i in range(len(short))
+            ],
+            batch_size=self._batch_size,
+            **self._transcribe_kwargs,
+        )
+
+        # 생성기를 한 번만 돌며 구간 중앙으로 발화를 찾아 나눔
+        grouped: list[list] = [[] for _ in short]
+        for segment in segments:
+            middle = (segment.start + segment.end) / 2
+            i = int(np.searchsorted(bounds, middle, side="right")) - 1
+            grouped[min(max(i, 0), len(short) - 1)].append(segment)
+        for k, group in zip(short, grouped):
+            texts[k] = segments_to_text(group)
+        return texts
+
+
+def _as_whisper_audio(audio: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(audio, dtype=np.float32).reshape(-1)
+
+
+def _pack(audios: Sequence[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    # 이웃한 두 구간의 합이 창 길이를 넘어야 collect_chunks 가 합치지 않음.
+    # 초 단위 clip_timestamps 의 반올림 오차를 감안해 10ms 여유를 둠
+    lengths = np.maximum(
+        [len(audio) for audio in audios], MAX_CHUNK_SAMPLES // 2 + WHISPER_SR // 100
+    )
+    offsets = np.zeros(len(audios) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    packed = np.zeros(offsets[-1], dtype=np.float32)
+    for audio, offset in zip(audios, offsets):
+        packed[offset : offset + len(audio)] = audio
+    return packed, offsets
+
+
+__all__ = ["BatchedTranscriber", "TranscriptionStats", "WHISPER_SR"]
@@ -0,0 +1,200 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import threading
+import dataclasses
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generator
+from typing_extensions import Self
+from faster_whisper import WhisperModel
+from faster_whisper.transcribe import Segment
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+from sjaipy.asr.batched import CHUNK_LENGTH, WHISPER_SR
+from sjaipy.asr.whisper_utils import segments_to_sclite_trn, segments_to_text
+from sjaipy.audio.resampler import resample
+from sjaipy.evaluator.sclite_utils import TRNFormat
+
+if TYPE_CHECKING:
+    from sjaipy.datasets import Dataset, Sample
+
+# BatchedInferencePipeline 의 VAD 기본값과 같게 짧은 무음에서도 끊음
+DEFAULT_MIN_SILENCE_MS = 160
+
+
+def speech_chunks(
+    audio: np.ndarray,
+    vad_options: VadOptions | dict[str, Any] | None = None,
+    max_chunk_seconds: float = CHUNK_LENGTH,
+) -> list[tuple[int, int]]:
+    """16kHz 오디오의 발화 구간을 VAD 로 찾아 `max_chunk_seconds` 이하 묶음으로 합치는 함수
+
+    묶음은 원본 오디오의 연속 구간(사이 무음 포함)이라 묶음 시작 위치만 더하면
+    원래 시각이 된다. VAD 는 발화를 자른 뒤 앞뒤 여유(speech_pad_ms)를 붙이므로
+    그래도 `max_chunk_seconds` 보다 긴 구간은 그 길이 단위로 나눈다.
+
+    Returns:
+        list[tuple[int, int]]: 시간 순서의 (시작, 끝) 샘플 위치
+    """
+    if len(audio) == 0:
+        return []
+    if isinstance(vad_options, dict):
+        vad_options = VadOptions(**vad_options)
+    elif vad_options is None:
+        vad_options = VadOptions(min_silence_duration_ms=DEFAULT_MIN_SILENCE_MS)
+    # 한 발화 구간이 묶음보다 길어지지 않도록 VAD 단계에서 자름
+    vad_options = dataclasses.replace(
+        vad_options,
+        max_speech_duration_s=min(vad_options.max_speech_duration_s, max_chunk_seconds),
+    )
+    regions = get_speech_timestamps(audio, vad_options, sampling_rate=WHISPER_SR)
+
+    limit = int(max_chunk_seconds * WHISPER_SR)
+    chunks: list[tuple[int, int]] = []
+    for region in regions:
+        start, end = int(region["start"]), int(region["end"])
+        if chunks and end - chunks[-1][0] <= limit:
+            chunks[-1] = (chunks[-1][0], end)
+            continue
+        for piece in range(start, end, limit):
+            chunks.append((piece, min(piece + limit, end)))
+    return chunks
+
+
+class LongFormTranscriber:
+    """긴 녹음을 VAD 묶음으로 나눠 병렬로 전사하는 전사기
+
+    ESICv1 세션, AMI 회의처럼 긴 파일을 순차 디코딩하면 코어 몇 개만 쓰므로,
+    `speech_chunks` 로 30초 이하 묶음을 만들고 `num_workers` 개 스레드가 동시에
+    디코딩한다. 디코딩은 세그먼트 생성기를 소비할 때 일어나므로 생성기는 워커
+    안에서 끝까지 소비한다. 세그먼트 시각은 원본 기준으로 옮겨 시간 순서로 반환하며
+    `segments_to_text`, `segments_to_sclite_trn` 에 그대로 쓸 수 있다.
+
+    워커 스레드는 첫 전사 때 만들어지며 `close` 또는 with 문으로 정리한다.
+    """
+
+    def __init__(
+        self,
+        model: str | WhisperModel,
+        num_workers: int = 4,
+        cpu_threads: int = 0,
+        device: str = "cpu",
+        compute_type: str = "default",
+        max_chunk_seconds: float = CHUNK_LENGTH,
+        vad_options: VadOptions | dict[str, Any] | None = None,
+        transcribe_kwargs: dict[str, Any] | None = None,
+    ):
+        """
+        Args:
+            model (str | WhisperModel): 모델 이름/경로 또는 WhisperModel. WhisperModel 을
+                넘길 때는 `num_workers` 이상으로 만들어야 묶음이 실제로 동시에 디코딩된다.
+            num_workers (int, optional): 동시에 디코딩할 묶음 수. Defaults to 4.
+            cpu_threads (int, optional): 워커당 CTranslate2 연산 스레드 수. Defaults to 0.
+            device (str, optional): "cpu", "cuda", "auto". Defaults to "cpu".
+            compute_type (str, optional): CTranslate2 양자화 형식. Defaults to "default".
+            max_chunk_seconds (float, optional): 묶음 최대 길이(초). Defaults to 30.
+            vad_options (VadOptions | dict[str, Any] | None, optional): Silero VAD 설정
+            transcribe_kwargs (dict[str, Any] | None, optional): WhisperModel.transcribe 인자.
+                묶음마다 언어를 따로 찾지 않도록 language 를 지정하는 것이 좋다.
+        """
+        if num_workers <= 0:
+            raise ValueError("num_workers must be a positive integer")
+        if not 0 < max_chunk_seconds <= CHUNK_LENGTH:
+            raise ValueError(f"max_chunk_seconds must be in (0, {CHUNK_LENGTH}]")
+        if isinstance(model, str):
+            model = WhisperModel(
+                model,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+            )
+        self._model = model
+        self._max_chunk_seconds = max_chunk_seconds
+        self._vad_options = vad_options
+        self._transcribe_kwargs = {
+            "condition_on_previous_text": False,
+            **(transcribe_kwargs or {}),
+            # 묶음은 이미 발화 구간이므로 다시 VAD 를 돌리지 않음
+            "vad_filter": False,
+        }
+        self._num_workers = num_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self) -> WhisperModel:
+        return self._model
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __call__(self, audio: np.ndarray) -> str:
+        """16kHz 오디오를 전사한 문자열. EvaluationPipeline 의 transcriber 로 쓸 수 있다."""
+        return segments_to_text(self.segments(audio))
+
+    def segments(self, audio: np.ndarray) -> list[Segment]:
+        """16kHz 오디오를 묶음별로 병렬 전사해 원본 시각의 세그먼트를 시간 순서로 반환"""
+        audio = np.ascontiguousarray(audio, dtype=np.float32).reshape(-1)
+        chunks = speech_chunks(audio, self._vad_options, self._max_chunk_seconds)
+        # map 은 제출 순서대로 결과를 돌려주므로 묶음 순서가 곧 시간 순서
+        results = self._get_executor().map(
+            lambda chunk: self._transcribe_chunk(audio, *chunk), chunks
+        )
+        return [segment for segments in results for segment in segments]
+
+    def transcribe_sample(self, sample: Sample, sr: int) -> TRNFormat:
+        """`sr` 샘플링 레이트의 Sample 을 전사한 TRNFormat"""
+        audio = resample(sample.audio, sr, WHISPER_SR)
+        return segments_to_sclite_trn(sample.id, self.segments(audio))
+
+    def iter(self, dataset: Dataset) -> Generator[TRNFormat, Any, None]:
+        """데이터셋 순서대로 녹음마다 병렬 전사한 TRNFormat 을 내보내는 제너레이터"""
+        for sample in dataset.iter():
+            yield self.transcribe_sample(sample, dataset.sr)
+
+    def close(self) -> None:
+        """워커 스레드를 정리. 이후 전사하면 스레드를 다시 만든다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        executor is not None and executor.shutdown(wait=True)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._num_workers, thread_name_prefix="long-form"
+                )
+            return self._executor
+
+    def _transcribe_chunk(
+        self, audio: np.ndarray, start: int, end: int
+    ) -> list[Segment]:
+        segments, _ = self._model.transcribe(
+            audio[start:end], **self._transcribe_kwargs
+        )
+        offset = start / WHISPER_SR
+        return [_shift(segment, offset) for segment in segments]
+
+
+def _shift(segment: Segment, offset: float) -> Segment:
+    words = segment.words
+    if words is not None:
+        words = [
+            dataclasses.replace(word, start=word.start + offset, end=word.end + offset)
+            for word in words
+        ]
+    return dataclasses.replace(
+        segment,
+        start=segment.start + offset,
+        end=segment.end + offset,
+        words=words,
+    )
+
+
+__all__ = ["LongFormTranscriber", "speech_chunks"]
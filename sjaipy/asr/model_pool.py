@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import os
+import queue
+import pickle
+import itertools
+import threading
+import numpy as np
+import multiprocessing as mp
+
+from concurrent.futures import Future
+from typing import Any, Callable, Sequence
+from typing_extensions import Self
+
+from sjaipy.evaluator.sharded import available_cpus, cpu_sets
+
+# 워커 종료 요청
+_STOP = None
+_READY, _RESULT, _ERROR = "ready", "result", "error"
+_SINGLE, _BATCH = "single", "batch"
+# close 가 남은 요청을 마칠 때까지 워커를 기다리는 시간(초)
+CLOSE_TIMEOUT = 60
+
+
+class WhisperModelPool:
+    """faster-whisper 모델을 한 번씩 적재한 워커 프로세스 묶음
+
+    작업마다 모델을 적재하면 수 초와 수백 MB 가 들고, 한 프로세스 안의 여러
+    WhisperModel 은 연산 스레드를 두고 경쟁한다. 풀은 `num_processes` 개 프로세스를
+    겹치지 않는 코어 집합에 고정하고 코어 수만큼의 `cpu_threads` 로 모델을 한 번
+    적재한 뒤, 요청 큐에서 (id, 오디오) 를 받아 결과 큐로 (id, 전사) 를 돌려준다.
+
+    `__call__` 은 EvaluationPipeline 의 transcriber 로, 풀 자체는
+    BatchedTranscriber 의 model 로 쓸 수 있다. 오디오는 16kHz 이다.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        num_processes: int,
+        cpu_threads: int | None = None,
+        pin: bool = True,
+        cpus: Sequence[int] | None = None,
+        batch_size: int = 8,
+        device: str = "cpu",
+        compute_type: str = "default",
+        transcribe_kwargs: dict[str, Any] | None = None,
+        mp_context: str = "spawn",
+    ):
+        """
+        Args:
+            model (str): 모델 이름 또는 경로. 각 프로세스에서 적재된다.
+            num_processes (int): 워커 프로세스 수
+            cpu_threads (int | None, optional): 워커당 CTranslate2 스레드 수.
+                None 이면 워커에 배정된 코어 수. Defaults to None.
+            pin (bool, optional): 워커를 코어 집합에 고정할지 여부. Defaults to True.
+            cpus (Sequence[int] | None, optional): 나눠 쓸 코어. None 이면 사용 가능한 전체.
+            batch_size (int, optional): 워커의 BatchedInferencePipeline 배치 크기. Defaults to 8.
+            device (str, optional): "cpu", "cuda", "auto". Defaults to "cpu".
+            compute_type (str, optional): CTranslate2 양자화 형식. Defaults to "default".
+            transcribe_kwargs (dict[str, Any] | None, optional): 전사 인자 (language 등)
+            mp_context (str, optional): multiprocessing 시작 방식. Defaults to "spawn".
+
+        Raises:
+            ValueError: 프로세스 수가 0 이하이거나, 고정할 코어가 프로세스 수보다 적을 때
+        """
+        if num_processes <= 0:
+            raise ValueError("num_processes must be a positive integer")
+        cpus = available_cpus() if cpus is None else list(cpus)
+        sets = cpu_sets(num_processes, cpus) if pin else [None] * num_processes
+        if cpu_threads is not None:
+            threads = [cpu_threads] * num_processes
+        elif pin:
+            threads = [len(cpu_set) for cpu_set in sets]
+        else:
+            threads = [max(1, len(cpus) // num_processes)] * num_processes
+
+        context = mp.get_context(mp_context)
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._config = {
+            "model": model,
+            "batch_size": batch_size,
+            "device": device,
+            "compute_type": compute_type,
+            "transcribe_kwargs": dict(transcribe_kwargs or {}),
+        }
+        self._cpu_sets = sets
+        self._cpu_threads = threads
+        self._processes = [
+            context.Process(
+                target=_serve,
+                args=(
+                    k,
+                    sets[k],
+                    threads[k],
+                    self._load,
+                    self._config,
+                    self._requests,
+                    self._results,
+                ),
+                name=f"whisper-{k}",
+                daemon=True,
+            )
+            for k in range(num_processes)
+        ]
+        self._ids = itertools.count()
+        self._futures: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._stopped = threading.Event()
+        self._broken = threading.Event()
+        self._collector: threading.Thread | None = None
+        self._start()
+
+    @property
+    def num_processes(self) -> int:
+        return len(self._processes)
+
+    @property
+    def cpu_sets(self) -> list[list[int] | None]:
+        return self._cpu_sets
+
+    @property
+    def cpu_threads(self) -> list[int]:
+        return self._cpu_threads
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __call__(self, audio: np.ndarray) -> str:
+        return self.submit(audio).result()
+
+    def transcribe_batch(self, audios: Sequence[np.ndarray]) -> list[str]:
+        return self.submit_batch(audios).result()
+
+    def submit(self, audio: np.ndarray) -> Future:
+        """오디오 하나의 전사를 요청. Future 의 결과는 문자열이다."""
+        return self._submit(_SINGLE, np.asarray(audio, dtype=np.float32))
+
+    def submit_batch(self, audios: Sequence[np.ndarray]) -> Future:
+        """오디오 여러 개를 한 워커가 배치로 전사하도록 요청. 결과는 같은 순서의 리스트다."""
+        return self._submit(
+            _BATCH, [np.asarray(audio, dtype=np.float32) for audio in audios]
+        )
+
+    def close(self) -> None:
+        """남은 요청을 마저 처리한 뒤 워커를 종료. 돌아오지 못한 요청은 RuntimeError 로 실패한다."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        for process in self._processes:
+            process.is_alive() and self._requests.put(_STOP)
+        # 결과 큐를 비우지 않으면 워커가 종료되지 못하므로 수집 스레드는 계속 돎
+        for process in self._processes:
+            process.join(timeout=CLOSE_TIMEOUT)
+            process.is_alive() and process.terminate()
+        self._stopped.set()
+        if self._collector is not None:
+            self._collector.join()
+        self._fail_all(RuntimeError("WhisperModelPool is closed"))
+
+    @staticmethod
+    def _load(config: dict[str, Any], cpu_threads: int) -> Any:
+        # 워커 프로세스에서 전사기를 만듦. spawn 으로 넘어가므로 재정의한 클래스도
+        # import 가능한 위치에 있어야 함. batched 가 이 모듈을 참조하므로 여기서 불러옴
+        from sjaipy.asr.batched import BatchedTranscriber
+
+        return BatchedTranscriber(
+            config["model"],
+            batch_size=config["batch_size"],
+            cpu_threads=cpu_threads,
+            device=config["device"],
+            compute_type=config["compute_type"],
+            transcribe_kwargs=config["transcribe_kwargs"],
+        )
+
+    def _start(self) -> None:
+        for process in self._processes:
+            process.start()
+        # 모든 워커가 모델을 적재할 때까지 기다려 적재 오류를 바로 알림
+        ready = 0
+        while ready < len(self._processes):
+            try:
+                kind, _, value = self._results.get(timeout=1)
+            except queue.Empty:
+                if not all(process.is_alive() for process in self._processes):
+                    self.close()
+                    raise RuntimeError("A WhisperModelPool worker exited while loading")
+                continue
+            if kind == _ERROR:
+                self.close()
+                raise value
+            ready += 1
+        self._collector = threading.Thread(
+            target=self._collect, name="whisper-pool-collector", daemon=True
+        )
+        self._collector.start()
+
+    def _submit(self, kind: str, payload: Any) -> Future:
+        if self._closed.is_set():
+            raise RuntimeError("WhisperModelPool is closed")
+        if self._broken.is_set():
+            raise RuntimeError("A WhisperModelPool worker died")
+        future = Future()
+        with self._lock:
+            id = next(self._ids)
+            self._futures[id] = future
+        self._requests.put((id, kind, payload))
+        return future
+
+    def _collect(self) -> None:
+        while True:
+            try:
+                kind, id, value = self._results.get(timeout=0.5)
+            except queue.Empty:
+                if self._stopped.is_set():
+                    return
+                # 워커가 비정상 종료되면 그 요청은 영영 돌아오지 않음
+                if not self._closed.is_set() and not all(
+                    process.is_alive() for process in self._processes
+                ):
+                    self._broken.set()
+                    self._fail_all(RuntimeError("A WhisperModelPool worker died"))
+                continue
+            with self._lock:
+                future = self._futures.pop(id, None)
+            if future is None:
+                continue
+            if kind == _ERROR:
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+    def _fail_all(self, error: BaseException) -> None:
+        with self._lock:
+            futures, self._futures = self._futures, {}
+        for future in futures.values():
+            future.done() or future.set_exception(error)
+
+
+def _serve(
+    index: int,
+    cpus: list[int] | None,
+    cpu_threads: int,
+    load: Callable[[dict[str, Any], int], Any],
+    config: dict[str, Any],
+    requests: mp.Queue,
+    results: mp.Queue,
+) -> None:
+    # 모델을 만들기 전에 고정해야 CTranslate2 스레드도 같은 코어를 씀
+    if cpus is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    try:
+        transcriber = load(config, cpu_threads)
+    except BaseException as e:
+        results.put((_ERROR, index, _picklable(e)))
+        return
+    results.put((_READY, index, None))
+
+    while True:
+        request = requests.get()
+        if request is _STOP:
+            return
+        id, kind, payload = request
+        try:
+            if kind == _BATCH:
+                value = transcriber.transcribe_batch(payload)
+            else:
+                value = transcriber(payload)
+            results.put((_RESULT, id, value))
+        except Exception as e:
+            results.put((_ERROR, id, _picklable(e)))
+
+
+def _picklable(error: BaseException) -> BaseException:
+    # 큐는 별도 스레드에서 pickle 하므로 실패하면 결과가 조용히 사라짐
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+__all__ = ["WhisperModelPool"]
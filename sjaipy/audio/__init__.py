@@ -0,0 +1,6 @@
+# sjaipy/audio/__init__.py
+
+from sjaipy.audio.pcm import INT16_SCALE, from_int16, to_int16
+from sjaipy.audio.resampler import resample, resample_batch
+
+__all__ = ["INT16_SCALE", "from_int16", "to_int16", "resample", "resample_batch"]
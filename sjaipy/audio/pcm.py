@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import numpy as np
+
+# ffmpeg, soundfile 과 같은 16비트 PCM <-> float 변환 배율
+INT16_SCALE = 32_768
+
+
+def to_int16(audio: np.ndarray) -> np.ndarray:
+    """Quantize a [-1, 1] float waveform to 16-bit PCM.
+
+    Values are rounded and clipped to the int16 range, so `1.0` maps to
+    32767 rather than overflowing.
+    """
+    scaled = np.round(np.asarray(audio, dtype=np.float32) * INT16_SCALE)
+    return np.clip(scaled, -INT16_SCALE, INT16_SCALE - 1).astype(np.int16)
+
+
+def from_int16(audio: np.ndarray) -> np.ndarray:
+    """16-bit PCM as a float32 waveform in [-1, 1)."""
+    return np.asarray(audio).astype(np.float32) / INT16_SCALE
+
+
+__all__ = ["INT16_SCALE", "to_int16", "from_int16"]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import math
+import numpy as np
+
+from typing import Sequence
+from functools import lru_cache
+from scipy.signal import firwin, upfirdn
+
+if TYPE_CHECKING:
+    pass
+
+# scipy.signal.resample_poly 와 동일한 필터 설계
+FILTER_WINDOW = ("kaiser", 5.0)
+FILTER_HALF_WIDTH = 10
+
+
+def resample(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """Polyphase resampling along the last axis.
+
+    Equivalent to `scipy.signal.resample_poly`, but the FIR kernel of every
+    (orig_sr, target_sr) pair is designed once and cached.
+
+    Args:
+        audio (np.ndarray): Waveform, time on the last axis.
+        orig_sr (int): Sample rate of `audio`.
+        target_sr (int): Sample rate to convert to.
+
+    Returns:
+        np.ndarray: Resampled waveform. `audio` itself if the rates match.
+    """
+    if orig_sr == target_sr:
+        return audio
+    up, down = _ratio(orig_sr, target_sr)
+    audio = _as_float(audio)
+    h, n_pre_remove = _polyphase_filter(up, down, audio.dtype.str)
+
+    n_out = _output_length(audio.shape[-1], up, down)
+    out = upfirdn(h, audio, up, down, axis=-1)
+    out = out[..., n_pre_remove : n_pre_remove + n_out]
+    if out.shape[-1] < n_out:
+        pad = [(0, 0)] * (out.ndim - 1) + [(0, n_out - out.shape[-1])]
+        out = np.pad(out, pad)
+    return out
+
+
+def resample_batch(
+    audios: Sequence[np.ndarray], orig_sr: int | Sequence[int], target_sr: int
+) -> list[np.ndarray]:
+    """Resample many 1-D clips at once.
+
+    Clips sharing a source rate are zero-padded into one matrix and filtered
+    in a single call, then trimmed back to their own output length. Zero
+    padding does not change the trimmed result because `resample` already
+    treats samples past the end as zeros.
+
+    Args:
+        audios (Sequence[np.ndarray]): 1-D waveforms.
+        orig_sr (int | Sequence[int]): Source rate, shared or per clip.
+        target_sr (int): Sample rate to convert to.
+
+    Returns:
+        list[np.ndarray]: Resampled waveforms in input order.
+    """
+    if isinstance(orig_sr, int):
+        orig_sr = [orig_sr] * len(audios)
+    if len(orig_sr) != len(audios):
+        raise ValueError("audios and orig_sr must have the same length")
+
+    groups: dict[tuple[int, str], list[int]] = {}
+    for i, (audio, sr) in enumerate(zip(audios, orig_sr)):
+        if audio.ndim != 1:
+            raise ValueError("resample_batch expects 1-D waveforms")
+        groups.setdefault((sr, _as_float(audio).dtype.str), []).append(i)
+
+    result: list[np.ndarray] = [None] * len(audios)
+    for (sr, dtype), indices in groups.items():
+        if sr == target_sr:
+            for i in indices:
+                result[i] = audios[i]
+            continue
+
+        lengths = [len(audios[i]) for i in indices]
+        matrix = np.zeros((len(indices), max(lengths)), dtype=np.dtype(dtype))
+        for row, (i, n) in enumerate(zip(indices, lengths)):
+            matrix[row, :n] = audios[i]
+
+        up, down = _ratio(sr, target_sr)
+        out = resample(matrix, sr, target_sr)
+        for row, (i, n) in enumerate(zip(indices, lengths)):
+            result[i] = out[row, : _output_length(n, up, down)]
+    return result
+
+
+@lru_cache(maxsize=32)
+def _polyphase_filter(up: int, down: int, dtype: str) -> tuple[np.ndarray, int]:
+    max_rate = max(up, down)
+    half_len = FILTER_HALF_WIDTH * max_rate
+    h = firwin(2 * half_len + 1, 1.0 / max_rate, window=FILTER_WINDOW) * up
+
+    # 출력 샘플이 필터 중심에 오도록 앞쪽 패딩
+    n_pre_pad = down - half_len % down
+    n_pre_remove = (half_len + n_pre_pad) // down
+    h = np.concatenate([np.zeros(n_pre_pad), h]).astype(np.dtype(dtype))
+    h.setflags(write=False)
+    return h, n_pre_remove
+
+
+def _ratio(orig_sr: int, target_sr: int) -> tuple[int, int]:
+    if orig_sr <= 0 or target_sr <= 0:
+        raise ValueError("Sample rates must be positive integers")
+    g = math.gcd(int(orig_sr), int(target_sr))
+    return int(target_sr) // g, int(orig_sr) // g
+
+
+def _output_length(n_in: int, up: int, down: int) -> int:
+    return -(-n_in * up // down)
+
+
+def _as_float(audio: np.ndarray) -> np.ndarray:
+    if audio.dtype in (np.float32, np.float64):
+        return audio
+    return audio.astype(np.float32)
+
+
+__all__ = ["resample", "resample_batch"]
@@ -100,6 +100,10 @@ class ConcatDataset(Dataset):
             start += len(ds)
         raise IndexError("Index out of range")
 
+    @override
+    def durations(self, num_proc: int | None = None) -> list[float]:
+        return [d for ds in self._datasets for d in ds.durations(num_proc=num_proc)]
+
     @override
     def _sample(
         self,
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from abc import ABC, abstractmethod
-from typing import Generator, Any, overload, Sequence
+from typing import Callable, Generator, Any, overload, Sequence
 from typing_extensions import Self
 
 if TYPE_CHECKING:
@@ -64,6 +64,16 @@ class Dataset(ABC):
         for idx in range(len(self)):
             yield self.get(idx)
 
+    def iter_batch(self, batch_size: int) -> Generator[list[Sample], Any, None]:
+        if batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer")
+        for start in range(0, len(self), batch_size):
+            yield self.get_batch(range(start, min(start + batch_size, len(self))))
+
+    def iter_labels(self) -> Generator[tuple[str, dict[str, Any]], Any, None]:
+        for sample in self.iter():
+            yield sample.id, sample.Y
+
     @overload
     def getitem(self, key: int) -> Sample: ...
     @overload
@@ -128,6 +138,56 @@ class Dataset(ABC):
     def samples_to_list(self) -> list[Sample]:
         return list(self.iter())
 
+    def get_batch(self, indices: Sequence[int]) -> list[Sample]:
+        return [self.get(idx) for idx in indices]
+
+    def durations(self, num_proc: int | None = None) -> list[float]:
+        """Audio length of every sample in seconds.
+
+        The default decodes every sample, backends override it with their
+        metadata. `num_proc` is the worker count for backends that read
+        files to get durations; the others ignore it.
+        """
+        return [len(sample.audio) / self._sr for sample in self.iter()]
+
+    def filter(
+        self,
+        function: Callable[[str, dict[str, Any]], bool] | None = None,
+        *,
+        min_duration: float | None = None,
+        max_duration: float | None = None,
+        num_proc: int | None = None,
+    ) -> Self:
+        """Keep samples matching `function(id, Y)` and the duration bounds.
+
+        Labels come from `iter_labels` and durations from `durations`, so
+        audio is only decoded where a backend has no duration metadata.
+
+        Args:
+            function (Callable[[str, dict[str, Any]], bool] | None): Label
+                predicate, e.g. `lambda _, Y: bool(Y["asr"])`.
+            min_duration (float | None): Inclusive lower bound in seconds.
+            max_duration (float | None): Inclusive upper bound in seconds.
+            num_proc (int | None): Workers passed to `durations`.
+
+        Returns:
+            Self: Selection of the kept samples.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if min_duration is not None or max_duration is not None:
+            mask &= self._duration_mask(
+                np.asarray(self.durations(num_proc=num_proc), dtype=np.float64),
+                min_duration,
+                max_duration,
+            )
+        if function is not None:
+            mask &= np.fromiter(
+                (function(_id, Y) for _id, Y in self.iter_labels()),
+                dtype=bool,
+                count=len(self),
+            )
+        return self.select(np.flatnonzero(mask).tolist())
+
     @abstractmethod
     def select(self, indices: Sequence[int]) -> Self: ...
 
@@ -152,5 +212,16 @@ class Dataset(ABC):
     def from_dict(data: dict) -> Self:
         raise NotImplementedError
 
+    @staticmethod
+    def _duration_mask(
+        durations: np.ndarray, min_duration: float | None, max_duration: float | None
+    ) -> np.ndarray:
+        mask = np.ones(len(durations), dtype=bool)
+        if min_duration is not None:
+            mask &= durations >= min_duration
+        if max_duration is not None:
+            mask &= durations <= max_duration
+        return mask
+
 
 __all__ = ["Dataset"]
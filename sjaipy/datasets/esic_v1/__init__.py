@@ -2,5 +2,7 @@
 
 from sjaipy.datasets.esic_v1.esic_v1 import ESICv1
 from sjaipy.datasets.esic_v1.esic_v1_dataset import ESICv1Dataset
+from sjaipy.datasets.esic_v1.esic_v1_segment_dataset import ESICv1SegmentDataset
+from sjaipy.datasets.esic_v1.segment import Segment
 
-__all__ = ["ESICv1", "ESICv1Dataset"]
+__all__ = ["ESICv1", "ESICv1Dataset", "ESICv1SegmentDataset", "Segment"]
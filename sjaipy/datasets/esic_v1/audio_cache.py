@@ -0,0 +1,159 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import os
+import ffmpeg
+import hashlib
+import argparse
+import numpy as np
+
+from pathlib import Path
+from typing import Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+from sjaipy.audio import from_int16
+from sjaipy.datasets.esic_v1.file_type import MP4
+from sjaipy.datasets.esic_v1.directory_index import DirectoryIndex
+
+if TYPE_CHECKING:
+    pass
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("SJAIPY_CACHE", Path.home() / ".cache" / "sjaipy"))
+    / "esic_v1"
+    / "audio"
+)
+DEFAULT_SAMPLE_RATE = 16_000
+DEFAULT_NUM_WORKERS = 4
+CACHE_DTYPES = ("float32", "int16")
+
+# ffmpeg 원시 출력 포맷
+_FFMPEG_FORMATS = {"float32": "f32le", "int16": "s16le"}
+
+
+class AudioCache:
+    """Decoded mono audio of mp4 files, stored once as `.npy`.
+
+    Entries are keyed by the absolute source path, its mtime and size and
+    the sample rate, so an edited or replaced source is decoded again.
+    Only the first audio stream is demuxed, the video stream is skipped.
+    Loads memory-map the file; int16 entries are scaled to float32.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, dtype: str = "float32"):
+        if dtype not in CACHE_DTYPES:
+            raise ValueError(f"dtype must be one of {CACHE_DTYPES}")
+        self._cache_dir = Path(cache_dir)
+        self._dtype = dtype
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def path(self, source: Path, sr: int) -> Path:
+        source = Path(source).absolute()
+        stat = source.stat()
+        key = f"{source}|{stat.st_mtime_ns}|{stat.st_size}|{sr}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self._cache_dir / digest[:2] / f"{digest}.npy"
+
+    def load(self, source: Path, sr: int = DEFAULT_SAMPLE_RATE) -> np.ndarray:
+        audio = np.load(self.build(source, sr), mmap_mode="r")
+        if audio.dtype == np.int16:
+            return from_int16(audio)
+        return audio
+
+    def build(self, source: Path, sr: int = DEFAULT_SAMPLE_RATE) -> Path:
+        """Decode `source` into the cache unless it is already there."""
+        path = self.path(source, sr)
+        if not path.exists():
+            self._build(source, sr, path)
+        return path
+
+    def prebuild(
+        self,
+        sources: Iterable[Path],
+        sr: int = DEFAULT_SAMPLE_RATE,
+        num_workers: int = DEFAULT_NUM_WORKERS,
+    ) -> list[Path]:
+        """Fill the cache for every source in `num_workers` processes."""
+        sources = list(sources)
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            return list(executor.map(self.build, sources, [sr] * len(sources)))
+
+    def load_segment(
+        self, source: Path, start: float, end: float, sr: int = DEFAULT_SAMPLE_RATE
+    ) -> np.ndarray:
+        """`load(source, sr)[start:end]`, reading only the pages of the range."""
+        audio = np.load(self.build(source, sr), mmap_mode="r")
+        audio = audio[int(start * sr) : int(end * sr)]
+        if audio.dtype == np.int16:
+            return from_int16(audio)
+        return np.array(audio)
+
+    def _build(self, source: Path, sr: int, path: Path) -> None:
+        audio = decode_audio(source, sr, dtype=self._dtype)
+
+        # 다른 프로세스와 겹쳐도 완성된 파일만 보이도록 교체
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(f".{os.getpid()}.tmp.npy")
+        np.save(temp, audio)
+        os.replace(temp, path)
+
+
+def decode_audio(
+    source: Path,
+    sr: int = DEFAULT_SAMPLE_RATE,
+    start: float | None = None,
+    duration: float | None = None,
+    dtype: str = "float32",
+) -> np.ndarray:
+    """Decode the first audio stream of `source` to mono at `sr`.
+
+    `start` and `duration` are passed as input options, so ffmpeg seeks in
+    the container and decodes only the requested range.
+    """
+    input_kwargs = {}
+    if start is not None:
+        input_kwargs["ss"] = start
+    if duration is not None:
+        input_kwargs["t"] = duration
+    out, _ = (
+        ffmpeg.input(str(source), **input_kwargs)
+        .output(
+            "pipe:",
+            map="0:a:0",
+            format=_FFMPEG_FORMATS[dtype],
+            ac=1,
+            ar=sr,
+            vn=None,
+            sn=None,
+            dn=None,
+        )
+        .run(capture_stdout=True, capture_stderr=True)
+    )
+    return np.frombuffer(out, dtype=np.dtype(dtype))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Decode the audio of every ESICv1 mp4 into the audio cache."
+    )
+    parser.add_argument("root", type=Path, help="ESICv1 root directory")
+    parser.add_argument("--sr", type=int, default=DEFAULT_SAMPLE_RATE)
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--dtype", choices=CACHE_DTYPES, default="float32")
+    parser.add_argument("--num-workers", type=int, default=DEFAULT_NUM_WORKERS)
+    args = parser.parse_args(argv)
+
+    index = DirectoryIndex(args.root)
+    sources = [index.file(d, MP4) for d in index.data_dirs()]
+    cache = AudioCache(args.cache_dir, dtype=args.dtype)
+    cache.prebuild(sources, sr=args.sr, num_workers=args.num_workers)
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ["AudioCache", "decode_audio"]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import os
+import json
+import hashlib
+
+from pathlib import Path
+from collections.abc import Container
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from sjaipy.datasets.esic_v1.file_type import FILE_TYPE, MP4
+
+if TYPE_CHECKING:
+    pass
+
+DEFAULT_INDEX_DIR = (
+    Path(os.environ.get("SJAIPY_CACHE", Path.home() / ".cache" / "sjaipy")) / "esic_v1"
+)
+DEFAULT_NUM_WORKERS = 16
+INDEX_VERSION = 1
+
+# 파일 이름 -> file type
+_FILE_NAMES = {value["file"]: key for key, value in FILE_TYPE.items()}
+
+
+class DirectoryIndex:
+    """Persistent index of the `FILE_TYPE` files below an ESICv1 root.
+
+    The tree is listed once with `os.scandir` in `num_workers` threads and
+    stored as JSON under `index_dir`, together with the mtime of every
+    directory. A directory's mtime changes whenever an entry is added,
+    removed or renamed in it, so reopening the index only stats the indexed
+    directories (in parallel) and rescans when one of them changed.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        index_dir: Path = DEFAULT_INDEX_DIR,
+        num_workers: int = DEFAULT_NUM_WORKERS,
+        validate: bool = True,
+    ):
+        self._root = Path(root).absolute()
+        self._num_workers = num_workers
+        digest = hashlib.sha1(str(self._root).encode("utf-8")).hexdigest()[:16]
+        self._path = Path(index_dir) / f"{digest}.json"
+        self._dirs = self._load(validate)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def data_dirs(
+        self, source: Path | None = None, excludes: Container[str] | None = None
+    ) -> list[Path]:
+        """Directories below `source` (exclusive) holding the original mp4."""
+        source = self._root if source is None else Path(source).absolute()
+        if not source.exists():
+            raise FileNotFoundError(f"Source path {source} does not exist.")
+        if not source.is_dir():
+            raise ValueError(
+                f"Expected a directory for source, but got a file: {source}"
+            )
+        excludes = excludes or set()
+
+        data_dirs = []
+        for rel, entry in self._dirs.items():
+            dirpath = self._root / rel
+            if dirpath == source or source not in dirpath.parents:
+                continue
+            if str(dirpath) in excludes:
+                continue
+            if MP4 in entry["files"]:
+                data_dirs.append(dirpath)
+        return sorted(data_dirs)
+
+    def file(self, dir: Path, file_type: str) -> Path:
+        """Path of `file_type` in `dir`, answered from the index."""
+        if file_type not in FILE_TYPE:
+            raise ValueError(
+                f"Invalid file type: {file_type}. Valid types are: {', '.join(FILE_TYPE.keys())}"
+            )
+
+        file_path = Path(dir).absolute() / FILE_TYPE[file_type]["file"]
+        entry = self._dirs.get(self._relative(file_path.parent))
+        if entry is None or file_type not in entry["files"]:
+            raise FileNotFoundError(
+                f"File not found: {file_path}. Expected file for type '{file_type}'."
+            )
+        return file_path
+
+    def refresh(self) -> None:
+        """Rescan the tree and rewrite the index file."""
+        self._dirs = self._scan()
+        self._save()
+
+    def _load(self, validate: bool) -> dict[str, dict]:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = None
+
+        if (
+            data is not None
+            and data.get("version") == INDEX_VERSION
+            and data.get("root") == str(self._root)
+            and (not validate or self._is_fresh(data["dirs"]))
+        ):
+            return data["dirs"]
+
+        dirs = self._scan()
+        self._dirs = dirs
+        self._save()
+        return dirs
+
+    def _save(self) -> None:
+        data = {"version": INDEX_VERSION, "root": str(self._root), "dirs": self._dirs}
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self._path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(temp, self._path)
+
+    def _is_fresh(self, dirs: dict[str, dict]) -> bool:
+        def mtime(rel: str) -> int | None:
+            try:
+                return os.stat(self._root / rel).st_mtime_ns
+            except FileNotFoundError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=self._num_workers) as executor:
+            mtimes = executor.map(mtime, dirs)
+            return all(m == entry["mtime"] for m, entry in zip(mtimes, dirs.values()))
+
+    def _scan(self) -> dict[str, dict]:
+        if not self._root.is_dir():
+            raise FileNotFoundError(f"Source path {self._root} does not exist.")
+
+        dirs: dict[str, dict] = {}
+        with ThreadPoolExecutor(max_workers=self._num_workers) as executor:
+            pending = {executor.submit(self._scan_dir, self._root)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, entry, subdirs = future.result()
+                    dirs[self._relative(path)] = entry
+                    pending |= {executor.submit(self._scan_dir, d) for d in subdirs}
+        return dict(sorted(dirs.items()))
+
+    @staticmethod
+    def _scan_dir(path: Path) -> tuple[Path, dict, list[Path]]:
+        # 디렉터리 하나를 한 번만 나열, 파일 종류는 이름으로 판별
+        # 나열 중 변경을 놓치지 않도록 mtime 은 먼저 읽음
+        mtime = os.stat(path).st_mtime_ns
+        files, subdirs = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(Path(entry.path))
+                elif entry.name in _FILE_NAMES:
+                    files.append(_FILE_NAMES[entry.name])
+        entry = {"mtime": mtime, "files": sorted(files)}
+        return path, entry, subdirs
+
+    def _relative(self, path: Path) -> str:
+        return os.path.relpath(path, self._root)
+
+
+__all__ = ["DirectoryIndex"]
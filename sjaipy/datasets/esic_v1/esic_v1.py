@@ -2,11 +2,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from pathlib import Path
-from functools import lru_cache
+from functools import lru_cache, cached_property
 
 from sjaipy.datasets.esic_v1.service import search_dirs, select_file_from_dir
-from sjaipy.datasets.esic_v1.file_type import VERBATIM, MP4
+from sjaipy.datasets.esic_v1.directory_index import (
+    DirectoryIndex,
+    DEFAULT_INDEX_DIR,
+)
+from sjaipy.datasets.esic_v1.file_type import VERBATIM, MP4, ORTO_TS
+from sjaipy.datasets.esic_v1.segment import parse_segments
 from sjaipy.datasets.esic_v1.esic_v1_dataset import ESICv1Dataset
+from sjaipy.datasets.esic_v1.esic_v1_segment_dataset import ESICv1SegmentDataset
 
 if TYPE_CHECKING:
     pass
@@ -15,29 +21,46 @@ DEFAULT_DEV = "v1.1/dev"
 DEFAULT_DEV2 = "v1.1/dev2"
 DEFAULT_TEST = "v1.1/test"
 DEFAULT_SAMPLE_RATE = 16_000
+DEFAULT_NUM_WORKERS = 8
+SPLITS = {"dev": DEFAULT_DEV, "dev2": DEFAULT_DEV2, "test": DEFAULT_TEST}
 
 
 class ESICv1:
-    def __init__(self, root: Path):
+    def __init__(
+        self,
+        root: Path,
+        index_dir: Path = DEFAULT_INDEX_DIR,
+        audio_cache_dir: Path | None = None,
+        num_workers: int | None = DEFAULT_NUM_WORKERS,
+    ):
         self.__root = root
+        self.__index_dir = index_dir
+        self.__audio_cache_dir = audio_cache_dir
+        self.__num_workers = num_workers
+
+    @cached_property
+    def index(self) -> DirectoryIndex:
+        # None 이나 1 이하면 다른 병렬 작업처럼 순차(스레드 하나)로 색인
+        return DirectoryIndex(
+            self.__root,
+            index_dir=self.__index_dir,
+            num_workers=max(self.__num_workers or 1, 1),
+        )
 
-    @lru_cache(maxsize=1)
     def dev_dirs(
         self, post_path: Path | str = DEFAULT_DEV, excludes: tuple[str] = ()
     ) -> list[Path]:
-        return search_dirs(self.__root / post_path, excludes=excludes)
+        return search_dirs(self.__root / post_path, excludes, self.index)
 
-    @lru_cache(maxsize=1)
     def dev2_dirs(
         self, post_path: Path | str = DEFAULT_DEV2, excludes: tuple[str] = ()
     ) -> list[Path]:
-        return search_dirs(self.__root / post_path, excludes=excludes)
+        return search_dirs(self.__root / post_path, excludes, self.index)
 
-    @lru_cache(maxsize=1)
     def test_dirs(
         self, post_path: Path | str = DEFAULT_TEST, excludes: tuple[str] = ()
     ) -> list[Path]:
-        return search_dirs(self.__root / post_path, excludes=excludes)
+        return search_dirs(self.__root / post_path, excludes, self.index)
 
     def all_dirs(self, excludes: tuple[str] = ()) -> list[Path]:
         return (
@@ -56,11 +79,17 @@ class ESICv1:
         X = []
         Y = []
         for d in dirs:
-            x = select_file_from_dir(d, source_file_type)
-            y = select_file_from_dir(d, truth_file_type)
+            x = select_file_from_dir(d, source_file_type, self.index)
+            y = select_file_from_dir(d, truth_file_type, self.index)
             X.append(x)
             Y.append(y)
-        return ESICv1Dataset(X, Y, sr=sample_rate)
+        return ESICv1Dataset(
+            X,
+            Y,
+            sr=sample_rate,
+            cache_dir=self.__audio_cache_dir,
+            num_workers=self.__num_workers,
+        )
 
     @lru_cache(maxsize=1)
     def dev(
@@ -110,5 +139,33 @@ class ESICv1:
             sample_rate,
         )
 
+    def segments(
+        self,
+        split: str = "test",
+        post_path: Path | str | None = None,
+        source_file_type: str = MP4,
+        segment_file_type: str = ORTO_TS,
+        excludes: tuple[str] = (),
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+    ) -> ESICv1SegmentDataset:
+        """Segment-level dataset of `split` from `vert+ts` or `o+ts` files."""
+        if split not in SPLITS:
+            raise ValueError(
+                f"Invalid split: {split}. Valid splits are: {', '.join(SPLITS)}"
+            )
+        post_path = SPLITS[split] if post_path is None else post_path
+
+        X = []
+        segments = []
+        for d in search_dirs(self.__root / post_path, excludes, self.index):
+            x = select_file_from_dir(d, source_file_type, self.index)
+            path = select_file_from_dir(d, segment_file_type, self.index)
+            for segment in parse_segments(path, segment_file_type):
+                X.append(x)
+                segments.append(segment)
+        return ESICv1SegmentDataset(
+            X, segments, sr=sample_rate, cache_dir=self.__audio_cache_dir
+        )
+
 
 __all__ = ["ESICv1"]
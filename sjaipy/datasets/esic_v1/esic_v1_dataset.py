@@ -1,25 +1,45 @@
+import ffmpeg
 import warnings
 import numpy as np
 
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing_extensions import override, Self
-from typing import Sequence
+from typing import Any, Generator, Sequence
 
 from sjpy.audio import load_from_mp4_file
 from sjpy.string import normalize_text_only_en
 from sjpy.file.json import JsonSaver, load_json
 from sjaipy.datasets.dataset import Dataset, Sample
+from sjaipy.datasets.esic_v1.audio_cache import AudioCache
 
 DEFAULT_SAMPLE_RATE = 16_000
 
 
 class ESICv1Dataset(Dataset):
-    def __init__(self, X: list[Path], Y: list[Path], sr: int = DEFAULT_SAMPLE_RATE):
+    def __init__(
+        self,
+        X: list[Path],
+        Y: list[Path],
+        sr: int = DEFAULT_SAMPLE_RATE,
+        cache_dir: Path | None = None,
+        ids: list[str] | None = None,
+        texts: list[str] | None = None,
+        num_workers: int | None = None,
+    ):
         if len(X) != len(Y):
             raise ValueError("X and Y must have the same length")
         super().__init__(sr, task=("asr",))
         self._X = X
         self._Y = Y
+        # 라벨은 생성 시 한 번만 읽고 이후에는 리스트에서 조회
+        self._ids = ids if ids is not None else [self._normalize_id(x) for x in X]
+        self._texts = texts if texts is not None else self._read_texts(Y, num_workers)
+        if not len(self._ids) == len(self._texts) == len(X):
+            raise ValueError("ids and texts must have the same length as X")
+        # cache_dir 가 있으면 mp4 를 한 번만 디코딩
+        self._cache_dir = cache_dir
+        self._audio_cache = AudioCache(cache_dir) if cache_dir is not None else None
 
     @Dataset.args.getter
     @override
@@ -28,6 +48,9 @@ class ESICv1Dataset(Dataset):
             **super().args,
             "X": self._X,
             "Y": self._Y,
+            "cache_dir": self._cache_dir,
+            "ids": self._ids,
+            "texts": self._texts,
         }
 
     @Dataset.length.getter
@@ -41,12 +64,20 @@ class ESICv1Dataset(Dataset):
             **super().to_dict(),
             "X": [str(x) for x in self._X],
             "Y": [str(y) for y in self._Y],
+            "cache_dir": str(self._cache_dir) if self._cache_dir is not None else None,
+            "ids": self._ids,
+            "texts": self._texts,
         }
 
     @override
     def select(self, indices: Sequence[int]) -> Self:
         return ESICv1Dataset(
-            [self._X[i] for i in indices], [self._Y[i] for i in indices], self._sr
+            [self._X[i] for i in indices],
+            [self._Y[i] for i in indices],
+            self._sr,
+            self._cache_dir,
+            ids=[self._ids[i] for i in indices],
+            texts=[self._texts[i] for i in indices],
         )
 
     @override
@@ -54,19 +85,39 @@ class ESICv1Dataset(Dataset):
         self, start: int | None = None, stop: int | None = None, step: int | None = None
     ) -> Self:
         return ESICv1Dataset(
-            self._X[start:stop:step], self._Y[start:stop:step], self._sr
+            self._X[start:stop:step],
+            self._Y[start:stop:step],
+            self._sr,
+            self._cache_dir,
+            ids=self._ids[start:stop:step],
+            texts=self._texts[start:stop:step],
         )
 
     @override
     def get(self, idx: int) -> Sample:
-        x, y = self._X[idx], self._Y[idx]
+        x = self._X[idx]
 
         def load_audio() -> np.ndarray:
+            if self._audio_cache is not None:
+                return self._audio_cache.load(x, self._sr)
             return load_from_mp4_file(x, self._sr)[0]
 
-        txt = y.read_text(encoding="utf-8")
-        _id = normalize_text_only_en(str(Path(*x.parts[-3:-1])))[-255:]
-        return Sample(id=_id, load_audio=load_audio, Y={"asr": txt})
+        return Sample(
+            id=self._ids[idx], load_audio=load_audio, Y={"asr": self._texts[idx]}
+        )
+
+    @override
+    def iter_labels(self) -> Generator[tuple[str, dict[str, Any]], Any, None]:
+        for _id, text in zip(self._ids, self._texts):
+            yield _id, {"asr": text}
+
+    @override
+    def durations(self, num_proc: int | None = None) -> list[float]:
+        """Container durations from `ffprobe` in `num_proc` threads, no decoding."""
+        if num_proc is None or num_proc <= 1:
+            return [self._probe_duration(x) for x in self._X]
+        with ThreadPoolExecutor(max_workers=num_proc) as executor:
+            return list(executor.map(self._probe_duration, self._X))
 
     def save(self, path: Path, description="ESICv1Dataset"):
         JsonSaver(description).save(self.to_dict(), path)
@@ -81,16 +132,40 @@ class ESICv1Dataset(Dataset):
         if rng is None or size == len(self._X) - start:
             return self.slice(start, start + size)
         else:
-            data = list(zip(self._X[start:], self._Y[start:]))
-            data = rng.choice(data, size=size, replace=False)
-            X, Y = zip(*data)
-            return ESICv1Dataset(X, Y, self._sr)
+            indices = rng.choice(
+                np.arange(start, len(self._X)), size=size, replace=False
+            )
+            return self.select(indices.tolist())
+
+    @staticmethod
+    def _normalize_id(x: Path) -> str:
+        return normalize_text_only_en(str(Path(*x.parts[-3:-1])))[-255:]
+
+    @staticmethod
+    def _read_texts(Y: list[Path], num_workers: int | None = None) -> list[str]:
+        def read(y: Path) -> str:
+            return y.read_text(encoding="utf-8")
+
+        if num_workers is None or num_workers <= 1:
+            return [read(y) for y in Y]
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            return list(executor.map(read, Y))
+
+    @staticmethod
+    def _probe_duration(path: Path) -> float:
+        return float(ffmpeg.probe(str(path))["format"]["duration"])
 
     @staticmethod
     @override
     def from_dict(data: dict) -> Self:
+        cache_dir = data.get("cache_dir")
         return ESICv1Dataset(
-            [Path(x) for x in data["X"]], [Path(y) for y in data["Y"]], sr=data["sr"]
+            [Path(x) for x in data["X"]],
+            [Path(y) for y in data["Y"]],
+            sr=data["sr"],
+            cache_dir=Path(cache_dir) if cache_dir is not None else None,
+            ids=data.get("ids"),
+            texts=data.get("texts"),
         )
 
     @staticmethod
@@ -0,0 +1,173 @@
+import numpy as np
+
+from pathlib import Path
+from typing_extensions import override, Self
+from typing import Any, Generator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from sjpy.string import normalize_text_only_en
+from sjpy.file.json import JsonSaver, load_json
+from sjaipy.datasets.dataset import Dataset, Sample
+from sjaipy.datasets.esic_v1.audio_cache import AudioCache, decode_audio
+from sjaipy.datasets.esic_v1.segment import Segment
+
+DEFAULT_SAMPLE_RATE = 16_000
+
+
+class ESICv1SegmentDataset(Dataset):
+    """One sample per transcript segment of an ESICv1 session.
+
+    `X[i]` is the session mp4 and `segments[i]` the time range and text of
+    sample `i`. Audio is decoded per segment, by seeking in the mp4 or by
+    slicing the memory-mapped `AudioCache` entry when `cache_dir` is set.
+    """
+
+    def __init__(
+        self,
+        X: list[Path],
+        segments: list[Segment],
+        sr: int = DEFAULT_SAMPLE_RATE,
+        cache_dir: Path | None = None,
+    ):
+        if len(X) != len(segments):
+            raise ValueError("X and segments must have the same length")
+        super().__init__(sr, task=("asr",))
+        self._X = X
+        self._segments = segments
+        self._cache_dir = cache_dir
+        self._audio_cache = AudioCache(cache_dir) if cache_dir is not None else None
+
+    @Dataset.args.getter
+    @override
+    def args(self) -> dict:
+        return {
+            **super().args,
+            "X": self._X,
+            "segments": self._segments,
+            "cache_dir": self._cache_dir,
+        }
+
+    @Dataset.length.getter
+    @override
+    def length(self) -> int:
+        return len(self._X)
+
+    @override
+    def to_dict(self) -> dict:
+        return {
+            **super().to_dict(),
+            "X": [str(x) for x in self._X],
+            "segments": [s.to_dict() for s in self._segments],
+            "cache_dir": str(self._cache_dir) if self._cache_dir is not None else None,
+        }
+
+    @override
+    def select(self, indices: Sequence[int]) -> Self:
+        return ESICv1SegmentDataset(
+            [self._X[i] for i in indices],
+            [self._segments[i] for i in indices],
+            self._sr,
+            self._cache_dir,
+        )
+
+    @override
+    def slice(
+        self, start: int | None = None, stop: int | None = None, step: int | None = None
+    ) -> Self:
+        return ESICv1SegmentDataset(
+            self._X[start:stop:step],
+            self._segments[start:stop:step],
+            self._sr,
+            self._cache_dir,
+        )
+
+    @override
+    def get(self, idx: int) -> Sample:
+        x, segment = self._X[idx], self._segments[idx]
+
+        def load_audio() -> np.ndarray:
+            return self._load_segment(x, segment)
+
+        return Sample(
+            id=self._id(x, segment), load_audio=load_audio, Y=self._Y(segment)
+        )
+
+    @override
+    def get_batch(
+        self, indices: Sequence[int], num_workers: int | None = None
+    ) -> list[Sample]:
+        """Samples with decoded audio, segments decoded in `num_workers` threads."""
+        indices = list(indices)
+        items = [(self._X[i], self._segments[i]) for i in indices]
+        if num_workers is None or num_workers <= 1:
+            audios = [self._load_segment(x, segment) for x, segment in items]
+        else:
+            # ffmpeg 는 별도 프로세스라 스레드로 충분히 병렬화됨
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                audios = list(
+                    executor.map(lambda item: self._load_segment(*item), items)
+                )
+        return [
+            Sample(id=self._id(x, segment), load_audio=audio, Y=self._Y(segment))
+            for (x, segment), audio in zip(items, audios)
+        ]
+
+    @override
+    def iter_labels(self) -> Generator[tuple[str, dict[str, Any]], Any, None]:
+        for x, segment in zip(self._X, self._segments):
+            yield self._id(x, segment), self._Y(segment)
+
+    @override
+    def durations(self, num_proc: int | None = None) -> list[float]:
+        return [segment.duration for segment in self._segments]
+
+    def save(self, path: Path, description="ESICv1SegmentDataset"):
+        JsonSaver(description).save(self.to_dict(), path)
+
+    @override
+    def _sample(
+        self,
+        size: int,
+        start: int = 0,
+        rng: np.random.Generator | np.random.RandomState | None = None,
+    ) -> Self:
+        if rng is None or size == len(self._X) - start:
+            return self.slice(start, start + size)
+        indices = rng.choice(np.arange(start, len(self._X)), size=size, replace=False)
+        return self.select(indices.tolist())
+
+    def _load_segment(self, x: Path, segment: Segment) -> np.ndarray:
+        if self._audio_cache is not None:
+            return self._audio_cache.load_segment(
+                x, segment.start, segment.end, self._sr
+            )
+        return decode_audio(x, self._sr, start=segment.start, duration=segment.duration)
+
+    @staticmethod
+    def _id(x: Path, segment: Segment) -> str:
+        session = normalize_text_only_en(str(Path(*x.parts[-3:-1])))
+        span = f"{round(segment.start * 1000):08d}_{round(segment.end * 1000):08d}"
+        return f"{session}_{span}"[-255:]
+
+    @staticmethod
+    def _Y(segment: Segment) -> dict[str, Any]:
+        return {"asr": segment.text}
+
+    @staticmethod
+    @override
+    def from_dict(data: dict) -> Self:
+        cache_dir = data.get("cache_dir")
+        return ESICv1SegmentDataset(
+            [Path(x) for x in data["X"]],
+            [Segment.from_dict(s) for s in data["segments"]],
+            sr=data["sr"],
+            cache_dir=Path(cache_dir) if cache_dir is not None else None,
+        )
+
+    @staticmethod
+    def load(path: Path):
+        _, data = load_json(path)
+        return ESICv1SegmentDataset.from_dict(data)
+
+
+__all__ = ["ESICv1SegmentDataset"]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import re
+
+from pathlib import Path
+from dataclasses import dataclass
+
+from sjaipy.datasets.esic_v1.file_type import VERT_TS, ORTO_TS
+
+if TYPE_CHECKING:
+    pass
+
+# o+ts: "<start> <end> <sentence>"
+_ORTO_TS_LINE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)\s+(.*?)\s*$")
+
+
+@dataclass(frozen=True, slots=True)
+class Segment:
+    start: float
+    end: float
+    text: str
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def to_dict(self) -> dict:
+        return {"start": self.start, "end": self.end, "text": self.text}
+
+    @staticmethod
+    def from_dict(data: dict) -> "Segment":
+        return Segment(start=data["start"], end=data["end"], text=data["text"])
+
+
+def parse_vert_ts(path: Path) -> list[Segment]:
+    """Sentence segments of a `vert+ts` file.
+
+    Every token line holds tab separated start, end, word, word with
+    symbols and sentence number, followed by other tags. Lines starting with
+    `<` are structural markup and skipped. Tokens sharing a sentence number
+    are joined into one segment spanning their first start and last end.
+    """
+    sentences: dict[str, list[tuple[float, float, str]]] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip() or line.startswith("<"):
+            continue
+        columns = line.split("\t")
+        if len(columns) < 5:
+            continue
+        start, end, word, sentence = columns[0], columns[1], columns[2], columns[4]
+        try:
+            sentences.setdefault(sentence, []).append((float(start), float(end), word))
+        except ValueError:
+            continue
+
+    segments = [
+        Segment(
+            start=min(start for start, _, _ in words),
+            end=max(end for _, end, _ in words),
+            text=" ".join(word for _, _, word in words if word),
+        )
+        for words in sentences.values()
+    ]
+    return sorted(segments, key=lambda s: (s.start, s.end))
+
+
+def parse_orto_ts(path: Path) -> list[Segment]:
+    """Sentence segments of an `o+ts` file, one `start end text` per line."""
+    segments = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if match := _ORTO_TS_LINE.match(line):
+            start, end, text = match.groups()
+            segments.append(Segment(start=float(start), end=float(end), text=text))
+    return sorted(segments, key=lambda s: (s.start, s.end))
+
+
+SEGMENT_PARSERS = {VERT_TS: parse_vert_ts, ORTO_TS: parse_orto_ts}
+
+
+def parse_segments(path: Path, file_type: str) -> list[Segment]:
+    if file_type not in SEGMENT_PARSERS:
+        raise ValueError(
+            f"Invalid segment file type: {file_type}. Valid types are: {', '.join(SEGMENT_PARSERS)}"
+        )
+    return SEGMENT_PARSERS[file_type](path)
+
+
+__all__ = [
+    "Segment",
+    "parse_vert_ts",
+    "parse_orto_ts",
+    "parse_segments",
+    "SEGMENT_PARSERS",
+]
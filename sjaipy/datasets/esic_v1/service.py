@@ -5,12 +5,15 @@ from pathlib import Path
 from collections.abc import Container
 
 from sjaipy.datasets.esic_v1.file_type import FILE_TYPE
+from sjaipy.datasets.esic_v1.directory_index import DirectoryIndex
 
 if TYPE_CHECKING:
     pass
 
 
-def select_file_from_dir(dir: Path, file_type: str) -> Path:
+def select_file_from_dir(
+    dir: Path, file_type: str, index: DirectoryIndex | None = None
+) -> Path:
     """Search for a specific file type in the given directory.
 
     Args:
@@ -26,6 +29,8 @@ def select_file_from_dir(dir: Path, file_type: str) -> Path:
             - "pv": Includes uppercase and punctuation, numbers as numbers, tags removed,
               incomplete utterances included.
             - "mp4": Original video.
+        index (DirectoryIndex | None): Answer from this index instead of
+            checking the file system.
 
     Raises:
         ValueError: If the file type is invalid.
@@ -35,6 +40,8 @@ def select_file_from_dir(dir: Path, file_type: str) -> Path:
         Path: The path to the found file.
     """
 
+    if index is not None:
+        return index.file(dir, file_type)
     if file_type not in FILE_TYPE:
         raise ValueError(
             f"Invalid file type: {file_type}. Valid types are: {', '.join(FILE_TYPE.keys())}"
@@ -49,20 +56,25 @@ def select_file_from_dir(dir: Path, file_type: str) -> Path:
     return file_path
 
 
-def search_dirs(source: Path, excludes: Container[str] | None = None) -> list[Path]:
-    if not source.exists():
-        raise FileNotFoundError(f"Source path {source} does not exist.")
-    if not source.is_dir():
-        raise ValueError(f"Expected a directory for source, but got a file: {source}")
-    excludes = excludes or set()
-
-    data_dirs = []
-    for dirpath in (p for p in source.rglob("*") if p.is_dir()):
-        if str(dirpath.absolute()) in excludes:
-            continue
-        if (dirpath / "en.OS.man-diar.mp4").exists():
-            data_dirs.append(dirpath)
-    return data_dirs
+def search_dirs(
+    source: Path,
+    excludes: Container[str] | None = None,
+    index: DirectoryIndex | None = None,
+) -> list[Path]:
+    """Directories below `source` that contain the original mp4.
+
+    The tree is read from `index`, or from a `DirectoryIndex` of `source`
+    that is built on first use and reused while no directory changed.
+    """
+    if index is None:
+        if not source.exists():
+            raise FileNotFoundError(f"Source path {source} does not exist.")
+        if not source.is_dir():
+            raise ValueError(
+                f"Expected a directory for source, but got a file: {source}"
+            )
+        index = DirectoryIndex(source)
+    return index.data_dirs(source, excludes=excludes)
 
 
 __all__ = [
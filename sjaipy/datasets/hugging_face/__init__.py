@@ -4,17 +4,25 @@ from sjaipy.datasets.hugging_face.ami import AMI
 from sjaipy.datasets.hugging_face.tedlium import Tedlium
 from sjaipy.datasets.hugging_face.vox_populi import VoxPopuli
 from sjaipy.datasets.hugging_face.dataset_loader import DatasetLoader
+from sjaipy.datasets.hugging_face.metadata_cache import MetadataCache
+from sjaipy.datasets.hugging_face.dataset_cache import DatasetCache
 from sjaipy.datasets.hugging_face.zeroth_korean import ZerothKorean
 from sjaipy.datasets.hugging_face.ksponspeech import KSPonSpeech
 
 from sjaipy.datasets.hugging_face.hugging_face_dataset import HuggingFaceDataset
+from sjaipy.datasets.hugging_face.hugging_face_iterable_dataset import (
+    HuggingFaceIterableDataset,
+)
 
 __all__ = [
     "AMI",
     "Tedlium",
     "VoxPopuli",
     "DatasetLoader",
+    "MetadataCache",
+    "DatasetCache",
     "ZerothKorean",
     "KSPonSpeech",
     "HuggingFaceDataset",
+    "HuggingFaceIterableDataset",
 ]
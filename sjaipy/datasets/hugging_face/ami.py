@@ -4,12 +4,15 @@ from typing import TYPE_CHECKING
 import warnings
 import numpy as np
 
+from typing import Any
 from typing_extensions import override
-from functools import lru_cache
 
 from sjpy.string import normalize_text_only_en
-from sjaipy.datasets.dataset import Task, Sample
+from sjaipy.datasets.dataset import Task
 from sjaipy.datasets.hugging_face.dataset_loader import DatasetLoader
+from sjaipy.datasets.hugging_face.hugging_face_iterable_dataset import (
+    HuggingFaceIterableDataset,
+)
 from sjaipy.datasets.hugging_face.hugging_face_dataset import HuggingFaceDataset
 
 if TYPE_CHECKING:
@@ -23,36 +26,50 @@ DEFAULT_TASK = ("asr",)
 
 
 class AMIDataset(HuggingFaceDataset):
+    @property
     @override
-    def get(self, idx: int) -> tuple[str, np.ndarray, str]:
-        data = self._dataset[idx]
-        _id = normalize_text_only_en(data["audio_id"])[-255:]
+    def _label_columns(self) -> tuple[str, ...]:
+        return ("audio_id", "text", "begin_time", "end_time", "speaker_id")
 
-        def load_audio() -> np.ndarray:
-            return self._resample_audio(data["audio"]["array"]).astype(np.float32)
+    @override
+    def _parse_row(self, row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        _id = normalize_text_only_en(row["audio_id"])[-255:]
 
         result = {}
         if "asr" in self.task:
-            result["asr"] = data["text"]
+            result["asr"] = row["text"]
         if "diarization" in self.task:
             result["diarization"] = [
                 {
-                    "start": data["begin_time"],
-                    "end": data["end_time"],
-                    "label": data["speaker_id"],
+                    "start": row["begin_time"],
+                    "end": row["end_time"],
+                    "label": row["speaker_id"],
                 }
             ]
-        return Sample(id=_id, load_audio=load_audio, Y=result)
+        return _id, result
+
+    @override
+    def _metadata_durations(self) -> np.ndarray | None:
+        durations = super()._metadata_durations()
+        if durations is not None:
+            return durations
+        # 세그먼트 시간으로 길이 계산
+        times = self._dataset.select_columns(["begin_time", "end_time"]).with_format(
+            "arrow"
+        )[:]
+        return (
+            times["end_time"].to_numpy(zero_copy_only=False)
+            - times["begin_time"].to_numpy(zero_copy_only=False)
+        ).astype(np.float64)
 
 
 class AMI(DatasetLoader):
-    def __init__(self, path=DEFAULT_PATH):
-        super().__init__(path)
+    def __init__(self, path=DEFAULT_PATH, revision: str | None = None):
+        super().__init__(path, revision)
 
     def split_names(self, config_name: str = DEFAULT_CONFIG_NAME) -> list[str]:
         return super().split_names(config_name)
 
-    @lru_cache(maxsize=1)
     def train(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -60,9 +77,8 @@ class AMI(DatasetLoader):
         task: tuple[Task, ...] = DEFAULT_TASK,
         **kwargs,
     ):
-        return AMIDataset(super().load(config_name, "train", **kwargs), sr, task)
+        return self.load_split(AMIDataset, config_name, "train", sr, task, **kwargs)
 
-    @lru_cache(maxsize=1)
     def validation(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -70,9 +86,10 @@ class AMI(DatasetLoader):
         task: tuple[Task, ...] = DEFAULT_TASK,
         **kwargs,
     ):
-        return AMIDataset(super().load(config_name, "validation", **kwargs), sr, task)
+        return self.load_split(
+            AMIDataset, config_name, "validation", sr, task, **kwargs
+        )
 
-    @lru_cache(maxsize=1)
     def test(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -80,7 +97,23 @@ class AMI(DatasetLoader):
         task: tuple[Task, ...] = DEFAULT_TASK,
         **kwargs,
     ):
-        return AMIDataset(super().load(config_name, "test", **kwargs), sr, task)
+        return self.load_split(AMIDataset, config_name, "test", sr, task, **kwargs)
+
+    def stream(
+        self,
+        split: str = "test",
+        config_name: str = DEFAULT_CONFIG_NAME,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        task: tuple[Task, ...] = DEFAULT_TASK,
+        **kwargs,
+    ) -> HuggingFaceIterableDataset:
+        return HuggingFaceIterableDataset(
+            super().stream(config_name, split, **kwargs),
+            AMIDataset,
+            sr,
+            task,
+            source=self.source(config_name, split, **kwargs),
+        )
 
 
 if __name__ != "__main__":
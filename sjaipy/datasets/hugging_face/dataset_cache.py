@@ -0,0 +1,182 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import copy
+import threading
+
+from typing import Any, Callable, Hashable, NamedTuple
+from collections import OrderedDict
+from datasets.table import Table, ConcatenationTable, MemoryMappedTable
+
+from sjaipy.datasets.dataset import Task
+
+if TYPE_CHECKING:
+    from sjaipy.datasets.hugging_face.hugging_face_dataset import HuggingFaceDataset
+
+DEFAULT_MAX_ENTRIES = 8
+
+
+class CacheKey(NamedTuple):
+    path: str
+    revision: str | None
+    config_name: str
+    split: str
+    sr: int
+    task: tuple[Task, ...]
+    options: Hashable = ()
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+
+class DatasetCache:
+    """LRU cache of built datasets shared by all `DatasetLoader` instances.
+
+    Entries are evicted least recently used first once there are more than
+    `max_entries` of them or their Arrow tables exceed `max_bytes` in total.
+    Only in-memory blocks (data and indices) count towards the size, since
+    memory-mapped blocks live in the page cache and are reclaimable. The
+    most recent entry is always kept, even if it alone is over the byte
+    budget.
+
+    `get_or_load` returns a shallow copy of the cached dataset, so setting
+    `sr` or `task` on the result does not change the entry. The Arrow
+    tables and parsed views are shared.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, tuple[HuggingFaceDataset, int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._entries
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                nbytes=self._nbytes(),
+            )
+
+    def get_or_load(
+        self, key: CacheKey, load: Callable[[], HuggingFaceDataset]
+    ) -> HuggingFaceDataset:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.copy(self._entries[key][0])
+            self._misses += 1
+
+        # 로딩은 lock 밖에서, 동시에 같은 키를 읽으면 나중 결과가 남음
+        dataset = load()
+        with self._lock:
+            self._entries[key] = (dataset, self._sizeof(dataset))
+            self._entries.move_to_end(key)
+            self._shrink()
+        return copy.copy(dataset)
+
+    def evict(self, **fields: Any) -> int:
+        """Drop entries whose `CacheKey` fields equal `fields`, all if empty.
+
+        Returns:
+            int: Number of dropped entries.
+        """
+        unknown = set(fields) - set(CacheKey._fields)
+        if unknown:
+            raise ValueError(f"Unknown cache key fields: {sorted(unknown)}")
+
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if all(getattr(key, name) == value for name, value in fields.items())
+            ]
+            for key in keys:
+                del self._entries[key]
+            self._evictions += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def resize(
+        self, max_entries: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        with self._lock:
+            self._max_entries = max_entries
+            self._max_bytes = max_bytes
+            self._shrink()
+
+    def _shrink(self) -> None:
+        while len(self._entries) > 1 and (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_bytes is not None and self._nbytes() > self._max_bytes)
+        ):
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        if self._max_entries == 0:
+            self._evictions += len(self._entries)
+            self._entries.clear()
+
+    def _nbytes(self) -> int:
+        return sum(nbytes for _, nbytes in self._entries.values())
+
+    @staticmethod
+    def _sizeof(dataset: HuggingFaceDataset) -> int:
+        table = dataset.args["dataset"]
+        return _in_memory_nbytes(table.data) + (
+            _in_memory_nbytes(table._indices) if table._indices is not None else 0
+        )
+
+
+def _in_memory_nbytes(table: Table) -> int:
+    if isinstance(table, MemoryMappedTable):
+        return 0
+    if isinstance(table, ConcatenationTable):
+        return sum(
+            _in_memory_nbytes(block) for blocks in table.blocks for block in blocks
+        )
+    return table.nbytes
+
+
+def freeze(value: Any) -> Hashable:
+    """Hashable form of keyword arguments, e.g. sets and dicts."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+DATASET_CACHE = DatasetCache()
+
+__all__ = ["DatasetCache", "CacheKey", "CacheStats", "DATASET_CACHE", "freeze"]
@@ -1,52 +1,124 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from functools import lru_cache, cached_property
+from typing import Any
 from datasets import (
     load_dataset,
-    get_dataset_config_names,
-    get_dataset_split_names,
     Dataset,
+    IterableDataset,
     DownloadConfig,
 )
 
+from sjaipy.datasets.dataset import Task
+from sjaipy.datasets.hugging_face.dataset_cache import (
+    CacheKey,
+    DatasetCache,
+    DATASET_CACHE,
+    freeze,
+)
+from sjaipy.datasets.hugging_face.metadata_cache import (
+    MetadataCache,
+    METADATA_CACHE,
+)
+
 if TYPE_CHECKING:
-    pass
+    from sjaipy.datasets.hugging_face.hugging_face_dataset import HuggingFaceDataset
 
 
 class DatasetLoader:
-    def __init__(self, path: str):
+    def __init__(
+        self,
+        path: str,
+        revision: str | None = None,
+        metadata_cache: MetadataCache = METADATA_CACHE,
+        dataset_cache: DatasetCache = DATASET_CACHE,
+    ):
         self._path = path
+        self._revision = revision
+        self._metadata = metadata_cache
+        self._cache = dataset_cache
 
-    @cached_property
+    @property
     def config_names(self) -> list[str]:
-        return get_dataset_config_names(self._path)
+        return self._metadata.config_names(self._path, self._revision)
 
-    @lru_cache(maxsize=32)
     def split_names(self, config_name: str) -> list[str]:
-        if config_name not in self.config_names:
+        if not self._metadata.has_config(self._path, config_name, self._revision):
             raise ValueError(
                 f"Config name '{config_name}' is not valid. Available configs: {self.config_names}"
             )
-        return get_dataset_split_names(self._path, config_name)
+        return self._metadata.split_names(self._path, config_name, self._revision)
 
     def load(
         self, config_name: str, split: str, local_files_only: bool = False
     ) -> Dataset:
-        if config_name not in self.config_names:
-            raise ValueError(
-                f"Config name '{config_name}' is not valid. Available configs: {self.config_names}"
-            )
-        if split not in self.split_names(config_name):
-            raise ValueError(
-                f"Split '{split}' is not valid for config '{config_name}'. Available splits: {self.split_names(config_name)}"
-            )
+        self._validate(config_name, split)
         return load_dataset(
             self._path,
             config_name,
             split=split,
+            revision=self._revision,
             download_config=DownloadConfig(local_files_only=local_files_only),
         )
 
+    def load_split(
+        self,
+        dataset_type: type[HuggingFaceDataset],
+        config_name: str,
+        split: str,
+        sr: int,
+        task: tuple[Task, ...],
+        dataset_kwargs: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> HuggingFaceDataset:
+        """`dataset_type` over `load(config_name, split)`, shared via the cache."""
+        dataset_kwargs = dataset_kwargs or {}
+        key = CacheKey(
+            path=self._path,
+            revision=self._revision,
+            config_name=config_name,
+            split=split,
+            sr=sr,
+            task=tuple(task),
+            options=freeze((dataset_type, dataset_kwargs, kwargs)),
+        )
+        return self._cache.get_or_load(
+            key,
+            lambda: dataset_type(
+                self.load(config_name, split, **kwargs), sr, task, **dataset_kwargs
+            ),
+        )
+
+    def evict(self, config_name: str | None = None, split: str | None = None) -> int:
+        """Drop cached datasets of this path, optionally of one config/split."""
+        fields = {"path": self._path, "revision": self._revision}
+        if config_name is not None:
+            fields["config_name"] = config_name
+        if split is not None:
+            fields["split"] = split
+        return self._cache.evict(**fields)
+
+    def stream(self, config_name: str, split: str, **kwargs) -> IterableDataset:
+        self._validate(config_name, split)
+        return load_dataset(**self.source(config_name, split, **kwargs), streaming=True)
+
+    def source(self, config_name: str, split: str, **kwargs) -> dict:
+        """`load_dataset` arguments that reopen the stream of `stream`."""
+        source = {"path": self._path, "name": config_name, "split": split}
+        if self._revision is not None:
+            source["revision"] = self._revision
+        return {**source, **kwargs}
+
+    def _validate(self, config_name: str, split: str) -> None:
+        # 로컬 메타데이터 캐시에 있는 이름이면 hub 에 묻지 않음
+        if not self._metadata.has_config(self._path, config_name, self._revision):
+            raise ValueError(
+                f"Config name '{config_name}' is not valid. Available configs: {self.config_names}"
+            )
+        if not self._metadata.has_split(self._path, config_name, split, self._revision):
+            raise ValueError(
+                f"Split '{split}' is not valid for config '{config_name}'. Available splits: {self.split_names(config_name)}"
+            )
+
 
 __all__ = ["DatasetLoader"]
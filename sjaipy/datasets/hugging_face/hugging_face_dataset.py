@@ -1,25 +1,65 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-import librosa
+import io
+import os
+import json
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import soundfile as sf
 
-from typing import Sequence
+from typing import Any, Callable, Generator, Sequence
 from typing_extensions import override, Self
-from datasets import Dataset as DT
-from abc import ABC
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+from datasets import Audio, Dataset as DT, Features, Sequence as ArrowList, Value
+from datasets.fingerprint import Hasher
+from datasets.table import (
+    Table,
+    InMemoryTable,
+    MemoryMappedTable,
+    ConcatenationTable,
+    concat_tables,
+)
+from abc import ABC, abstractmethod
 
-from sjaipy.datasets.dataset import Dataset, Task
+from sjaipy.audio import INT16_SCALE, from_int16, resample, resample_batch, to_int16
+from sjaipy.datasets.dataset import Dataset, Sample, Task
 
 if TYPE_CHECKING:
     pass
 
+AUDIO_COLUMN = "audio"
+AUDIO_PATH_COLUMN = f"{AUDIO_COLUMN}.path"
+AUDIO_BYTES_COLUMN = f"{AUDIO_COLUMN}.bytes"
+DEFAULT_LABEL_BATCH_SIZE = 1_000
+DEFAULT_PREPROCESS_BATCH_SIZE = 100
+DURATION_COLUMN = "duration"
+
+# preprocess 가 추가하는 컬럼
+PREPROCESSED_ID_COLUMN = "_sjaipy_id"
+PREPROCESSED_LABELS_COLUMN = "_sjaipy_labels"
+PREPROCESSED_AUDIO_COLUMN = "_sjaipy_audio"
+PREPROCESSED_DTYPES = ("float32", "int16")
+
 
 class HuggingFaceDataset(Dataset, ABC):
-    def __init__(self, dataset: DT, sr: int, task: tuple[Task, ...]):
+    def __init__(
+        self,
+        dataset: DT,
+        sr: int,
+        task: tuple[Task, ...],
+        preprocessed: dict[str, Any] | None = None,
+    ):
         super().__init__(sr, task)
+        # 오디오는 load_audio 에서만 디코딩
+        feature = dataset.features.get(AUDIO_COLUMN)
+        if isinstance(feature, Audio) and feature.decode:
+            dataset = dataset.cast_column(AUDIO_COLUMN, Audio(decode=False))
         self._dataset = dataset
-        self._original_sr = sr
+        self._preprocessed = preprocessed
+        self._label_views: dict[tuple[str, ...], DT] = {}
 
     @Dataset.args.getter
     @override
@@ -27,8 +67,22 @@ class HuggingFaceDataset(Dataset, ABC):
         return {
             **super().args,
             "dataset": self._dataset,
+            "preprocessed": self._preprocessed,
         }
 
+    @property
+    def is_preprocessed(self) -> bool:
+        """Whether `get` reads the columns written by `preprocess`.
+
+        They are only used while `sr` and `task` match the ones they were
+        computed for.
+        """
+        return (
+            self._preprocessed is not None
+            and self._preprocessed["sr"] == self._sr
+            and tuple(self._preprocessed["task"]) == self.task
+        )
+
     @Dataset.length.getter
     @override
     def length(self) -> int:
@@ -36,11 +90,111 @@ class HuggingFaceDataset(Dataset, ABC):
 
     @override
     def to_dict(self) -> dict:
+        data_files = self._data_files(self._dataset.data)
+        if data_files is None:
+            # 메모리 상의 데이터셋은 내용을 그대로 저장
+            return {
+                **super().to_dict(),
+                "dataset": self._dataset.to_dict(),
+                "preprocessed": self._preprocessed,
+            }
+
+        indices = self._dataset._indices
+        indices_files = None if indices is None else self._data_files(indices)
         return {
             **super().to_dict(),
-            "dataset": self._dataset.to_dict(),
+            "data_files": data_files,
+            "indices_file": indices_files[0] if indices_files else None,
+            "file_stats": self._file_stats(data_files + (indices_files or [])),
+            "indices": (
+                indices.column(0).to_pylist()
+                if indices is not None and not indices_files
+                else None
+            ),
+            "column_names": self._dataset.column_names,
+            "fingerprint": self._dataset._fingerprint,
+            "preprocessed": self._preprocessed,
         }
 
+    def preprocess(
+        self,
+        num_proc: int | None = None,
+        dtype: str = "float32",
+        batch_size: int = DEFAULT_PREPROCESS_BATCH_SIZE,
+    ) -> Self:
+        """Compute ids, labels and resampled audio once with `datasets.map`.
+
+        The normalized id, the JSON encoded `Y` and the waveform at `sr` are
+        written as extra columns. For datasets backed by Arrow files they are
+        stored in the datasets cache under a fingerprint of the source
+        dataset, the class and its arguments, so running `preprocess` again
+        only reads the cache file.
+
+        Args:
+            num_proc (int | None): Worker processes of `datasets.map`.
+            dtype (str): Stored sample type, "float32" or "int16". int16 halves
+                the cache size and is converted back to float32 on load.
+            batch_size (int): Rows per `map` batch.
+
+        Returns:
+            Self: Dataset reading the preprocessed columns.
+        """
+        if dtype not in PREPROCESSED_DTYPES:
+            raise ValueError(f"dtype must be one of {PREPROCESSED_DTYPES}")
+        if self.is_preprocessed and self._preprocessed["dtype"] == dtype:
+            return self
+
+        preprocessed = {"sr": self._sr, "task": list(self.task), "dtype": dtype}
+        dataset = self._dataset.remove_columns(
+            [
+                column
+                for column in (
+                    PREPROCESSED_ID_COLUMN,
+                    PREPROCESSED_LABELS_COLUMN,
+                    PREPROCESSED_AUDIO_COLUMN,
+                )
+                if column in self._dataset.column_names
+            ]
+        )
+        options = {
+            key: sorted(value) if isinstance(value, (set, frozenset)) else value
+            for key, value in self.args.items()
+            if key not in ("dataset", "preprocessed")
+        }
+        fingerprint = Hasher.hash(
+            [
+                dataset._fingerprint,
+                type(self).__module__,
+                type(self).__qualname__,
+                json.dumps(options, sort_keys=True, default=str),
+                dtype,
+                INT16_SCALE,
+            ]
+        )
+        features = Features(
+            {
+                **dataset.features,
+                PREPROCESSED_ID_COLUMN: Value("string"),
+                PREPROCESSED_LABELS_COLUMN: Value("string"),
+                PREPROCESSED_AUDIO_COLUMN: ArrowList(Value(dtype)),
+            }
+        )
+        dataset = dataset.map(
+            self._preprocess_batch,
+            batched=True,
+            batch_size=batch_size,
+            num_proc=num_proc,
+            features=features,
+            fn_kwargs={"dtype": dtype},
+            new_fingerprint=fingerprint,
+            desc="Preprocessing",
+        )
+
+        args = self.args
+        args["dataset"] = dataset
+        args["preprocessed"] = preprocessed
+        return type(self)(**args)
+
     @override
     def select(self, indices: Sequence[int]) -> Self:
         dataset = self._dataset.select(indices)
@@ -60,6 +214,128 @@ class HuggingFaceDataset(Dataset, ABC):
         args["dataset"] = dataset
         return type(self)(**args)
 
+    @override
+    def get(self, idx: int) -> Sample:
+        if self.is_preprocessed:
+            ((_id, Y),) = self._preprocessed_labels(self._preprocessed_view[idx])
+        else:
+            row = self._label_view()[idx].to_pylist()[0]
+            _id, Y = self._parse_row(row)
+        return Sample(id=_id, load_audio=self._lazy_audio(idx), Y=Y)
+
+    @override
+    def get_batch(
+        self,
+        indices: Sequence[int],
+        decode_audio: bool = True,
+        num_workers: int | None = None,
+    ) -> list[Sample]:
+        indices = self._check_indices(indices, len(self))
+        if not indices:
+            return []
+        key = self._batch_key(indices)
+        if self.is_preprocessed:
+            labels = self._preprocessed_labels(self._preprocessed_view[key])
+        else:
+            labels = [
+                self._parse_row(row) for row in self._label_view()[key].to_pylist()
+            ]
+
+        if not decode_audio:
+            return [
+                Sample(id=_id, load_audio=self._lazy_audio(idx), Y=Y)
+                for idx, (_id, Y) in zip(indices, labels)
+            ]
+
+        if self.is_preprocessed:
+            audios = self._preprocessed_audio(self._preprocessed_audio_view[key])
+        else:
+            audios = self._load_audio_batch(
+                self._audio_view[key][AUDIO_COLUMN], num_workers=num_workers
+            )
+        return [
+            Sample(id=_id, load_audio=audio, Y=Y)
+            for (_id, Y), audio in zip(labels, audios)
+        ]
+
+    @override
+    def iter(self) -> Generator[Sample, Any, None]:
+        for start in range(0, len(self), DEFAULT_LABEL_BATCH_SIZE):
+            stop = min(start + DEFAULT_LABEL_BATCH_SIZE, len(self))
+            yield from self.get_batch(range(start, stop), decode_audio=False)
+
+    @override
+    def iter_labels(
+        self, batch_size: int = DEFAULT_LABEL_BATCH_SIZE
+    ) -> Generator[tuple[str, dict[str, Any]], Any, None]:
+        if self.is_preprocessed:
+            for table in self._preprocessed_view.iter(batch_size=batch_size):
+                yield from self._preprocessed_labels(table)
+            return
+        for table in self._label_view().iter(batch_size=batch_size):
+            for row in table.to_pylist():
+                yield self._parse_row(row)
+
+    @override
+    def durations(self, num_proc: int | None = None) -> list[float]:
+        """Durations from Arrow metadata, without decoding audio.
+
+        `_metadata_durations` is used when the rows carry their length
+        (preprocessed audio, a duration column, segment times). Otherwise
+        only the audio file headers are read, in `num_proc` processes.
+        """
+        durations = self._metadata_durations()
+        if durations is not None:
+            return durations.tolist()
+
+        view = self._dataset.flatten().select_columns(
+            [AUDIO_PATH_COLUMN, AUDIO_BYTES_COLUMN]
+        )
+        if num_proc is not None and num_proc > 1:
+            return view.map(
+                self._header_durations,
+                batched=True,
+                batch_size=DEFAULT_LABEL_BATCH_SIZE,
+                num_proc=num_proc,
+                remove_columns=view.column_names,
+                desc="Reading audio headers",
+            )[DURATION_COLUMN]
+        return [
+            duration
+            for batch in view.iter(batch_size=DEFAULT_LABEL_BATCH_SIZE)
+            for duration in self._header_durations(batch)[DURATION_COLUMN]
+        ]
+
+    @override
+    def filter(
+        self,
+        function: Callable[[str, dict[str, Any]], bool] | None = None,
+        *,
+        min_duration: float | None = None,
+        max_duration: float | None = None,
+        num_proc: int | None = None,
+    ) -> Self:
+        """Arrow backed `Dataset.filter`, returning an index view.
+
+        Args:
+            function (Callable[[str, dict[str, Any]], bool] | None): Label
+                predicate on `(id, Y)`, must be picklable if `num_proc` > 1.
+            min_duration (float | None): Inclusive lower bound in seconds.
+            max_duration (float | None): Inclusive upper bound in seconds.
+            num_proc (int | None): Worker processes for header parsing and
+                `function`.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if min_duration is not None or max_duration is not None:
+            mask &= self._duration_mask(
+                np.asarray(self.durations(num_proc=num_proc), dtype=np.float64),
+                min_duration,
+                max_duration,
+            )
+        if function is not None:
+            mask &= self._label_mask(function, num_proc)
+        return self.select(np.flatnonzero(mask).tolist())
+
     @override
     def _sample(
         self,
@@ -78,18 +354,261 @@ class HuggingFaceDataset(Dataset, ABC):
         args["dataset"] = dataset
         return type(self)(**args)
 
-    @staticmethod
+    @classmethod
     @override
-    def from_dict(data: dict) -> Self:
-        data["dataset"] = DT.from_dict(data["dataset"])
-        return HuggingFaceDataset(**data)
-
-    def _resample_audio(self, audio: np.ndarray) -> np.ndarray:
-        if self._sr != self._original_sr:
-            audio = librosa.resample(
-                audio, orig_sr=self._original_sr, target_sr=self._sr
+    def from_dict(cls, data: dict) -> Self:
+        data = dict(data)
+        data["task"] = tuple(data["task"])
+        if "dataset" in data:
+            data["dataset"] = DT.from_dict(data["dataset"])
+            return cls(**data)
+
+        data_files = data.pop("data_files")
+        indices_file, indices = data.pop("indices_file"), data.pop("indices")
+        # 파일이 바뀌었으면 fingerprint 와 indices 가 다른 데이터를 가리킴
+        file_stats = data.pop("file_stats")
+        changed = [
+            path
+            for path, stat in cls._file_stats(list(file_stats)).items()
+            if stat != file_stats[path]
+        ]
+        if changed:
+            raise ValueError(f"Arrow files changed since to_dict: {', '.join(changed)}")
+
+        table = concat_tables(
+            [MemoryMappedTable.from_file(path) for path in data_files]
+        ).select(data.pop("column_names"))
+
+        if indices_file is not None:
+            indices_table = MemoryMappedTable.from_file(indices_file)
+        elif indices is not None:
+            indices_table = InMemoryTable.from_arrays(
+                [pa.array(indices, type=pa.uint64())], names=["indices"]
+            )
+        else:
+            indices_table = None
+
+        # feature 는 arrow 파일의 메타데이터에서 복원
+        data["dataset"] = DT(
+            table,
+            indices_table=indices_table,
+            fingerprint=data.pop("fingerprint"),
+        )
+        return cls(**data)
+
+    def _metadata_durations(self) -> np.ndarray | None:
+        """Durations computable from columns alone, None if there are none."""
+        if self.is_preprocessed:
+            # 오디오 값은 읽지 않고 list offset 만 사용
+            lengths = pc.list_value_length(
+                self._dataset.data.column(PREPROCESSED_AUDIO_COLUMN)
+            ).to_numpy(zero_copy_only=False)
+            if self._dataset._indices is not None:
+                lengths = lengths[self._dataset._indices.column(0).to_numpy()]
+            return lengths / self._sr
+        if DURATION_COLUMN in self._dataset.column_names:
+            column = self._dataset.select_columns([DURATION_COLUMN]).with_format(
+                "arrow"
+            )
+            return column[:][DURATION_COLUMN].to_numpy()
+        return None
+
+    def _label_mask(
+        self, function: Callable[[str, dict[str, Any]], bool], num_proc: int | None
+    ) -> np.ndarray:
+        if num_proc is None or num_proc <= 1:
+            return np.fromiter(
+                (function(_id, Y) for _id, Y in self.iter_labels()),
+                dtype=bool,
+                count=len(self),
             )
-        return audio
+
+        def keep(table: pa.Table) -> dict[str, list[bool]]:
+            if self.is_preprocessed:
+                labels = self._preprocessed_labels(table)
+            else:
+                labels = [self._parse_row(row) for row in table.to_pylist()]
+            return {"keep": [bool(function(_id, Y)) for _id, Y in labels]}
+
+        view = self._preprocessed_view if self.is_preprocessed else self._label_view()
+        kept = view.map(
+            keep,
+            batched=True,
+            batch_size=DEFAULT_LABEL_BATCH_SIZE,
+            num_proc=num_proc,
+            remove_columns=view.column_names,
+            desc="Filtering",
+        )
+        return kept.with_format("arrow")[:]["keep"].to_numpy(zero_copy_only=False)
+
+    @property
+    @abstractmethod
+    def _label_columns(self) -> tuple[str, ...]:
+        """Flattened columns read by `_parse_row`, e.g. `("text", "audio.path")`."""
+
+    @abstractmethod
+    def _parse_row(self, row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        """Build `(id, Y)` from a row restricted to `_label_columns`."""
+
+    def _label_view(self) -> DT:
+        columns = self._label_columns
+        if columns not in self._label_views:
+            # flatten 은 zero-copy, audio.bytes 를 제외하면 오디오를 읽지 않음
+            self._label_views[columns] = (
+                self._dataset.flatten()
+                .select_columns(list(columns))
+                .with_format("arrow")
+            )
+        return self._label_views[columns]
+
+    @cached_property
+    def _audio_view(self) -> DT:
+        return self._dataset.select_columns([AUDIO_COLUMN])
+
+    @cached_property
+    def _preprocessed_view(self) -> DT:
+        columns = [PREPROCESSED_ID_COLUMN, PREPROCESSED_LABELS_COLUMN]
+        return self._dataset.select_columns(columns).with_format("arrow")
+
+    @cached_property
+    def _preprocessed_audio_view(self) -> DT:
+        return self._dataset.select_columns([PREPROCESSED_AUDIO_COLUMN]).with_format(
+            "arrow"
+        )
+
+    def _lazy_audio(self, idx: int) -> Callable[[], np.ndarray]:
+        def load_audio() -> np.ndarray:
+            if self.is_preprocessed:
+                return self._preprocessed_audio(self._preprocessed_audio_view[idx])[0]
+            return self._load_audio(self._audio_view[idx][AUDIO_COLUMN])
+
+        return load_audio
+
+    def _preprocess_batch(self, batch: dict[str, list], dtype: str) -> dict[str, list]:
+        rows = [dict(zip(batch, values)) for values in zip(*batch.values())]
+        labels = [self._parse_row(self._flatten_row(row)) for row in rows]
+        audios = self._load_audio_batch([row[AUDIO_COLUMN] for row in rows])
+        if dtype == "int16":
+            audios = [to_int16(audio) for audio in audios]
+        return {
+            **batch,
+            PREPROCESSED_ID_COLUMN: [_id for _id, _ in labels],
+            PREPROCESSED_LABELS_COLUMN: [
+                json.dumps(Y, ensure_ascii=False) for _, Y in labels
+            ],
+            PREPROCESSED_AUDIO_COLUMN: audios,
+        }
+
+    def _flatten_row(self, row: dict[str, Any]) -> dict[str, Any]:
+        # _parse_row 는 flatten 된 컬럼 이름을 기대함
+        flat = {}
+        for column in self._label_columns:
+            parent, _, child = column.partition(".")
+            flat[column] = row[parent][child] if child else row[column]
+        return flat
+
+    @staticmethod
+    def _preprocessed_labels(table: pa.Table) -> list[tuple[str, dict[str, Any]]]:
+        return [
+            (_id, json.loads(labels))
+            for _id, labels in zip(
+                table.column(PREPROCESSED_ID_COLUMN).to_pylist(),
+                table.column(PREPROCESSED_LABELS_COLUMN).to_pylist(),
+            )
+        ]
+
+    def _preprocessed_audio(self, table: pa.Table) -> list[np.ndarray]:
+        audios = [
+            audio.values.to_numpy(zero_copy_only=False)
+            for audio in table.column(PREPROCESSED_AUDIO_COLUMN)
+        ]
+        if self._preprocessed["dtype"] == "int16":
+            return [from_int16(audio) for audio in audios]
+        return audios
+
+    def _load_audio_batch(
+        self, audios: list[dict[str, Any]], num_workers: int | None = None
+    ) -> list[np.ndarray]:
+        if num_workers is None or num_workers <= 1:
+            decoded = [self._decode_audio(audio) for audio in audios]
+        else:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                decoded = list(executor.map(self._decode_audio, audios))
+        if not decoded:
+            return []
+        arrays, srs = zip(*decoded)
+        return resample_batch(arrays, srs, self._sr)
+
+    def _load_audio(self, audio: dict[str, Any]) -> np.ndarray:
+        array, sr = self._decode_audio(audio)
+        return resample(array, sr, self._sr)
+
+    @staticmethod
+    def _decode_audio(audio: dict[str, Any]) -> tuple[np.ndarray, int]:
+        # 원본 샘플레이트 그대로 디코딩
+        decoded = Audio().decode_example(audio)
+        array = np.asarray(decoded["array"], dtype=np.float32)
+        return array, decoded["sampling_rate"]
+
+    @staticmethod
+    def _data_files(table: Table) -> list[str] | None:
+        """Arrow files backing `table`, or None if any block lives in memory."""
+        if isinstance(table, MemoryMappedTable):
+            return [table.path]
+        if isinstance(table, ConcatenationTable) and all(
+            len(blocks) == 1 and isinstance(blocks[0], MemoryMappedTable)
+            for blocks in table.blocks
+        ):
+            return [blocks[0].path for blocks in table.blocks]
+        return None
+
+    @staticmethod
+    def _file_stats(paths: list[str]) -> dict[str, list[int]]:
+        """(size, mtime_ns) of each file, [] for missing ones."""
+        stats = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                stats[path] = [stat.st_size, stat.st_mtime_ns]
+            except FileNotFoundError:
+                stats[path] = []
+        return stats
+
+    @staticmethod
+    def _check_indices(indices: Sequence[int], length: int) -> list[int]:
+        # slice 는 범위 밖을 조용히 버리므로 get 처럼 IndexError 를 냄
+        checked = []
+        for idx in indices:
+            idx = int(idx)
+            if not -length <= idx < length:
+                raise IndexError("Index out of range")
+            checked.append(idx % length)
+        return checked
+
+    @staticmethod
+    def _batch_key(indices: list[int]) -> slice | list[int]:
+        # 연속 구간은 slice 로 zero-copy, 나머지는 한 번에 gather
+        start = indices[0]
+        if indices == list(range(start, start + len(indices))):
+            return slice(start, start + len(indices))
+        return indices
+
+    @staticmethod
+    def _header_durations(batch: dict[str, list]) -> dict[str, list[float]]:
+        return {
+            DURATION_COLUMN: [
+                HuggingFaceDataset._audio_duration(path, data)
+                for path, data in zip(
+                    batch[AUDIO_PATH_COLUMN], batch[AUDIO_BYTES_COLUMN]
+                )
+            ]
+        }
+
+    @staticmethod
+    def _audio_duration(path: str | None, data: bytes | None) -> float:
+        # 헤더만 읽어 길이를 구함
+        info = sf.info(io.BytesIO(data) if data is not None else path)
+        return info.frames / info.samplerate
 
 
 __all__ = ["HuggingFaceDataset"]
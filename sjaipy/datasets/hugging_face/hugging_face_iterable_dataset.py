@@ -0,0 +1,315 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from typing import Any, Generator, Iterator, Sequence
+from typing_extensions import override, Self
+from functools import cached_property, partial
+from datasets import (
+    Audio,
+    Dataset as DT,
+    IterableDataset,
+    load_dataset,
+)
+from datasets.distributed import split_dataset_by_node
+
+from sjaipy.datasets.dataset import Dataset, Sample, Task
+from sjaipy.datasets.hugging_face.hugging_face_dataset import (
+    HuggingFaceDataset,
+    AUDIO_COLUMN,
+)
+
+if TYPE_CHECKING:
+    pass
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_BUFFER_SIZE = 10_000
+DEFAULT_SHUFFLE_BUFFER_SIZE = 1_000
+
+
+class HuggingFaceIterableDataset(Dataset):
+    """Streaming backend over a `datasets.IterableDataset`.
+
+    Rows are pulled in batches of `batch_size` and parsed by the
+    `_parse_row` of one `dataset_type` instance, so every corpus keeps a
+    single implementation for both backends and its `__init__` runs once.
+
+    Random access (`get`, `select`) is served from a local buffer holding at
+    most `buffer_size` rows from the head of the stream. `skip`, `take`,
+    `shuffle` and `shard` are recorded and replayed by `from_dict`, which
+    reopens the stream from `source` (the `load_dataset` arguments).
+    """
+
+    def __init__(
+        self,
+        dataset: IterableDataset,
+        dataset_type: type[HuggingFaceDataset],
+        sr: int,
+        task: tuple[Task, ...],
+        dataset_kwargs: dict[str, Any] | None = None,
+        source: dict[str, Any] | None = None,
+        ops: list[tuple[str, dict[str, Any]]] | None = None,
+        length: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        super().__init__(sr, task)
+        feature = (dataset.features or {}).get(AUDIO_COLUMN)
+        if isinstance(feature, Audio) and feature.decode:
+            dataset = dataset.cast_column(AUDIO_COLUMN, Audio(decode=False))
+        self._dataset = dataset
+        self._dataset_type = dataset_type
+        self._dataset_kwargs = dataset_kwargs or {}
+        self._source = source
+        self._ops = ops or []
+        self._length = length if length is not None or ops else self._split_length()
+        self._batch_size = batch_size
+        self._buffer_size = buffer_size
+        self._buffer: list[dict[str, Any]] = []
+        self._buffer_iter: Iterator[dict[str, Any]] | None = None
+
+    @Dataset.args.getter
+    @override
+    def args(self) -> dict:
+        return {
+            **super().args,
+            "dataset": self._dataset,
+            "dataset_type": self._dataset_type,
+            "dataset_kwargs": self._dataset_kwargs,
+            "source": self._source,
+            "ops": self._ops,
+            "length": self._length,
+            "batch_size": self._batch_size,
+            "buffer_size": self._buffer_size,
+        }
+
+    @Dataset.length.getter
+    @override
+    def length(self) -> int:
+        if self._length is None:
+            raise TypeError("Length of this streaming dataset is unknown")
+        return self._length
+
+    @override
+    def iter(self) -> Generator[Sample, Any, None]:
+        for batch in self._dataset.iter(batch_size=self._batch_size):
+            for row in self._rows(batch):
+                yield self._to_sample(row)
+
+    @override
+    def iter_labels(self) -> Generator[tuple[str, dict[str, Any]], Any, None]:
+        for batch in self._dataset.iter(batch_size=self._batch_size):
+            for row in self._rows(batch):
+                yield self._parser._parse_row(self._parser._flatten_row(row))
+
+    @override
+    def getitem(self, key: int | slice | Sequence[int]) -> Sample | Self:
+        # 길이를 모를 수 있으므로 음수 인덱스 변환 없이 바로 조회
+        if isinstance(key, int):
+            return self.get(key)
+        return super().getitem(key)
+
+    @override
+    def get(self, idx: int) -> Sample:
+        if idx < 0:
+            raise IndexError("Negative index is not supported for streaming datasets")
+        self._fill_buffer(idx + 1)
+        if idx >= len(self._buffer):
+            raise IndexError("Index out of range")
+        return self._to_sample(self._buffer[idx])
+
+    @override
+    def select(self, indices: Sequence[int]) -> HuggingFaceDataset:
+        """Materialize the selected rows from the local buffer."""
+        indices = list(indices)
+        if any(i < 0 for i in indices):
+            raise IndexError("Negative index is not supported for streaming datasets")
+        if indices:
+            self._fill_buffer(max(indices) + 1)
+        if any(i >= len(self._buffer) for i in indices):
+            raise IndexError("Index out of range")
+        return self._materialize(self._to_table([self._buffer[i] for i in indices]))
+
+    @override
+    def slice(
+        self, start: int | None = None, stop: int | None = None, step: int | None = None
+    ) -> Self:
+        start = start if start is not None else 0
+        step = step if step is not None else 1
+        if start < 0 or (stop is not None and stop < 0):
+            raise IndexError("Negative index is not supported for streaming datasets")
+        if step <= 0:
+            raise ValueError("Step must be a positive integer")
+
+        dataset = self.skip(start) if start else self
+        if stop is not None:
+            dataset = dataset.take(max(0, stop - start))
+        if step != 1:
+            dataset = dataset._with_op("step", step=step)
+        return dataset
+
+    def skip(self, n: int) -> Self:
+        return self._with_op("skip", n=n)
+
+    def take(self, n: int) -> Self:
+        return self._with_op("take", n=n)
+
+    def shuffle(
+        self, seed: int, buffer_size: int = DEFAULT_SHUFFLE_BUFFER_SIZE
+    ) -> Self:
+        """Approximate shuffle through a bounded buffer of `buffer_size` rows."""
+        return self._with_op("shuffle", seed=seed, buffer_size=buffer_size)
+
+    def shard(self, num_shards: int, index: int) -> Self:
+        """Deterministic shard `index` of `num_shards`.
+
+        Whole source files are assigned when their count is divisible by
+        `num_shards`, otherwise rows are assigned round-robin.
+        """
+        if not 0 <= index < num_shards:
+            raise IndexError("Shard index out of range")
+        return self._with_op("shard", num_shards=num_shards, index=index)
+
+    def set_epoch(self, epoch: int) -> None:
+        # shuffle 시드를 epoch 마다 바꿈
+        self._dataset.set_epoch(epoch)
+
+    @override
+    def to_dict(self) -> dict:
+        if self._source is None:
+            raise ValueError("A streaming dataset without source cannot be serialized")
+        return {
+            **super().to_dict(),
+            "module": self._dataset_type.__module__,
+            "qualname": self._dataset_type.__qualname__,
+            "dataset_kwargs": self._dataset_kwargs,
+            "source": self._source,
+            "ops": [[name, kwargs] for name, kwargs in self._ops],
+            "batch_size": self._batch_size,
+            "buffer_size": self._buffer_size,
+        }
+
+    @override
+    def _sample(
+        self,
+        size: int,
+        start: int = 0,
+        rng: np.random.Generator | np.random.RandomState | None = None,
+    ) -> Self:
+        if rng is None or size == len(self) - start:
+            return self.slice(start, start + size)
+        seed = (
+            int(rng.integers(2**31)) if hasattr(rng, "integers") else rng.randint(2**31)
+        )
+        return self.slice(start).shuffle(seed=seed).take(size)
+
+    @staticmethod
+    @override
+    def from_dict(data: dict) -> Self:
+        from importlib import import_module
+        from functools import reduce
+
+        dataset_type = reduce(
+            getattr, data["qualname"].split("."), import_module(data["module"])
+        )
+        if not issubclass(dataset_type, HuggingFaceDataset):
+            raise TypeError(f"{dataset_type} is not a subclass of HuggingFaceDataset")
+
+        dataset = HuggingFaceIterableDataset(
+            load_dataset(**data["source"], streaming=True),
+            dataset_type,
+            sr=data["sr"],
+            task=tuple(data["task"]),
+            dataset_kwargs=data["dataset_kwargs"],
+            source=data["source"],
+            batch_size=data["batch_size"],
+            buffer_size=data["buffer_size"],
+        )
+        for name, kwargs in data["ops"]:
+            dataset = dataset._with_op(name, **kwargs)
+        return dataset
+
+    def _with_op(self, name: str, **kwargs) -> Self:
+        length = self._length
+        if name == "skip":
+            dataset = self._dataset.skip(kwargs["n"])
+            length = None if length is None else max(0, length - kwargs["n"])
+        elif name == "take":
+            dataset = self._dataset.take(kwargs["n"])
+            length = None if length is None else min(length, kwargs["n"])
+        elif name == "step":
+            step = kwargs["step"]
+            dataset = self._dataset.filter(
+                lambda _, i: i % step == 0, with_indices=True
+            )
+            length = None if length is None else -(-length // step)
+        elif name == "shuffle":
+            dataset = self._dataset.shuffle(
+                seed=kwargs["seed"], buffer_size=kwargs["buffer_size"]
+            )
+        elif name == "shard":
+            dataset = split_dataset_by_node(
+                self._dataset, rank=kwargs["index"], world_size=kwargs["num_shards"]
+            )
+            length = None
+        else:
+            raise ValueError(f"Unknown streaming operation: {name}")
+
+        args = self.args
+        args["dataset"] = dataset
+        args["ops"] = self._ops + [(name, kwargs)]
+        args["length"] = length
+        return type(self)(**args)
+
+    def _split_length(self) -> int | None:
+        splits = self._dataset.info.splits
+        split = self._dataset.split
+        if splits is None or split is None or str(split) not in splits:
+            return None
+        return splits[str(split)].num_examples or None
+
+    def _fill_buffer(self, size: int) -> None:
+        if size > self._buffer_size:
+            raise IndexError(
+                f"Index {size - 1} is beyond the first {self._buffer_size} rows "
+                "buffered for random access, iterate or use skip/take instead"
+            )
+        if self._buffer_iter is None:
+            self._buffer_iter = iter(self._dataset)
+        while len(self._buffer) < size:
+            try:
+                self._buffer.append(next(self._buffer_iter))
+            except StopIteration:
+                break
+
+    def _to_table(self, rows: dict[str, list] | list[dict[str, Any]]) -> DT:
+        features = self._dataset.features or None
+        if isinstance(rows, dict):
+            return DT.from_dict(rows, features=features)
+        return DT.from_list(rows, features=features)
+
+    def _materialize(self, table: DT) -> HuggingFaceDataset:
+        return self._dataset_type(table, self._sr, self.task, **self._dataset_kwargs)
+
+    @cached_property
+    def _parser(self) -> HuggingFaceDataset:
+        # 행 파싱과 오디오 디코딩에만 쓰는 빈 인스턴스
+        return self._materialize(
+            self._to_table({name: [] for name in self._dataset.features or {}})
+        )
+
+    def _to_sample(self, row: dict[str, Any]) -> Sample:
+        _id, Y = self._parser._parse_row(self._parser._flatten_row(row))
+        return Sample(
+            id=_id,
+            load_audio=partial(self._parser._load_audio, row[AUDIO_COLUMN]),
+            Y=Y,
+        )
+
+    @staticmethod
+    def _rows(batch: dict[str, list]) -> list[dict[str, Any]]:
+        return [dict(zip(batch, values)) for values in zip(*batch.values())]
+
+
+__all__ = ["HuggingFaceIterableDataset"]
@@ -2,15 +2,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import warnings
-import numpy as np
 
+from typing import Any
 from typing_extensions import override
-from functools import lru_cache
 
 from sjpy.string import normalize_text_only_en
-from sjaipy.datasets.dataset import Sample, Task
+from sjaipy.datasets.dataset import Task
 from sjaipy.datasets.hugging_face.dataset_loader import DatasetLoader
-from sjaipy.datasets.hugging_face.hugging_face_dataset import HuggingFaceDataset
+from sjaipy.datasets.hugging_face.hugging_face_iterable_dataset import (
+    HuggingFaceIterableDataset,
+)
+from sjaipy.datasets.hugging_face.hugging_face_dataset import (
+    HuggingFaceDataset,
+    AUDIO_PATH_COLUMN,
+)
 
 if TYPE_CHECKING:
     pass
@@ -23,26 +28,24 @@ DEFAULT_TASK = ("asr",)
 
 
 class KSPonSpeechDataset(HuggingFaceDataset):
+    @property
     @override
-    def get(self, idx: int) -> tuple[str, np.ndarray, str]:
-        data = self._dataset[idx]
-        _id = normalize_text_only_en(data["audio"]["path"])[-255:]
+    def _label_columns(self) -> tuple[str, ...]:
+        return (AUDIO_PATH_COLUMN, "transcripts")
 
-        def load_audio() -> np.ndarray:
-            return self._resample_audio(data["audio"]["array"]).astype(np.float32)
-
-        txt = data["transcripts"]
-        return Sample(id=_id, load_audio=load_audio, Y={"asr": txt})
+    @override
+    def _parse_row(self, row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        _id = normalize_text_only_en(row[AUDIO_PATH_COLUMN])[-255:]
+        return _id, {"asr": row["transcripts"]}
 
 
 class KSPonSpeech(DatasetLoader):
-    def __init__(self, path=DEFAULT_PATH):
-        super().__init__(path)
+    def __init__(self, path=DEFAULT_PATH, revision: str | None = None):
+        super().__init__(path, revision)
 
     def split_names(self, config_name: str = DEFAULT_CONFIG_NAME) -> list[str]:
         return super().split_names(config_name)
 
-    @lru_cache(maxsize=1)
     def train(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -50,11 +53,10 @@ class KSPonSpeech(DatasetLoader):
         task: tuple[Task, ...] = DEFAULT_TASK,
         **kwargs,
     ):
-        return KSPonSpeechDataset(
-            super().load(config_name, "train", **kwargs), sr, task
+        return self.load_split(
+            KSPonSpeechDataset, config_name, "train", sr, task, **kwargs
         )
 
-    @lru_cache(maxsize=1)
     def valid(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -62,11 +64,10 @@ class KSPonSpeech(DatasetLoader):
         task: tuple[Task, ...] = DEFAULT_TASK,
         **kwargs,
     ):
-        return KSPonSpeechDataset(
-            super().load(config_name, "valid", **kwargs), sr, task
+        return self.load_split(
+            KSPonSpeechDataset, config_name, "valid", sr, task, **kwargs
         )
 
-    @lru_cache(maxsize=1)
     def test(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -74,7 +75,25 @@ class KSPonSpeech(DatasetLoader):
         task: tuple[Task, ...] = DEFAULT_TASK,
         **kwargs,
     ):
-        return KSPonSpeechDataset(super().load(config_name, "test", **kwargs), sr, task)
+        return self.load_split(
+            KSPonSpeechDataset, config_name, "test", sr, task, **kwargs
+        )
+
+    def stream(
+        self,
+        split: str = "test",
+        config_name: str = DEFAULT_CONFIG_NAME,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        task: tuple[Task, ...] = DEFAULT_TASK,
+        **kwargs,
+    ) -> HuggingFaceIterableDataset:
+        return HuggingFaceIterableDataset(
+            super().stream(config_name, split, **kwargs),
+            KSPonSpeechDataset,
+            sr,
+            task,
+            source=self.source(config_name, split, **kwargs),
+        )
 
 
 if __name__ != "__main__":
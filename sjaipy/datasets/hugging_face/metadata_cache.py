@@ -0,0 +1,184 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import os
+import json
+import threading
+
+from pathlib import Path
+from datasets import config, get_dataset_config_names, get_dataset_split_names
+from huggingface_hub.errors import LocalEntryNotFoundError
+
+if TYPE_CHECKING:
+    pass
+
+DEFAULT_CACHE_PATH = (
+    Path(os.environ.get("SJAIPY_CACHE", Path.home() / ".cache" / "sjaipy"))
+    / "hf_metadata.json"
+)
+DEFAULT_REVISION = "main"
+# hub 에 닿지 못했을 때의 오류. 없는 데이터셋 등 다른 오류는 그대로 올림
+_UNREACHABLE_ERRORS = (ConnectionError, TimeoutError, LocalEntryNotFoundError)
+
+
+class MetadataCache:
+    """Persistent config/split names of hub datasets.
+
+    Lookups resolve in order from memory, from the JSON file at `path`, from
+    the `dataset_info.json` files of the local HF datasets cache and only
+    then from the hub. Hub answers are written back to `path`, so a dataset
+    needs network access at most once per (path, revision). `has_config` and
+    `has_split` accept locally known names without asking the hub, while
+    `config_names` and `split_names` return the local names without asking
+    when `HF_HUB_OFFLINE` is set, and fall back to them when the hub is
+    unreachable. An unreachable hub is not asked again for the same
+    (path, revision) by this instance.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] | None = None
+        self._unreachable: set[str] = set()
+
+    def config_names(self, path: str, revision: str | None = None) -> list[str]:
+        entry = self._entry(path, revision)
+        local = entry.get("configs") is not None
+        if not entry.get("complete") and not (local and self._offline(path, revision)):
+            try:
+                self.refresh(path, revision)
+            except OSError as e:
+                # hub 에 닿지 못하면 로컬 캐시에서 찾은 목록으로 대체
+                if not local or not self._mark_unreachable(e, path, revision):
+                    raise
+        return list(entry["configs"])
+
+    def split_names(
+        self, path: str, config_name: str, revision: str | None = None
+    ) -> list[str]:
+        entry = self._entry(path, revision)
+        local = config_name in entry.get("splits", {})
+        if config_name not in entry.get("complete_splits", ()) and not (
+            local and self._offline(path, revision)
+        ):
+            try:
+                self.refresh_splits(path, config_name, revision)
+            except OSError as e:
+                if not local or not self._mark_unreachable(e, path, revision):
+                    raise
+        return list(entry["splits"][config_name])
+
+    def has_config(
+        self, path: str, config_name: str, revision: str | None = None
+    ) -> bool:
+        entry = self._entry(path, revision)
+        if config_name in (entry.get("configs") or ()) or entry.get("complete"):
+            return config_name in entry["configs"]
+        # 로컬 캐시에 없는 config 만 hub 에서 갱신
+        self.refresh(path, revision)
+        return config_name in entry["configs"]
+
+    def has_split(
+        self, path: str, config_name: str, split: str, revision: str | None = None
+    ) -> bool:
+        entry = self._entry(path, revision)
+        splits = entry.get("splits", {}).get(config_name, ())
+        if split in splits or config_name in entry.get("complete_splits", ()):
+            return split in splits
+        self.refresh_splits(path, config_name, revision)
+        return split in entry["splits"][config_name]
+
+    def refresh(self, path: str, revision: str | None = None) -> None:
+        configs = get_dataset_config_names(path, revision=revision)
+        entry = self._entry(path, revision)
+        entry["configs"] = configs
+        entry["complete"] = True
+        self._save()
+
+    def refresh_splits(
+        self, path: str, config_name: str, revision: str | None = None
+    ) -> None:
+        splits = get_dataset_split_names(path, config_name, revision=revision)
+        entry = self._entry(path, revision)
+        entry.setdefault("splits", {})[config_name] = splits
+        complete_splits = entry.setdefault("complete_splits", [])
+        if config_name not in complete_splits:
+            complete_splits.append(config_name)
+        self._save()
+
+    def invalidate(self, path: str, revision: str | None = None) -> None:
+        with self._lock:
+            self._load().pop(self._key(path, revision), None)
+            self._unreachable.discard(self._key(path, revision))
+        self._save()
+
+    def _offline(self, path: str, revision: str | None) -> bool:
+        return config.HF_HUB_OFFLINE or self._key(path, revision) in self._unreachable
+
+    def _mark_unreachable(
+        self, error: BaseException, path: str, revision: str | None
+    ) -> bool:
+        # datasets 는 연결 오류를 FileNotFoundError 로 감싸므로 원인을 따라감
+        cause = error
+        while cause is not None and not isinstance(cause, _UNREACHABLE_ERRORS):
+            cause = cause.__cause__ or cause.__context__
+        if cause is None:
+            return False
+        self._unreachable.add(self._key(path, revision))
+        return True
+
+    def _entry(self, path: str, revision: str | None) -> dict:
+        key = self._key(path, revision)
+        with self._lock:
+            entries = self._load()
+            if key not in entries:
+                entries[key] = self._scan_local(path) if revision is None else {}
+            return entries[key]
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self._path.read_text(encoding="utf-8"))
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self._path.with_suffix(f".{os.getpid()}.tmp")
+            temp.write_text(json.dumps(self._load(), indent=2), encoding="utf-8")
+            os.replace(temp, self._path)
+
+    @staticmethod
+    def _key(path: str, revision: str | None) -> str:
+        return f"{path}@{revision or DEFAULT_REVISION}"
+
+    @staticmethod
+    def _scan_local(path: str) -> dict:
+        """Configs and splits already prepared in the local HF datasets cache.
+
+        Layout: `<HF_DATASETS_CACHE>/<namespace>___<name>/<config>/<version>/
+        <hash>/dataset_info.json`. The result may be partial, so it is only
+        trusted for names it contains.
+        """
+        root = Path(config.HF_DATASETS_CACHE) / path.replace("/", "___")
+        splits: dict[str, list[str]] = {}
+        for info_path in root.glob("*/*/*/dataset_info.json"):
+            try:
+                info = json.loads(info_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            name = info.get("config_name") or info_path.parents[2].name
+            splits.setdefault(name, [])
+            for split in info.get("splits") or {}:
+                if split not in splits[name]:
+                    splits[name].append(split)
+        if not splits:
+            return {}
+        return {"configs": sorted(splits), "splits": splits}
+
+
+METADATA_CACHE = MetadataCache()
+
+__all__ = ["MetadataCache", "METADATA_CACHE"]
@@ -2,15 +2,21 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import warnings
-import numpy as np
 
+from typing import Any
 from typing_extensions import override
-from functools import lru_cache
 from datasets import Dataset
 
-from sjaipy.datasets.hugging_face.hugging_face_dataset import HuggingFaceDataset
+from sjaipy.datasets.hugging_face.hugging_face_dataset import (
+    HuggingFaceDataset,
+    AUDIO_PATH_COLUMN,
+    AUDIO_BYTES_COLUMN,
+)
 from sjaipy.datasets.hugging_face.dataset_loader import DatasetLoader
-from sjaipy.datasets.dataset import Task, Sample
+from sjaipy.datasets.hugging_face.hugging_face_iterable_dataset import (
+    HuggingFaceIterableDataset,
+)
+from sjaipy.datasets.dataset import Task
 from sjpy.string import normalize_text_only_en
 
 if TYPE_CHECKING:
@@ -25,11 +31,16 @@ DEFAULT_TASK = ("asr",)
 
 class TedliumDataset(HuggingFaceDataset):
     def __init__(
-        self, dataset: Dataset, sr: int, task: list[Task], ignore_set: set[str]
+        self,
+        dataset: Dataset,
+        sr: int,
+        task: list[Task],
+        ignore_set: set[str],
+        preprocessed: dict[str, Any] | None = None,
     ):
-        super().__init__(dataset, sr, task)
+        super().__init__(dataset, sr, task, preprocessed)
         print("[WARN] 오디오가 연속적이지 않고 세그먼트로 나눠져 있음.")
-        self._ignore_set = ignore_set
+        self._ignore_set = set(ignore_set)
 
     @HuggingFaceDataset.args.getter
     @override
@@ -40,38 +51,49 @@ class TedliumDataset(HuggingFaceDataset):
         }
 
     @override
-    def get(self, idx: int) -> tuple[str, np.ndarray, str]:
-        data = self._dataset[idx]
-        _id = normalize_text_only_en(data["id"])[-255:]
+    def to_dict(self) -> dict:
+        return {
+            **super().to_dict(),
+            "ignore_set": sorted(self._ignore_set),
+        }
+
+    @property
+    @override
+    def _label_columns(self) -> tuple[str, ...]:
+        columns = ("id", "text", "speaker_id")
+        if "diarization" in self.task:
+            columns += (AUDIO_PATH_COLUMN, AUDIO_BYTES_COLUMN)
+        return columns
 
-        def load_audio() -> np.ndarray:
-            return self._resample_audio(data["audio"]["array"]).astype(np.float32)
+    @override
+    def _parse_row(self, row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        _id = normalize_text_only_en(row["id"])[-255:]
 
         result = {}
         if "asr" in self.task:
-            txt = data["text"]
+            txt = row["text"]
             if txt in self._ignore_set:
                 txt = ""
             result["asr"] = txt
         if "diarization" in self.task:
             diarization = []
-            if data["speaker_id"] not in self._ignore_set:
-                diarization.append(
-                    {"start": 0, "end": len(audio), "label": data["speaker_id"]}
+            if row["speaker_id"] not in self._ignore_set:
+                end = self._audio_duration(
+                    row[AUDIO_PATH_COLUMN], row[AUDIO_BYTES_COLUMN]
                 )
+                diarization.append({"start": 0, "end": end, "label": row["speaker_id"]})
             result["diarization"] = diarization
 
-        return Sample(id=_id, load_audio=load_audio, Y=result)
+        return _id, result
 
 
 class Tedlium(DatasetLoader):
-    def __init__(self, path=DEFAULT_PATH):
-        super().__init__(path)
+    def __init__(self, path=DEFAULT_PATH, revision: str | None = None):
+        super().__init__(path, revision)
 
     def split_names(self, config_name: str = DEFAULT_CONFIG_NAME) -> list[str]:
         return super().split_names(config_name)
 
-    @lru_cache(maxsize=1)
     def train(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -80,11 +102,16 @@ class Tedlium(DatasetLoader):
         ignore_set: set[str] = DEFAULT_IGNORE_SET,
         **kwargs,
     ):
-        return TedliumDataset(
-            super().load(config_name, "train", **kwargs), sr, task, ignore_set
+        return self.load_split(
+            TedliumDataset,
+            config_name,
+            "train",
+            sr,
+            task,
+            dataset_kwargs={"ignore_set": ignore_set},
+            **kwargs,
         )
 
-    @lru_cache(maxsize=1)
     def validation(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -93,11 +120,16 @@ class Tedlium(DatasetLoader):
         ignore_set: set[str] = DEFAULT_IGNORE_SET,
         **kwargs,
     ):
-        return TedliumDataset(
-            super().load(config_name, "validation", **kwargs), sr, task, ignore_set
+        return self.load_split(
+            TedliumDataset,
+            config_name,
+            "validation",
+            sr,
+            task,
+            dataset_kwargs={"ignore_set": ignore_set},
+            **kwargs,
         )
 
-    @lru_cache(maxsize=1)
     def test(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -106,8 +138,32 @@ class Tedlium(DatasetLoader):
         ignore_set: set[str] = DEFAULT_IGNORE_SET,
         **kwargs,
     ):
-        return TedliumDataset(
-            super().load(config_name, "test", **kwargs), sr, task, ignore_set
+        return self.load_split(
+            TedliumDataset,
+            config_name,
+            "test",
+            sr,
+            task,
+            dataset_kwargs={"ignore_set": ignore_set},
+            **kwargs,
+        )
+
+    def stream(
+        self,
+        split: str = "test",
+        config_name: str = DEFAULT_CONFIG_NAME,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        task: tuple[Task, ...] = DEFAULT_TASK,
+        ignore_set: set[str] = DEFAULT_IGNORE_SET,
+        **kwargs,
+    ) -> HuggingFaceIterableDataset:
+        return HuggingFaceIterableDataset(
+            super().stream(config_name, split, **kwargs),
+            TedliumDataset,
+            sr,
+            task,
+            dataset_kwargs={"ignore_set": ignore_set},
+            source=self.source(config_name, split, **kwargs),
         )
 
 
@@ -1,8 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-import numpy as np
-
+from typing import Any
 from typing_extensions import override
 from functools import lru_cache
 from datasets import Dataset
@@ -25,14 +24,15 @@ class VoxPopuliDataset(HuggingFaceDataset):
     def __init__(self, dataset: Dataset, sr: int, task: tuple[Task]):
         super().__init__(dataset, sr, task)
 
+    @property
+    @override
+    def _label_columns(self) -> tuple[str, ...]:
+        return ("audio_id", "raw_text")
+
     @override
-    def get(self, idx: int) -> tuple[str, np.ndarray, str]:
-        data = self._dataset[idx]
-        _id = normalize_text_only_en(data["audio_id"])[-255:]
-        audio = data["audio"]["array"]
-        audio = self._resample_audio(audio).astype(np.float32)
-        txt = data["raw_text"]
-        return _id, audio, txt
+    def _parse_row(self, row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        _id = normalize_text_only_en(row["audio_id"])[-255:]
+        return _id, {"asr": row["raw_text"]}
 
 
 class VoxPopuli(DatasetLoader):
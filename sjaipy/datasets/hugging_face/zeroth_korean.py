@@ -2,16 +2,22 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import warnings
-import numpy as np
 
+from typing import Any
 from typing_extensions import override
-from functools import lru_cache
 from datasets import Dataset
 
 from sjpy.string import normalize_text_only_en
-from sjaipy.datasets.dataset import Task, Sample
+from sjaipy.datasets.dataset import Task
 from sjaipy.datasets.hugging_face.dataset_loader import DatasetLoader
-from sjaipy.datasets.hugging_face.hugging_face_dataset import HuggingFaceDataset
+from sjaipy.datasets.hugging_face.hugging_face_iterable_dataset import (
+    HuggingFaceIterableDataset,
+)
+from sjaipy.datasets.hugging_face.hugging_face_dataset import (
+    HuggingFaceDataset,
+    AUDIO_PATH_COLUMN,
+    AUDIO_BYTES_COLUMN,
+)
 
 if TYPE_CHECKING:
     pass
@@ -24,39 +30,50 @@ DEFAULT_TASK = ("asr",)
 
 
 class ZerothKoreanDataset(HuggingFaceDataset):
-    def __init__(self, dataset: Dataset, sr: int, task: tuple[Task]):
-        super().__init__(dataset, sr, task)
+    def __init__(
+        self,
+        dataset: Dataset,
+        sr: int,
+        task: tuple[Task],
+        preprocessed: dict[str, Any] | None = None,
+    ):
+        super().__init__(dataset, sr, task, preprocessed)
 
+    @property
     @override
-    def get(self, idx: int) -> tuple[str, np.ndarray, str]:
-        data = self._dataset[idx]
-        _id = normalize_text_only_en(data["path"])[-255:]
+    def _label_columns(self) -> tuple[str, ...]:
+        columns = ("path", "text", "speaker_id")
+        if "diarization" in self.task:
+            columns += (AUDIO_PATH_COLUMN, AUDIO_BYTES_COLUMN)
+        return columns
 
-        def load_audio() -> np.ndarray:
-            return self._resample_audio(data["audio"]["array"]).astype(np.float32)
+    @override
+    def _parse_row(self, row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        _id = normalize_text_only_en(row["path"])[-255:]
 
         result = {}
         if "asr" in self.task:
-            result["asr"] = data["text"]
+            result["asr"] = row["text"]
         if "diarization" in self.task:
             result["diarization"] = [
                 {
                     "start": 0,
-                    "end": len(audio),
-                    "label": data["speaker_id"],
+                    "end": self._audio_duration(
+                        row[AUDIO_PATH_COLUMN], row[AUDIO_BYTES_COLUMN]
+                    ),
+                    "label": row["speaker_id"],
                 }
             ]
-        return Sample(id=_id, load_audio=load_audio, Y=result)
+        return _id, result
 
 
 class ZerothKorean(DatasetLoader):
-    def __init__(self, path=DEFAULT_PATH):
-        super().__init__(path)
+    def __init__(self, path=DEFAULT_PATH, revision: str | None = None):
+        super().__init__(path, revision)
 
     def split_names(self, config_name: str = DEFAULT_CONFIG_NAME) -> list[str]:
         return super().split_names(config_name)
 
-    @lru_cache(maxsize=1)
     def train(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -64,11 +81,10 @@ class ZerothKorean(DatasetLoader):
         task: tuple[Task, ...] = DEFAULT_TASK,
         **kwargs,
     ):
-        return ZerothKoreanDataset(
-            super().load(config_name, "train", **kwargs), sr, task
+        return self.load_split(
+            ZerothKoreanDataset, config_name, "train", sr, task, **kwargs
         )
 
-    @lru_cache(maxsize=1)
     def test(
         self,
         config_name: str = DEFAULT_CONFIG_NAME,
@@ -76,8 +92,24 @@ class ZerothKorean(DatasetLoader):
         task: tuple[Task, ...] = DEFAULT_TASK,
         **kwargs,
     ):
-        return ZerothKoreanDataset(
-            super().load(config_name, "test", **kwargs), sr, task
+        return self.load_split(
+            ZerothKoreanDataset, config_name, "test", sr, task, **kwargs
+        )
+
+    def stream(
+        self,
+        split: str = "test",
+        config_name: str = DEFAULT_CONFIG_NAME,
+        sr: int = DEFAULT_SAMPLE_RATE,
+        task: tuple[Task, ...] = DEFAULT_TASK,
+        **kwargs,
+    ) -> HuggingFaceIterableDataset:
+        return HuggingFaceIterableDataset(
+            super().stream(config_name, split, **kwargs),
+            ZerothKoreanDataset,
+            sr,
+            task,
+            source=self.source(config_name, split, **kwargs),
         )
 
 
@@ -7,6 +7,7 @@ from lhotse import RecordingSet, SupervisionSet, SupervisionSegment, Recording
 from typing import Sequence
 from typing_extensions import override, Self
 
+from sjaipy.audio import resample
 from sjaipy.datasets.dataset import Dataset, Sample, Task
 
 if TYPE_CHECKING:
@@ -28,13 +29,6 @@ class LHotseDataset(Dataset):
         self.recordings = recordings
         self.segments = segments
 
-    @Dataset.sr.setter
-    @override
-    def sr(self, value: int):
-        if value != self._sr:
-            self.recordings = [(rec.resample(value), ch) for rec, ch in self.recordings]
-            self._sr = value
-
     @Dataset.args.getter
     @override
     def args(self) -> dict:
@@ -87,7 +81,7 @@ class LHotseDataset(Dataset):
         def load_audio() -> np.ndarray:
             wav = rec.load_audio(channels=channel)
             assert len(wav) == 1, "wav must be mono"
-            return wav[0]
+            return resample(wav[0], rec.sampling_rate, self._sr)
 
         segments = self.segments[idx]
         result = {}
@@ -104,6 +98,11 @@ class LHotseDataset(Dataset):
             Y=result,
         )
 
+    @override
+    def durations(self, num_proc: int | None = None) -> list[float]:
+        # 매니페스트 길이 사용
+        return [rec.duration for rec, _ in self.recordings]
+
     @staticmethod
     def from_recording_supervision(
         recording_set: RecordingSet,
@@ -115,7 +114,6 @@ class LHotseDataset(Dataset):
         segments = []
 
         for rec in recording_set:
-            rec = rec if rec.sampling_rate == sr else rec.resample(sr)
             for c in rec.channel_ids:
                 rec_segments = list(
                     supervision_set.find(recording_id=rec.id, channel=c)
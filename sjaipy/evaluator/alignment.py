@@ -0,0 +1,238 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from typing import NamedTuple, Sequence
+
+if TYPE_CHECKING:
+    pass
+
+# sclite 기본 가중치
+CORRECT_COST = 0
+SUBSTITUTION_COST = 4
+DELETION_COST = 3
+INSERTION_COST = 3
+
+# 정렬 연산 코드
+CORRECT = 0
+SUBSTITUTION = 1
+DELETION = 2
+INSERTION = 3
+
+DEFAULT_BATCH_SIZE = 256
+# 한 배치의 최대 DP 칸 수, 역추적 정보는 칸당 2비트라 16MB
+DEFAULT_MAX_CELLS = 2**26
+
+
+class AlignmentCounts(NamedTuple):
+    correct: int
+    substitutions: int
+    deletions: int
+    insertions: int
+
+    @property
+    def errors(self) -> int:
+        return self.substitutions + self.deletions + self.insertions
+
+
+def cost_matrices(ref: np.ndarray, hyp: np.ndarray) -> np.ndarray:
+    """sclite 가중치(sub 4, del 3, ins 3)의 누적 비용 행렬을 배치로 계산하는 함수
+
+    한 행 안의 삽입 의존성은 `D[i, j] = 3j + min_{k<=j}(C[k] - 3k)` 로 풀어
+    `np.minimum.accumulate` 한 번으로 계산하고, 배치의 모든 문장을 한 번에
+    진행하므로 파이썬 루프는 가장 긴 ref 길이만큼만 돈다.
+    패딩은 뒤쪽에만 있어 각 문장의 `D[b, :n + 1, :m + 1]` 에는 영향이 없다.
+    정렬에는 전체 행렬 대신 2비트 역추적 정보만 쓰므로 검증/분석용이다.
+
+    Args:
+        ref (np.ndarray): (B, N) 크기의 정답 토큰 id 배열
+        hyp (np.ndarray): (B, M) 크기의 예측 토큰 id 배열
+
+    Returns:
+        np.ndarray: (B, N + 1, M + 1) 크기의 비용 행렬
+    """
+    costs = np.empty((ref.shape[0], ref.shape[1] + 1, hyp.shape[1] + 1), np.int32)
+    _forward(ref, hyp, costs)
+    return costs
+
+
+def cost_matrix(ref: Sequence[int], hyp: Sequence[int]) -> np.ndarray:
+    ref = np.asarray(ref, dtype=np.int64).reshape(1, -1)
+    hyp = np.asarray(hyp, dtype=np.int64).reshape(1, -1)
+    return cost_matrices(ref, hyp)[0]
+
+
+def align_batch(
+    refs: Sequence[Sequence[int]],
+    hyps: Sequence[Sequence[int]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_cells: int = DEFAULT_MAX_CELLS,
+) -> list[np.ndarray]:
+    """문장 쌍마다 최소 비용 정렬 연산 순서를 구하는 함수
+
+    길이가 비슷한 문장끼리 묶어 동적 계획법과 역추적을 모두 배치 단위로
+    벡터화한다. 비용은 두 행만 유지하고 칸마다 2비트 역추적 정보만 저장하며,
+    한 배치의 패딩 포함 칸 수가 `max_cells` 를 넘지 않게 묶는다. 한 쌍만으로
+    `max_cells` 를 넘는 긴 쌍(세션 단위 CER 등)은 따로 정렬한다.
+    비용이 같은 경로가 여럿이면 대각(일치/치환), 삭제, 삽입 순으로 선택한다.
+
+    Args:
+        refs (Sequence[Sequence[int]]): 문장별 정답 토큰 id
+        hyps (Sequence[Sequence[int]]): 문장별 예측 토큰 id
+        batch_size (int, optional): 한 번에 정렬할 최대 문장 수. Defaults to 256.
+        max_cells (int, optional): 한 배치의 최대 (N + 1) x (M + 1) 칸 수 합.
+            역추적 정보는 칸당 2비트다. Defaults to 2**26.
+
+    Returns:
+        list[np.ndarray]: 입력 순서대로의 연산 코드 (CORRECT, SUBSTITUTION, DELETION, INSERTION)
+    """
+    if len(refs) != len(hyps):
+        raise ValueError("refs and hyps must have the same length")
+
+    ref_lens = np.array([len(r) for r in refs], dtype=np.int64)
+    hyp_lens = np.array([len(h) for h in hyps], dtype=np.int64)
+    # 패딩을 줄이도록 길이순으로 묶음
+    order = np.lexsort((hyp_lens, ref_lens))
+
+    result: list[np.ndarray] = [None] * len(refs)
+    for indices in _batches(order, ref_lens, hyp_lens, batch_size, max_cells):
+        ops = _align_padded(
+            [refs[k] for k in indices],
+            [hyps[k] for k in indices],
+            ref_lens[indices],
+            hyp_lens[indices],
+        )
+        for k, op in zip(indices, ops):
+            result[k] = op
+    return result
+
+
+def align(ref: Sequence[int], hyp: Sequence[int]) -> np.ndarray:
+    return align_batch([ref], [hyp])[0]
+
+
+def count_ops(ops: np.ndarray) -> AlignmentCounts:
+    counts = np.bincount(ops, minlength=4)
+    return AlignmentCounts(
+        correct=int(counts[CORRECT]),
+        substitutions=int(counts[SUBSTITUTION]),
+        deletions=int(counts[DELETION]),
+        insertions=int(counts[INSERTION]),
+    )
+
+
+def _pad(sequences: list[Sequence[int]], length: int, fill: int) -> np.ndarray:
+    padded = np.full((len(sequences), length), fill, dtype=np.int64)
+    for b, seq in enumerate(sequences):
+        padded[b, : len(seq)] = seq
+    return padded
+
+
+def _batches(
+    order: np.ndarray,
+    ref_lens: np.ndarray,
+    hyp_lens: np.ndarray,
+    batch_size: int,
+    max_cells: int,
+) -> list[np.ndarray]:
+    # 패딩 포함 칸 수 B x (max N + 1) x (max M + 1) 가 max_cells 이하가 되도록 자름
+    batches, start = [], 0
+    while start < len(order):
+        end, n, m = start + 1, ref_lens[order[start]], hyp_lens[order[start]]
+        while end < len(order) and end - start < batch_size:
+            n_next = max(n, ref_lens[order[end]])
+            m_next = max(m, hyp_lens[order[end]])
+            if (end - start + 1) * (n_next + 1) * (m_next + 1) > max_cells:
+                break
+            end, n, m = end + 1, n_next, m_next
+        batches.append(order[start:end])
+        start = end
+    return batches
+
+
+def _pack(row_ops: np.ndarray) -> np.ndarray:
+    # (B, 4w) 연산 코드를 한 바이트에 네 칸씩 담음
+    r = row_ops.reshape(row_ops.shape[0], -1, 4)
+    return r[..., 0] | (r[..., 1] << 2) | (r[..., 2] << 4) | (r[..., 3] << 6)
+
+
+def _forward(
+    ref: np.ndarray, hyp: np.ndarray, costs: np.ndarray | None = None
+) -> np.ndarray:
+    # 칸마다 그 칸에 도달한 연산 코드를 2비트로 담은 (B, N + 1, ceil((M + 1) / 4)) 배열
+    batch, n = ref.shape
+    m = hyp.shape[1]
+    width = (m + 4) // 4
+    pointers = np.empty((batch, n + 1, width), dtype=np.uint8)
+    row_ops = np.full((batch, 4 * width), INSERTION, dtype=np.uint8)
+    pointers[:, 0] = _pack(row_ops)
+
+    ramp = np.arange(m + 1, dtype=np.int32) * INSERTION_COST
+    prev = np.broadcast_to(ramp, (batch, m + 1)).copy()
+    if costs is not None:
+        costs[:, 0] = prev
+    candidate = np.empty((batch, m + 1), dtype=np.int32)
+    substitution = np.int32(SUBSTITUTION_COST)
+    for i in range(1, n + 1):
+        same = ref[:, i - 1, None] == hyp
+        diagonal = prev[:, :-1] + np.where(same, np.int32(CORRECT_COST), substitution)
+        deletion = prev[:, 1:] + DELETION_COST
+        candidate[:, 0] = prev[:, 0] + DELETION_COST
+        np.minimum(diagonal, deletion, out=candidate[:, 1:])
+        row = np.minimum.accumulate(candidate - ramp, axis=1) + ramp
+
+        row_ops[:, 0] = DELETION
+        row_ops[:, 1 : m + 1] = np.where(
+            row[:, 1:] == diagonal,
+            np.where(same, CORRECT, SUBSTITUTION),
+            np.where(row[:, 1:] == deletion, DELETION, INSERTION),
+        )
+        pointers[:, i] = _pack(row_ops)
+        if costs is not None:
+            costs[:, i] = row
+        prev = row
+    return pointers
+
+
+def _align_padded(
+    refs: list[Sequence[int]],
+    hyps: list[Sequence[int]],
+    ref_lens: np.ndarray,
+    hyp_lens: np.ndarray,
+) -> list[np.ndarray]:
+    # 빈 문장도 역추적에서 인덱싱할 수 있도록 최소 한 칸은 둠
+    ref = _pad(refs, max(int(ref_lens.max()), 1), -1)
+    hyp = _pad(hyps, max(int(hyp_lens.max()), 1), -2)
+    pointers = _forward(ref, hyp)
+
+    # 모든 문장을 끝에서부터 한 칸씩 동시에 역추적
+    batch = np.arange(len(refs))
+    i, j = ref_lens.copy(), hyp_lens.copy()
+    steps = int((ref_lens + hyp_lens).max())
+    ops = np.zeros((len(refs), steps), dtype=np.uint8)
+    num_ops = np.zeros(len(refs), dtype=np.int64)
+    for step in range(steps):
+        active = (i > 0) | (j > 0)
+        if not active.any():
+            break
+        op = (pointers[batch, i, j >> 2] >> ((j & 3) * 2).astype(np.uint8)) & 3
+        ops[:, step] = op
+        num_ops += active
+        i -= active & (op != INSERTION)
+        j -= active & (op != DELETION)
+    return [ops[b, : num_ops[b]][::-1].copy() for b in batch]
+
+
+__all__ = [
+    "AlignmentCounts",
+    "cost_matrices",
+    "cost_matrix",
+    "align_batch",
+    "align",
+    "count_ops",
+    "CORRECT",
+    "SUBSTITUTION",
+    "DELETION",
+    "INSERTION",
+]
@@ -0,0 +1,293 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pathlib import Path
+from functools import cached_property
+from typing import Callable, Iterable, Mapping, Sequence
+
+from sjaipy.evaluator.sclite_utils import TRNFormat
+from sjaipy.evaluator.scorer import WORD, encode_pairs, summary_dict
+from sjaipy.evaluator.alignment import (
+    CORRECT,
+    SUBSTITUTION,
+    DELETION,
+    INSERTION,
+    AlignmentCounts,
+    align_batch,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# 정렬에서 빠진 쪽 토큰
+NO_TOKEN = -1
+
+
+class AlignmentTable:
+    """모든 발화의 정렬 결과를 CSR 형태로 담은 표
+
+    발화 `k` 의 정렬은 `offsets[k]:offsets[k + 1]` 구간이며, 위치마다 연산 코드와
+    ref/hyp 토큰 id 를 가진다. 삽입 위치의 ref 토큰과 삭제 위치의 hyp 토큰은
+    `NO_TOKEN` 이다. 토큰 문자열은 `vocab[token_id]`.
+    sclite 의 dtl/sgml 보고서를 다시 파싱하지 않고 오류를 분석하기 위한 구조다.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        vocab: Sequence[str],
+        offsets: np.ndarray,
+        ops: np.ndarray,
+        ref_tokens: np.ndarray,
+        hyp_tokens: np.ndarray,
+    ):
+        if len(offsets) != len(ids) + 1:
+            raise ValueError("offsets must have one more entry than ids")
+        if not (len(ops) == len(ref_tokens) == len(hyp_tokens) == offsets[-1]):
+            raise ValueError("ops, ref_tokens and hyp_tokens must match offsets")
+        self._ids = list(ids)
+        self._vocab = list(vocab)
+        self._index = {id: k for k, id in enumerate(self._ids)}
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._ops = np.asarray(ops, dtype=np.uint8)
+        self._ref_tokens = np.asarray(ref_tokens, dtype=np.int32)
+        self._hyp_tokens = np.asarray(hyp_tokens, dtype=np.int32)
+
+    @property
+    def ids(self) -> list[str]:
+        return self._ids
+
+    @property
+    def vocab(self) -> list[str]:
+        return self._vocab
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return self._offsets
+
+    @property
+    def ops(self) -> np.ndarray:
+        return self._ops
+
+    @property
+    def ref_tokens(self) -> np.ndarray:
+        return self._ref_tokens
+
+    @property
+    def hyp_tokens(self) -> np.ndarray:
+        return self._hyp_tokens
+
+    @cached_property
+    def utterance_index(self) -> np.ndarray:
+        """위치별 발화 번호"""
+        return np.repeat(np.arange(len(self._ids)), np.diff(self._offsets))
+
+    @cached_property
+    def counts(self) -> np.ndarray:
+        """(발화 수, 4) 크기의 발화별 (correct, substitutions, deletions, insertions)"""
+        codes = self.utterance_index * 4 + self._ops
+        return np.bincount(codes, minlength=len(self._ids) * 4).reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def utterance_counts(self, id: str) -> AlignmentCounts:
+        return AlignmentCounts(*(int(c) for c in self.counts[self._index[id]]))
+
+    def utterance(self, id: str) -> list[tuple[str | None, str | None, int]]:
+        """발화 하나의 (ref 토큰, hyp 토큰, 연산 코드) 목록"""
+        k = self._index[id]
+        start, end = self._offsets[k], self._offsets[k + 1]
+        return [
+            (self._token(r), self._token(h), int(op))
+            for r, h, op in zip(
+                self._ref_tokens[start:end].tolist(),
+                self._hyp_tokens[start:end].tolist(),
+                self._ops[start:end].tolist(),
+            )
+        ]
+
+    def summary(self) -> dict[str, int | float]:
+        """parse_sclite_summary 와 같은 키의 전체 결과"""
+        return self._summary(self.counts)
+
+    def breakdown(
+        self, groups: Mapping[str, str] | Callable[[str], str]
+    ) -> dict[str, dict[str, int | float]]:
+        """발화를 화자, 데이터셋 등으로 묶어 그룹별 결과를 구하는 함수
+
+        Args:
+            groups (Mapping[str, str] | Callable[[str], str]): id -> 그룹 이름.
+                예) `lambda id: id.split("_")[0]`
+
+        Returns:
+            dict[str, dict[str, int | float]]: 그룹별 parse_sclite_summary 형식 결과
+        """
+        lookup = groups.__getitem__ if isinstance(groups, Mapping) else groups
+        names, inverse = np.unique(
+            np.array([str(lookup(id)) for id in self._ids], dtype=str),
+            return_inverse=True,
+        )
+        inverse = inverse.reshape(-1)
+
+        counts = self.counts
+        totals = np.zeros((len(names), 4), dtype=np.int64)
+        np.add.at(totals, inverse, counts)
+        num_sentences = np.bincount(inverse, minlength=len(names))
+        sentence_errors = np.bincount(
+            inverse, weights=counts[:, 1:].sum(axis=1) > 0, minlength=len(names)
+        )
+        return {
+            str(name): summary_dict(
+                int(num_sentences[g]),
+                int(sentence_errors[g]),
+                AlignmentCounts(*(int(c) for c in totals[g])),
+            )
+            for g, name in enumerate(names)
+        }
+
+    def confusions(
+        self,
+        top: int = 20,
+        ops: Iterable[int] = (SUBSTITUTION,),
+    ) -> list[tuple[str | None, str | None, int]]:
+        """가장 많은 (ref 토큰, hyp 토큰) 오류 쌍
+
+        Args:
+            top (int, optional): 반환할 쌍 수. Defaults to 20.
+            ops (Iterable[int], optional): 포함할 연산. 삭제는 (ref, None),
+                삽입은 (None, hyp) 로 나온다. Defaults to (SUBSTITUTION,).
+
+        Returns:
+            list[tuple[str | None, str | None, int]]: 빈도 내림차순의 (ref, hyp, 횟수)
+        """
+        mask = np.isin(self._ops, list(ops))
+        width = len(self._vocab) + 1
+        codes = (self._ref_tokens[mask].astype(np.int64) + 1) * width + (
+            self._hyp_tokens[mask] + 1
+        )
+        pairs, frequencies = np.unique(codes, return_counts=True)
+        order = np.argsort(-frequencies, kind="stable")[:top]
+        return [
+            (
+                self._token(int(pairs[k] // width) - 1),
+                self._token(int(pairs[k] % width) - 1),
+                int(frequencies[k]),
+            )
+            for k in order
+        ]
+
+    def to_arrow(self) -> pa.Table:
+        """발화당 한 행의 Arrow 표. ref/hyp 토큰은 사전 인코딩된 리스트 열이다."""
+        import pyarrow as pa
+
+        offsets = pa.array(self._offsets.astype(np.int32))
+        vocab = pa.array(self._vocab, type=pa.string())
+
+        def tokens(values: np.ndarray) -> pa.Array:
+            indices = pa.array(values, mask=values == NO_TOKEN)
+            return pa.ListArray.from_arrays(
+                offsets, pa.DictionaryArray.from_arrays(indices, vocab)
+            )
+
+        counts = self.counts
+        return pa.table(
+            {
+                "id": pa.array(self._ids, type=pa.string()),
+                "ops": pa.ListArray.from_arrays(offsets, pa.array(self._ops)),
+                "ref": tokens(self._ref_tokens),
+                "hyp": tokens(self._hyp_tokens),
+                "correct": counts[:, CORRECT],
+                "substitutions": counts[:, SUBSTITUTION],
+                "deletions": counts[:, DELETION],
+                "insertions": counts[:, INSERTION],
+            }
+        )
+
+    def save(self, path: Path) -> None:
+        # 파일 객체로 넘겨야 savez 가 `.npz` 를 덧붙이지 않아 load 와 같은 경로가 됨
+        with Path(path).open("wb") as fout:
+            np.savez_compressed(
+                fout,
+                ids=np.array(self._ids, dtype=str),
+                vocab=np.array(self._vocab, dtype=str),
+                offsets=self._offsets,
+                ops=self._ops,
+                ref_tokens=self._ref_tokens,
+                hyp_tokens=self._hyp_tokens,
+            )
+
+    def _token(self, token: int) -> str | None:
+        return self._vocab[token] if token != NO_TOKEN else None
+
+    def _summary(self, counts: np.ndarray) -> dict[str, int | float]:
+        return summary_dict(
+            len(counts),
+            int((counts[:, 1:].sum(axis=1) > 0).sum()),
+            AlignmentCounts(*(int(c) for c in counts.sum(axis=0))),
+        )
+
+    @staticmethod
+    def load(path: Path) -> AlignmentTable:
+        with np.load(path) as data:
+            return AlignmentTable(
+                ids=data["ids"].tolist(),
+                vocab=data["vocab"].tolist(),
+                offsets=data["offsets"],
+                ops=data["ops"],
+                ref_tokens=data["ref_tokens"],
+                hyp_tokens=data["hyp_tokens"],
+            )
+
+
+def align_trn(
+    ref: Path | Iterable[TRNFormat],
+    hyp: Path | Iterable[TRNFormat],
+    ignore_case: bool = True,
+    unit: str = WORD,
+    ignore_spacing: bool = False,
+) -> AlignmentTable:
+    """score_trn 과 같은 정렬을 수행해 발화별 상세 결과를 반환하는 함수
+
+    Args:
+        ref (Path | Iterable[TRNFormat]): 정답 trn 파일 경로 또는 TRNFormat 객체의 iterable
+        hyp (Path | Iterable[TRNFormat]): 예측 trn 파일 경로 또는 TRNFormat 객체의 iterable
+        ignore_case (bool, optional): 대소문자 구분 여부. Defaults to True.
+        unit (str, optional): 채점 단위 (`word`, `char`, `jamo`). Defaults to "word".
+        ignore_spacing (bool, optional): 띄어쓰기 무시 여부. Defaults to False.
+
+    Returns:
+        AlignmentTable: ref 순서대로의 정렬 표
+    """
+    ids, vocab, refs, hyps = encode_pairs(ref, hyp, ignore_case, unit, ignore_spacing)
+    ops = align_batch(refs, hyps)
+
+    offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum([len(op) for op in ops], out=offsets[1:])
+    flat_ops = np.concatenate(ops) if ops else np.zeros(0, dtype=np.uint8)
+
+    # 발화를 이어 붙이면 연산이 소비한 토큰 수의 누적합이 곧 이어 붙인 토큰 배열의 위치
+    def tokens(sequences: list[list[int]], consumed: np.ndarray) -> np.ndarray:
+        flat = np.fromiter(
+            (t for seq in sequences for t in seq),
+            dtype=np.int32,
+            count=sum(len(seq) for seq in sequences),
+        )
+        position = np.cumsum(consumed) - 1
+        result = np.full(len(consumed), NO_TOKEN, dtype=np.int32)
+        result[consumed] = flat[position[consumed]]
+        return result
+
+    return AlignmentTable(
+        ids=ids,
+        vocab=list(vocab),
+        offsets=offsets,
+        ops=flat_ops,
+        ref_tokens=tokens(refs, flat_ops != INSERTION),
+        hyp_tokens=tokens(hyps, flat_ops != DELETION),
+    )
+
+
+__all__ = ["AlignmentTable", "align_trn", "NO_TOKEN"]
@@ -0,0 +1,201 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from typing import Mapping, NamedTuple
+
+from sjaipy.evaluator.alignment import AlignmentCounts
+
+if TYPE_CHECKING:
+    pass
+
+DEFAULT_NUM_RESAMPLES = 10_000
+DEFAULT_CONFIDENCE = 0.95
+# 한 번에 만드는 재표본 수, (chunk, 고유 쌍 수) 크기의 횟수 행렬 메모리를 제한
+_CHUNK_SIZE = 1_000
+
+
+class BootstrapInterval(NamedTuple):
+    wer_percent: float
+    low: float
+    high: float
+    std: float
+
+
+class PairedBootstrapResult(NamedTuple):
+    # a - b, 음수면 a 가 더 좋음
+    delta_percent: float
+    low: float
+    high: float
+    p_value: float
+    a_better_percent: float
+
+
+def utterance_counts(
+    counts: Mapping[str, AlignmentCounts],
+) -> tuple[np.ndarray, np.ndarray]:
+    """score_pairs 결과를 발화별 (오류 수, 정답 길이) 배열로 바꾸는 함수"""
+    data = np.array(
+        [
+            (c.errors, c.correct + c.substitutions + c.deletions)
+            for c in counts.values()
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    return data[:, 0], data[:, 1]
+
+
+def bootstrap_wer(
+    errors: np.ndarray,
+    lengths: np.ndarray,
+    num_resamples: int = DEFAULT_NUM_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    rng: np.random.Generator | np.random.RandomState | None = None,
+) -> BootstrapInterval:
+    """발화 단위 bootstrap 으로 WER 의 신뢰 구간을 구하는 함수
+
+    발화를 복원 추출하는 대신 같은 (오류 수, 길이) 쌍을 한 묶음으로 보고 묶음별
+    추출 횟수를 다항분포로 한 번에 뽑는다. 텍스트는 쓰지 않으며 시간은 발화 수가
+    아니라 재표본 수 x 고유 쌍 수에 비례한다. 예를 들어 10만 발화라도 20단어 이하의
+    짧은 발화라 고유 쌍이 100여 개면 1만 번 재표본이 0.1초 정도지만, 200단어까지의
+    긴 발화로 고유 쌍이 3천여 개면 4초 정도 걸린다.
+
+    Args:
+        errors (np.ndarray): 발화별 오류 수 (S + D + I)
+        lengths (np.ndarray): 발화별 정답 토큰 수
+        num_resamples (int, optional): 재표본 수. Defaults to 10_000.
+        confidence (float, optional): 신뢰 수준. Defaults to 0.95.
+        rng (np.random.Generator | np.random.RandomState | None, optional): 난수 생성기
+
+    Returns:
+        BootstrapInterval: 전체 WER 과 백분위 신뢰 구간, 표준 오차 (백분율)
+    """
+    errors, lengths = _as_counts(errors, lengths)
+    estimate = _ratio(errors.sum(), lengths.sum())
+    samples = _resample(errors, lengths, num_resamples, rng)
+    low, high = _percentiles(samples, confidence)
+    return BootstrapInterval(estimate, low, high, float(samples.std(ddof=1)))
+
+
+def paired_bootstrap(
+    errors_a: np.ndarray,
+    errors_b: np.ndarray,
+    lengths: np.ndarray,
+    num_resamples: int = DEFAULT_NUM_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    rng: np.random.Generator | np.random.RandomState | None = None,
+) -> PairedBootstrapResult:
+    """같은 발화에 대한 두 전사 결과의 WER 차이를 paired bootstrap 으로 검정하는 함수
+
+    재표본마다 두 시스템에 같은 발화 묶음을 쓰며, (a 오류 - b 오류, 길이) 의 고유
+    조합별로 추출 횟수를 뽑는다.
+
+    Args:
+        errors_a (np.ndarray): 시스템 a 의 발화별 오류 수
+        errors_b (np.ndarray): 시스템 b 의 발화별 오류 수
+        lengths (np.ndarray): 발화별 정답 토큰 수
+        num_resamples (int, optional): 재표본 수. Defaults to 10_000.
+        confidence (float, optional): 신뢰 수준. Defaults to 0.95.
+        rng (np.random.Generator | np.random.RandomState | None, optional): 난수 생성기
+
+    Returns:
+        PairedBootstrapResult: WER 차이(a - b)와 신뢰 구간, 양측 p-value,
+            a 가 더 좋은 재표본 비율 (백분율)
+    """
+    errors_a, lengths = _as_counts(errors_a, lengths)
+    errors_b, _ = _as_counts(errors_b, lengths)
+    estimate = _ratio(errors_a.sum() - errors_b.sum(), lengths.sum())
+    # 차이만 필요하므로 (a 오류 - b 오류, 길이) 로 묶음
+    samples = _resample(errors_a - errors_b, lengths, num_resamples, rng)
+    low, high = _percentiles(samples, confidence)
+    # 차이가 0 인 쪽으로 넘어간 재표본 비율의 두 배
+    p_value = min(1.0, 2 * min(np.mean(samples >= 0), np.mean(samples <= 0)))
+    return PairedBootstrapResult(
+        estimate, low, high, float(p_value), float(100 * np.mean(samples < 0))
+    )
+
+
+def paired_counts(
+    a: Mapping[str, AlignmentCounts], b: Mapping[str, AlignmentCounts]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """같은 ref 로 채점한 두 score_pairs 결과를 id 순서를 맞춰 배열로 바꾸는 함수
+
+    Raises:
+        ValueError: id 가 다르거나 같은 id 의 정답 길이가 다를 때
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: (a 오류 수, b 오류 수, 정답 길이)
+    """
+    if a.keys() != b.keys():
+        raise ValueError("a and b must be scored on the same ids")
+    errors_a, lengths_a = utterance_counts(a)
+    errors_b, lengths_b = utterance_counts({id: b[id] for id in a})
+    if not np.array_equal(lengths_a, lengths_b):
+        raise ValueError("a and b must be scored against the same references")
+    return errors_a, errors_b, lengths_a
+
+
+def _as_counts(
+    errors: np.ndarray, lengths: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    errors = np.asarray(errors, dtype=np.int64).reshape(-1)
+    lengths = np.asarray(lengths, dtype=np.int64).reshape(-1)
+    if errors.shape != lengths.shape:
+        raise ValueError("errors and lengths must have the same length")
+    if len(errors) == 0:
+        raise ValueError("At least one utterance is required")
+    return errors, lengths
+
+
+def _resample(
+    numerators: np.ndarray,
+    denominators: np.ndarray,
+    num_resamples: int,
+    rng: np.random.Generator | np.random.RandomState | None,
+) -> np.ndarray:
+    # 재표본마다 sum(numerators) / sum(denominators) 를 고유 쌍별 추출 횟수로 계산
+    if num_resamples <= 0:
+        raise ValueError("num_resamples must be a positive integer")
+    rng = rng if rng is not None else np.random.default_rng()
+
+    # 2 차원 np.unique 보다 빠르도록 쌍을 정수 하나로 합쳐 묶음
+    offset = numerators.min()
+    span = int(denominators.max()) + 1
+    codes, weights = np.unique(
+        (numerators - offset) * span + denominators, return_counts=True
+    )
+    keys = np.stack([codes // span + offset, codes % span], axis=1).astype(np.float64)
+    pvals = weights / weights.sum()
+
+    samples = []
+    for start in range(0, num_resamples, _CHUNK_SIZE):
+        size = min(_CHUNK_SIZE, num_resamples - start)
+        draw = rng.multinomial(len(numerators), pvals, size=size) @ keys
+        samples.append(_ratio(draw[:, 0], draw[:, 1]))
+    return np.concatenate(samples)
+
+
+def _ratio(numerator, denominator):
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    ratio = 100 * numerator / np.where(denominator == 0, 1, denominator)
+    return float(ratio) if ratio.ndim == 0 else ratio
+
+
+def _percentiles(samples: np.ndarray, confidence: float) -> tuple[float, float]:
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(samples, [alpha, 1 - alpha])
+    return float(low), float(high)
+
+
+__all__ = [
+    "BootstrapInterval",
+    "PairedBootstrapResult",
+    "utterance_counts",
+    "paired_counts",
+    "bootstrap_wer",
+    "paired_bootstrap",
+]
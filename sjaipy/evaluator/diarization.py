@@ -0,0 +1,250 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pathlib import Path
+from typing import Any, Mapping, NamedTuple, Sequence
+from scipy.optimize import linear_sum_assignment
+
+if TYPE_CHECKING:
+    pass
+
+# RTTM 에서 비어 있는 필드
+_NA = "<NA>"
+
+
+class DiarizationCounts(NamedTuple):
+    """채점 구간의 시간(초) 합계. `scored` 는 화자 수를 곱한 정답 발화 시간이다."""
+
+    scored: float
+    missed: float
+    false_alarm: float
+    confusion: float
+
+    @property
+    def errors(self) -> float:
+        return self.missed + self.false_alarm + self.confusion
+
+
+def read_rttm(path: Path) -> dict[str, list[dict[str, Any]]]:
+    """RTTM 파일의 SPEAKER 줄을 녹음별 diarization 라벨로 읽는 함수
+
+    Returns:
+        dict[str, list[dict[str, Any]]]: 녹음 id -> `{"start", "end", "label"}` 리스트
+    """
+    result: dict[str, list[dict[str, Any]]] = {}
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 8 or fields[0] != "SPEAKER":
+                continue
+            start, duration = float(fields[3]), float(fields[4])
+            result.setdefault(fields[1], []).append(
+                {"start": start, "end": start + duration, "label": fields[7]}
+            )
+    return result
+
+
+def make_rttm_file(
+    recordings: Mapping[str, Sequence[Mapping[str, Any]]], path: Path
+) -> None:
+    """녹음별 diarization 라벨을 RTTM 파일로 쓰는 함수"""
+    dst = Path(path)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with dst.open("w", encoding="utf-8", newline="\n") as fout:
+        for id, labels in recordings.items():
+            for label in sorted(labels, key=lambda x: (x["start"], x["end"])):
+                fout.write(
+                    f"SPEAKER {id} 1 {label['start']:.3f} "
+                    f"{label['end'] - label['start']:.3f} {_NA} {_NA} "
+                    f"{label['label']} {_NA} {_NA}\n"
+                )
+
+
+def diarization_counts(
+    ref: Sequence[Mapping[str, Any]],
+    hyp: Sequence[Mapping[str, Any]],
+    collar: float = 0.0,
+    skip_overlap: bool = False,
+) -> DiarizationCounts:
+    """녹음 하나의 DER 구성 요소(miss, false alarm, confusion)를 구하는 함수"""
+    counts, _ = _score(ref, hyp, collar, skip_overlap)
+    return counts
+
+
+def speaker_jaccard_errors(
+    ref: Sequence[Mapping[str, Any]],
+    hyp: Sequence[Mapping[str, Any]],
+    collar: float = 0.0,
+    skip_overlap: bool = False,
+) -> dict[str, float]:
+    """녹음 하나의 정답 화자별 Jaccard error (1 - IoU). 매칭되지 않은 화자는 1."""
+    _, jaccard = _score(ref, hyp, collar, skip_overlap)
+    return jaccard
+
+
+def score_diarization(
+    ref: Path | Mapping[str, Sequence[Mapping[str, Any]]],
+    hyp: Path | Mapping[str, Sequence[Mapping[str, Any]]],
+    collar: float = 0.0,
+    skip_overlap: bool = False,
+) -> dict[str, int | float]:
+    """md-eval 방식의 DER 과 DIHARD 방식의 JER 을 구하는 함수
+
+    녹음마다 모든 정답/예측 경계로 나눈 기본 구간 위에서 화자 활성 행렬을 만들고,
+    구간 길이를 가중치로 한 화자 겹침 시간 행렬에 헝가리안 매칭을 적용한다.
+    계산량은 프레임 수가 아니라 경계 수 x 화자 수에 비례하므로 1시간 길이의 AMI
+    회의도 바로 채점된다. 데이터셋 라벨은
+    `{id: Y["diarization"] for id, Y in dataset.iter_labels()}` 로 넘기면 된다.
+
+    Args:
+        ref (Path | Mapping): 정답 RTTM 경로 또는 녹음 id -> `{"start", "end", "label"}` 리스트
+        hyp (Path | Mapping): 예측 RTTM 경로 또는 같은 형식의 딕셔너리.
+            없는 녹음은 예측이 비어 있는 것으로 본다.
+        collar (float, optional): 정답 경계 앞뒤로 채점하지 않는 시간(초). Defaults to 0.0.
+        skip_overlap (bool, optional): 정답 화자가 겹치는 구간 제외 여부. Defaults to False.
+
+    Returns:
+        dict[str, int | float]: 오류율(%)과 채점된 발화 시간(초), 녹음 수.
+            JER 은 모든 녹음의 정답 화자별 Jaccard error 평균이다.
+    """
+    refs = read_rttm(ref) if isinstance(ref, (str, Path)) else ref
+    hyps = read_rttm(hyp) if isinstance(hyp, (str, Path)) else hyp
+
+    totals = np.zeros(4)
+    jaccard = []
+    for id, labels in refs.items():
+        counts, errors = _score(labels, hyps.get(id, []), collar, skip_overlap)
+        totals += counts
+        jaccard.extend(errors.values())
+
+    counts = DiarizationCounts(*(float(x) for x in totals))
+
+    def percent(x: float) -> float:
+        return float(f"{100 * x / counts.scored if counts.scored else 0.0:.2f}")
+
+    return {
+        "num_recordings": len(refs),
+        "scored_speech": float(f"{counts.scored:.3f}"),
+        "missed_percent": percent(counts.missed),
+        "false_alarm_percent": percent(counts.false_alarm),
+        "confusion_percent": percent(counts.confusion),
+        "der_percent": percent(counts.errors),
+        "jer_percent": float(f"{100 * np.mean(jaccard) if jaccard else 0.0:.2f}"),
+    }
+
+
+def _as_arrays(
+    labels: Sequence[Mapping[str, Any]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    starts = np.array([x["start"] for x in labels], dtype=np.float64)
+    ends = np.array([x["end"] for x in labels], dtype=np.float64)
+    speakers = np.array([str(x["label"]) for x in labels], dtype=str)
+    if np.any(ends < starts):
+        raise ValueError("Diarization labels must have end >= start")
+    return starts, ends, speakers
+
+
+def _covered(starts: np.ndarray, ends: np.ndarray, points: np.ndarray) -> np.ndarray:
+    # 시작 시각으로 정렬한 뒤 끝 시각의 누적 최대가 점보다 크면 어떤 구간 안에 있음
+    if len(starts) == 0:
+        return np.zeros(len(points), dtype=bool)
+    order = np.argsort(starts, kind="stable")
+    reach = np.maximum.accumulate(ends[order])
+    index = np.searchsorted(starts[order], points, side="right") - 1
+    return (index >= 0) & (reach[np.maximum(index, 0)] > points)
+
+
+def _activity(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    speakers: np.ndarray,
+    names: np.ndarray,
+    points: np.ndarray,
+) -> np.ndarray:
+    # (구간 수, 화자 수) 크기의 화자 활성 행렬, 반복은 화자 수만큼만
+    result = np.zeros((len(points), len(names)), dtype=bool)
+    for k, name in enumerate(names):
+        mask = speakers == name
+        result[:, k] = _covered(starts[mask], ends[mask], points)
+    return result
+
+
+def _score(
+    ref: Sequence[Mapping[str, Any]],
+    hyp: Sequence[Mapping[str, Any]],
+    collar: float,
+    skip_overlap: bool,
+) -> tuple[DiarizationCounts, dict[str, float]]:
+    if collar < 0:
+        raise ValueError("collar must be non-negative")
+    ref_starts, ref_ends, ref_speakers = _as_arrays(ref)
+    hyp_starts, hyp_ends, hyp_speakers = _as_arrays(hyp)
+    ref_boundaries = np.concatenate([ref_starts, ref_ends])
+
+    # 모든 경계(collar 경계 포함)로 나눈 기본 구간 안에서는 화자 활성이 일정
+    edges = np.unique(
+        np.concatenate(
+            [
+                ref_boundaries,
+                hyp_starts,
+                hyp_ends,
+                ref_boundaries - collar,
+                ref_boundaries + collar,
+            ]
+        )
+    )
+    if len(edges) < 2:
+        edges = np.zeros(2)
+    points = (edges[:-1] + edges[1:]) / 2
+    durations = np.diff(edges)
+
+    ref_names, hyp_names = np.unique(ref_speakers), np.unique(hyp_speakers)
+    R = _activity(ref_starts, ref_ends, ref_speakers, ref_names, points)
+    H = _activity(hyp_starts, hyp_ends, hyp_speakers, hyp_names, points)
+
+    num_ref, num_hyp = R.sum(axis=1), H.sum(axis=1)
+    if collar > 0:
+        durations = durations * ~_covered(
+            ref_boundaries - collar, ref_boundaries + collar, points
+        )
+    if skip_overlap:
+        durations = durations * (num_ref <= 1)
+
+    # 정답 화자 x 예측 화자 겹침 시간
+    overlap = (R.T * durations) @ H
+    rows, cols = linear_sum_assignment(overlap, maximize=True)
+    num_correct = (R[:, rows] & H[:, cols]).sum(axis=1)
+
+    counts = DiarizationCounts(
+        scored=float(durations @ num_ref),
+        missed=float(durations @ np.maximum(num_ref - num_hyp, 0)),
+        false_alarm=float(durations @ np.maximum(num_hyp - num_ref, 0)),
+        confusion=float(durations @ (np.minimum(num_ref, num_hyp) - num_correct)),
+    )
+
+    # JER 은 겹침 시간이 아닌 IoU 로 따로 매칭
+    ref_durations, hyp_durations = durations @ R, durations @ H
+    union = ref_durations[:, None] + hyp_durations[None, :] - overlap
+    iou = np.divide(overlap, union, out=np.zeros_like(overlap), where=union > 0)
+    rows, cols = linear_sum_assignment(iou, maximize=True)
+    errors = np.ones(len(ref_names))
+    errors[rows] = 1 - iou[rows, cols]
+    # collar 등으로 채점 시간이 없는 화자는 제외
+    jaccard = {
+        str(name): float(errors[k])
+        for k, name in enumerate(ref_names)
+        if ref_durations[k] > 0
+    }
+    return counts, jaccard
+
+
+__all__ = [
+    "DiarizationCounts",
+    "read_rttm",
+    "make_rttm_file",
+    "diarization_counts",
+    "speaker_jaccard_errors",
+    "score_diarization",
+]
@@ -0,0 +1,157 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import numpy as np
+
+from pathlib import Path
+from typing import Any, Callable
+
+if TYPE_CHECKING:
+    pass
+
+DEFAULT_STORE_PATH = (
+    Path(os.environ.get("SJAIPY_CACHE", Path.home() / ".cache" / "sjaipy"))
+    / "hypotheses.sqlite3"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hypotheses (
+    sample_id TEXT NOT NULL,
+    audio_hash TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (sample_id, audio_hash, config_hash)
+)
+"""
+
+
+def audio_fingerprint(audio: np.ndarray) -> str:
+    """오디오 샘플 값, dtype, shape 의 해시"""
+    audio = np.ascontiguousarray(audio)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{audio.dtype.str}|{audio.shape}".encode("utf-8"))
+    digest.update(audio.data)
+    return digest.hexdigest()
+
+
+def config_fingerprint(config: dict[str, Any]) -> str:
+    """전사기 설정(모델, beam size, 언어 등)의 해시. 키 순서와 무관하다."""
+    data = json.dumps(config, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+class HypothesisStore:
+    """전사 결과(정규화 전)를 SQLite 에 보관하는 영속 캐시
+
+    (sample id, 오디오 fingerprint, 전사기 설정 해시) 를 키로 하므로, 중단된
+    평가를 다시 실행하면 끝난 발화는 전사하지 않고, 정규화만 바꾼 실험은 저장된
+    원문 전사를 재사용한다. WAL 모드라 여러 샤드 프로세스가 같은 파일을 함께 쓸
+    수 있고, pickle 되면 각 프로세스에서 다시 연결한다.
+    """
+
+    def __init__(self, path: Path = DEFAULT_STORE_PATH):
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def __getstate__(self) -> dict:
+        return {"path": self._path}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["path"])
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = (
+                self._connect().execute("SELECT COUNT(*) FROM hypotheses").fetchone()
+            )
+        return count
+
+    def get(self, sample_id: str, audio_hash: str, config_hash: str) -> str | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT text FROM hypotheses"
+                    " WHERE sample_id = ? AND audio_hash = ? AND config_hash = ?",
+                    (sample_id, audio_hash, config_hash),
+                )
+                .fetchone()
+            )
+        return row[0] if row is not None else None
+
+    def put(self, sample_id: str, audio_hash: str, config_hash: str, text: str) -> None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO hypotheses VALUES (?, ?, ?, ?, ?)",
+                    (sample_id, audio_hash, config_hash, text, time.time()),
+                )
+
+    def transcribe(
+        self,
+        sample_id: str,
+        audio: np.ndarray,
+        config_hash: str,
+        transcriber: Callable[[], str],
+    ) -> str:
+        """저장된 전사가 있으면 반환하고, 없으면 `transcriber()` 결과를 저장 후 반환"""
+        audio_hash = audio_fingerprint(audio)
+        text = self.get(sample_id, audio_hash, config_hash)
+        if text is None:
+            text = transcriber()
+            self.put(sample_id, audio_hash, config_hash, text)
+        return text
+
+    def sample_ids(self, config_hash: str) -> set[str]:
+        """`config_hash` 로 전사가 끝난 sample id"""
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT DISTINCT sample_id FROM hypotheses WHERE config_hash = ?",
+                    (config_hash,),
+                )
+                .fetchall()
+            )
+        return {row[0] for row in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # fork 된 프로세스는 부모의 연결을 쓰지 않고 새로 연결
+        if self._connection is None or self._pid != os.getpid():
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self._path, timeout=60, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+
+__all__ = [
+    "HypothesisStore",
+    "audio_fingerprint",
+    "config_fingerprint",
+]
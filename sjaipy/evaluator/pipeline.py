@@ -0,0 +1,274 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import queue
+import threading
+import numpy as np
+
+from typing import Any, Callable, Generator
+
+from sjaipy.audio.resampler import resample
+from sjaipy.evaluator.hypothesis_store import config_fingerprint
+from sjaipy.evaluator.sclite_utils import TRNFormat
+
+if TYPE_CHECKING:
+    from sjaipy.datasets import Dataset
+    from sjaipy.evaluator.scorer import ErrorAccumulator
+    from sjaipy.evaluator.hypothesis_store import HypothesisStore
+
+DEFAULT_QUEUE_SIZE = 8
+
+# 스테이지 종료 신호
+_STOP = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _Stage:
+    """입력 큐에서 (index, item) 을 받아 `function` 을 적용해 출력 큐로 넘기는 워커 묶음"""
+
+    def __init__(
+        self,
+        name: str,
+        function: Callable[[int, Any], Any],
+        num_workers: int,
+        inputs: queue.Queue,
+        outputs: queue.Queue,
+        stop: threading.Event,
+    ):
+        if num_workers <= 0:
+            raise ValueError(f"{name} needs at least one worker")
+        self._function = function
+        self._inputs = inputs
+        self._outputs = outputs
+        self._stop = stop
+        self._running = num_workers
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"{name}-{i}", daemon=True)
+            for i in range(num_workers)
+        ]
+
+    def start(self) -> None:
+        for thread in self._threads:
+            thread.start()
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self) -> None:
+        while True:
+            item = _get(self._inputs, self._stop)
+            if item is _STOP or item is None:
+                # 같은 스테이지의 다른 워커도 멈추도록 되돌려 놓고, 마지막 워커가 다음 스테이지로 전달
+                item is _STOP and _put(self._inputs, _STOP, self._stop)
+                with self._lock:
+                    self._running -= 1
+                    last = self._running == 0
+                last and _put(self._outputs, _STOP, self._stop)
+                return
+
+            index, value = item
+            if not isinstance(value, _Failure):
+                try:
+                    value = self._function(index, value)
+                except BaseException as e:
+                    value = _Failure(e)
+            _put(self._outputs, (index, value), self._stop)
+
+
+class EvaluationPipeline:
+    """적재, 리샘플링, 전사, 정규화/채점을 스레드 스테이지로 겹쳐 실행하는 평가기
+
+    스테이지 사이는 `queue_size` 크기의 큐로 연결되어 느린 스테이지가 앞
+    스테이지를 멈추게 하고(backpressure), 동시에 처리 중인 발화 수도
+    제한하므로 순서 복원 버퍼까지 메모리가 일정하다. 결과는 데이터셋 순서대로
+    반환된다. 전사 함수(faster-whisper 등)와 ffmpeg 디코딩은 GIL 을 놓으므로
+    스레드로 겹쳐진다.
+    """
+
+    def __init__(
+        self,
+        transcriber: Callable[[np.ndarray], str],
+        normalizer: Callable[[str], str] = lambda x: x,
+        sr: int | None = None,
+        accumulator: ErrorAccumulator | None = None,
+        store: HypothesisStore | None = None,
+        transcriber_config: dict[str, Any] | None = None,
+        load_workers: int = 2,
+        resample_workers: int = 1,
+        transcribe_workers: int | None = None,
+        score_workers: int = 1,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        """
+        Args:
+            transcriber (Callable[[np.ndarray], str]): 오디오를 받아 전사 문자열을 반환하는 함수
+            normalizer (Callable[[str], str], optional): ref 와 hyp 에 적용할 정규화 함수
+            sr (int | None, optional): 전사기에 넘길 샘플링 레이트. None 이면 데이터셋의 sr.
+            accumulator (ErrorAccumulator | None, optional): 발화마다 갱신할 집계기.
+                이미 집계된 id 는 건너뛴다.
+            store (HypothesisStore | None, optional): 정규화 전 전사를 보관할 캐시.
+                저장된 발화는 다시 전사하지 않는다.
+            transcriber_config (dict[str, Any] | None, optional): 캐시 키에 쓰이는
+                전사기 설정. `store` 를 쓸 때 필수.
+            load_workers (int, optional): 오디오 적재/디코딩 워커 수. Defaults to 2.
+            resample_workers (int, optional): 리샘플링 워커 수. Defaults to 1.
+            transcribe_workers (int | None, optional): 전사 워커 수. None 이면 전사기의
+                `num_processes` (WhisperModelPool 처럼 요청을 여러 프로세스에 나누는 경우)
+                또는 1. Defaults to None.
+            score_workers (int, optional): 정규화/채점 워커 수. Defaults to 1.
+            queue_size (int, optional): 스테이지 사이 큐 크기. Defaults to 8.
+        """
+        if queue_size <= 0:
+            raise ValueError("queue_size must be a positive integer")
+        if store is not None and transcriber_config is None:
+            raise ValueError("transcriber_config is required when store is given")
+        self._transcriber = transcriber
+        self._normalizer = normalizer
+        self._sr = sr
+        self._accumulator = accumulator
+        self._store = store
+        self._config_hash = (
+            config_fingerprint(transcriber_config)
+            if transcriber_config is not None
+            else None
+        )
+        self._workers = {
+            "load": load_workers,
+            "resample": resample_workers,
+            "transcribe": (
+                transcribe_workers
+                if transcribe_workers is not None
+                else getattr(transcriber, "num_processes", 1)
+            ),
+            "score": score_workers,
+        }
+        self._queue_size = queue_size
+
+    def run(self, dataset: Dataset) -> tuple[list[TRNFormat], list[TRNFormat]]:
+        """generate_ref_and_hyp 와 같은 형식의 (ref, hyp) 리스트"""
+        result_ref, result_hyp = [], []
+        for ref, hyp in self.iter(dataset):
+            result_ref.append(ref)
+            result_hyp.append(hyp)
+        return result_ref, result_hyp
+
+    def iter(
+        self, dataset: Dataset
+    ) -> Generator[tuple[TRNFormat, TRNFormat], Any, None]:
+        """데이터셋 순서대로 (ref, hyp) 를 처리되는 대로 내보내는 제너레이터
+
+        Raises:
+            BaseException: 스테이지에서 발생한 첫 예외를 그대로 다시 발생
+        """
+        # 라벨은 오디오 없이 읽히므로 건너뛸 id 를 먼저 거름
+        labels = [
+            (idx, id, Y["asr"])
+            for idx, (id, Y) in enumerate(dataset.iter_labels())
+            if self._accumulator is None or id not in self._accumulator
+        ]
+        labels_by_index = {idx: (id, text) for idx, id, text in labels}
+        target_sr = self._sr or dataset.sr
+
+        def load(idx: int, _: Any) -> np.ndarray:
+            return dataset.get(idx).audio
+
+        def resample_audio(_: int, audio: np.ndarray) -> np.ndarray:
+            return resample(audio, dataset.sr, target_sr)
+
+        def transcribe(idx: int, audio: np.ndarray) -> str:
+            if self._store is None:
+                return self._transcriber(audio)
+            id, _ = labels_by_index[idx]
+            return self._store.transcribe(
+                id, audio, self._config_hash, lambda: self._transcriber(audio)
+            )
+
+        def score(idx: int, pred: str) -> tuple[TRNFormat, TRNFormat]:
+            id, text = labels_by_index[idx]
+            ref = TRNFormat(id=id, text=self._normalizer(text))
+            hyp = TRNFormat(id=id, text=self._normalizer(pred))
+            self._accumulator is not None and self._accumulator.update(ref, hyp)
+            return ref, hyp
+
+        functions = {
+            "load": load,
+            "resample": resample_audio,
+            "transcribe": transcribe,
+            "score": score,
+        }
+
+        stop = threading.Event()
+        queues = [queue.Queue(self._queue_size) for _ in range(len(functions) + 1)]
+        stages = [
+            _Stage(name, function, self._workers[name], queues[i], queues[i + 1], stop)
+            for i, (name, function) in enumerate(functions.items())
+        ]
+        # 순서 복원 버퍼까지 포함한 동시 처리 발화 수 제한
+        in_flight = threading.BoundedSemaphore(
+            self._queue_size * (len(stages) + 1) + sum(self._workers.values())
+        )
+
+        def feed() -> None:
+            for idx, _, _ in labels:
+                while not in_flight.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if not _put(queues[0], (idx, None), stop):
+                    return
+            _put(queues[0], _STOP, stop)
+
+        feeder = threading.Thread(target=feed, name="feed", daemon=True)
+        feeder.start()
+        for stage in stages:
+            stage.start()
+
+        try:
+            pending: dict[int, Any] = {}
+            order = iter(idx for idx, _, _ in labels)
+            next_idx = next(order, None)
+            while next_idx is not None:
+                item = queues[-1].get()
+                if item is _STOP:
+                    break
+                idx, value = item
+                if isinstance(value, _Failure):
+                    raise value.error
+                pending[idx] = value
+                while next_idx is not None and next_idx in pending:
+                    yield pending.pop(next_idx)
+                    in_flight.release()
+                    next_idx = next(order, None)
+        finally:
+            stop.set()
+            feeder.join()
+            for stage in stages:
+                stage.join()
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    # 중단되면 막힌 put 에서 빠져나오도록 짧게 나눠 기다림
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q: queue.Queue, stop: threading.Event) -> Any:
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
+
+
+__all__ = ["EvaluationPipeline"]
@@ -12,8 +12,11 @@ from typing import Iterable, Callable, Generator, Any
 from pathlib import Path
 from typing_extensions import deprecated
 
+from sjaipy.evaluator.hypothesis_store import config_fingerprint
+
 if TYPE_CHECKING:
-    pass
+    from sjaipy.evaluator.scorer import ErrorAccumulator
+    from sjaipy.evaluator.hypothesis_store import HypothesisStore
 
 TEMP_PATH = Path("/dev/shm") if sys.platform.startswith("linux") else Path("./tmp")
 
@@ -261,19 +264,49 @@ def generate_ref_and_hyp(
     sr: int = 16_000,
     size: int = -1,
     rng: np.random.Generator | np.random.RandomState | None = None,
+    accumulator: ErrorAccumulator | None = None,
+    keep_results: bool = True,
+    store: HypothesisStore | None = None,
+    transcriber_config: dict[str, Any] | None = None,
 ) -> dict[str, dict[str, list[TRNFormat]]]:
+    """데이터셋을 전사해 ref 와 hyp 를 만드는 함수
+
+    `accumulator` 가 주어지면 발화마다 오류 수를 바로 누적하며, 이미 집계된 id 는
+    건너뛰어 체크포인트에서 이어 실행할 수 있다. `keep_results` 가 False 면
+    ref/hyp 를 리스트에 보관하지 않아 메모리가 늘지 않는다.
+    `store` 가 주어지면 정규화 전 전사를 `transcriber_config` 별로 캐시해, 다시
+    실행하거나 정규화만 바꿀 때 전사를 건너뛴다.
+    """
+    if store is not None and transcriber_config is None:
+        raise ValueError("transcriber_config is required when store is given")
+    config_hash = (
+        config_fingerprint(transcriber_config)
+        if transcriber_config is not None
+        else None
+    )
+
     result_ref = []
     result_hyp = []
     for audio, key, y, path in data_loader(datasets, sr=sr, sample_size=size, rng=rng):
+        if accumulator is not None and key in accumulator:
+            continue
+
         txt = normalizer(y)
         ref = TRNFormat(id=key, text=txt)
 
-        pred = transcriber(audio, path)
+        if store is None:
+            pred = transcriber(audio, path)
+        else:
+            pred = store.transcribe(
+                key, audio, config_hash, lambda: transcriber(audio, path)
+            )
         pred = normalizer(pred)
         hyp = TRNFormat(id=key, text=pred)
 
-        result_ref.append(ref)
-        result_hyp.append(hyp)
+        accumulator is not None and accumulator.update(ref, hyp)
+        if keep_results:
+            result_ref.append(ref)
+            result_hyp.append(hyp)
 
     return result_ref, result_hyp
 
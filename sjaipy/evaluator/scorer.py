@@ -0,0 +1,469 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import os
+import re
+import json
+import threading
+
+from pathlib import Path
+from typing import Iterable, Sequence
+from typing_extensions import Self
+
+from sjaipy.evaluator.sclite_utils import TRNFormat
+from sjaipy.evaluator.alignment import AlignmentCounts, align_batch, count_ops
+
+if TYPE_CHECKING:
+    pass
+
+# 채점 단위
+WORD = "word"
+CHAR = "char"
+JAMO = "jamo"
+UNITS = (WORD, CHAR, JAMO)
+SPACE_TOKEN = "<space>"
+
+# trn 한 줄: "<text> (<id>)"
+_TRN_LINE = re.compile(r"^(.*?)\s*\(([^()]*)\)\s*$")
+
+# 유니코드 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+_HANGUL_BASE = 0xAC00
+_HANGUL_COUNT = 11_172
+_JONGSEONG = 28
+_JUNGSEONG_JONGSEONG = 21 * 28
+_LEADING_BASE = 0x1100
+_VOWEL_BASE = 0x1161
+_TRAILING_BASE = 0x11A7
+
+
+def read_trn_file(path: Path) -> list[TRNFormat]:
+    """sclite trn 파일을 TRNFormat 리스트로 읽는 함수
+
+    Args:
+        path (Path): trn 파일 경로
+
+    Raises:
+        ValueError: "<text> (<id>)" 형식이 아닌 줄이 있을 때
+
+    Returns:
+        list[TRNFormat]: 파일 순서대로의 trn 항목
+    """
+    items = []
+    with Path(path).open("r", encoding="utf-8") as fin:
+        for lineno, line in enumerate(fin, 1):
+            if not line.strip():
+                continue
+            match = _TRN_LINE.match(line)
+            if not match:
+                raise ValueError(f"Invalid trn line {lineno} in {path}: {line!r}")
+            items.append(TRNFormat(id=match.group(2), text=match.group(1)))
+    return items
+
+
+def tokenize(
+    text: str,
+    ignore_case: bool = True,
+    unit: str = WORD,
+    ignore_spacing: bool = False,
+) -> list[str]:
+    """채점 단위로 문자열을 나누는 함수
+
+    - `word`: 공백으로 나눈 단어
+    - `char`: 글자. 띄어쓰기는 `SPACE_TOKEN` 하나로 남긴다.
+    - `jamo`: 한글 음절을 초성/중성/종성으로 분해한 글자
+
+    `ignore_spacing` 이면 `char`/`jamo` 에서 띄어쓰기를 모두 지워 띄어쓰기 차이를
+    오류로 세지 않는다.
+
+    Args:
+        text (str): 채점할 문자열
+        ignore_case (bool, optional): 대소문자 구분 여부. Defaults to True.
+        unit (str, optional): 채점 단위 (`word`, `char`, `jamo`). Defaults to "word".
+        ignore_spacing (bool, optional): 띄어쓰기 무시 여부. Defaults to False.
+
+    Returns:
+        list[str]: 토큰 리스트
+    """
+    _check_unit(unit, ignore_spacing)
+    # make_trn_file 과 같이 대문자로 통일
+    text = text.strip()
+    words = (text.upper() if ignore_case else text).split()
+    if unit == WORD:
+        return words
+    if unit == JAMO:
+        words = [decompose_hangul(word) for word in words]
+    if ignore_spacing:
+        return [c for word in words for c in word]
+
+    tokens = []
+    for k, word in enumerate(words):
+        k and tokens.append(SPACE_TOKEN)
+        tokens.extend(word)
+    return tokens
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 조합형 자모(초성, 중성, 종성)로 분해하는 함수. 다른 글자는 그대로 둔다."""
+    chars = []
+    for c in text:
+        code = ord(c) - _HANGUL_BASE
+        if 0 <= code < _HANGUL_COUNT:
+            chars.append(chr(_LEADING_BASE + code // _JUNGSEONG_JONGSEONG))
+            chars.append(chr(_VOWEL_BASE + code % _JUNGSEONG_JONGSEONG // _JONGSEONG))
+            if trailing := code % _JONGSEONG:
+                chars.append(chr(_TRAILING_BASE + trailing))
+        else:
+            chars.append(c)
+    return "".join(chars)
+
+
+def encode_pairs(
+    ref: Path | Iterable[TRNFormat],
+    hyp: Path | Iterable[TRNFormat],
+    ignore_case: bool = True,
+    unit: str = WORD,
+    ignore_spacing: bool = False,
+) -> tuple[list[str], dict[str, int], list[list[int]], list[list[int]]]:
+    """ref 와 hyp 를 id 로 짝지어 토큰 id 배열로 바꾸는 함수
+
+    Raises:
+        ValueError: id 가 중복되거나 ref 와 hyp 의 id 집합이 다를 때
+
+    Returns:
+        tuple[list[str], dict[str, int], list[list[int]], list[list[int]]]:
+            ref 순서대로의 id, 토큰 -> 토큰 id 사전, 문장별 ref/hyp 토큰 id
+    """
+    _check_unit(unit, ignore_spacing)
+    refs = _by_id(read_trn_file(ref) if isinstance(ref, Path) else ref, "ref")
+    hyps = _by_id(read_trn_file(hyp) if isinstance(hyp, Path) else hyp, "hyp")
+    if refs.keys() != hyps.keys():
+        missing = sorted(refs.keys() - hyps.keys())[:5]
+        extra = sorted(hyps.keys() - refs.keys())[:5]
+        raise ValueError(
+            f"ref and hyp ids differ (missing in hyp: {missing}, extra in hyp: {extra})"
+        )
+
+    vocab: dict[str, int] = {}
+
+    def encode(text: str) -> list[int]:
+        tokens = tokenize(text, ignore_case, unit, ignore_spacing)
+        return [vocab.setdefault(t, len(vocab)) for t in tokens]
+
+    ids = list(refs)
+    return (
+        ids,
+        vocab,
+        [encode(refs[id]) for id in ids],
+        [encode(hyps[id]) for id in ids],
+    )
+
+
+def score_pairs(
+    ref: Path | Iterable[TRNFormat],
+    hyp: Path | Iterable[TRNFormat],
+    ignore_case: bool = True,
+    unit: str = WORD,
+    ignore_spacing: bool = False,
+) -> dict[str, AlignmentCounts]:
+    """id 별 정렬 결과를 계산하는 함수
+
+    sclite 와 같이 ref 와 hyp 를 id 로 짝지으며, 토큰을 정수 id 로 바꾼 뒤
+    모든 문장을 배치로 정렬한다.
+
+    Args:
+        ref (Path | Iterable[TRNFormat]): 정답 trn 파일 경로 또는 TRNFormat 객체의 iterable
+        hyp (Path | Iterable[TRNFormat]): 예측 trn 파일 경로 또는 TRNFormat 객체의 iterable
+        ignore_case (bool, optional): 대소문자 구분 여부. Defaults to True.
+        unit (str, optional): 채점 단위 (`word`, `char`, `jamo`). Defaults to "word".
+        ignore_spacing (bool, optional): 띄어쓰기 무시 여부. Defaults to False.
+
+    Raises:
+        ValueError: id 가 중복되거나 ref 와 hyp 의 id 집합이 다를 때
+
+    Returns:
+        dict[str, AlignmentCounts]: ref 순서대로의 id 별 정렬 결과
+    """
+    ids, _, refs, hyps = encode_pairs(ref, hyp, ignore_case, unit, ignore_spacing)
+    ops = align_batch(refs, hyps)
+    return {id: count_ops(op) for id, op in zip(ids, ops)}
+
+
+def summarize(counts: Iterable[AlignmentCounts]) -> dict[str, int | float]:
+    """문장별 정렬 결과를 parse_sclite_summary 와 같은 형식으로 합산하는 함수
+
+    백분율은 sclite 의 Sum/Avg 줄처럼 소수점 첫째 자리로 반올림한다.
+
+    Args:
+        counts (Iterable[AlignmentCounts]): 문장별 정렬 결과
+
+    Returns:
+        dict[str, int | float]: parse_sclite_summary 와 같은 키의 딕셔너리
+    """
+    accumulator = ErrorAccumulator(track_ids=False)
+    for c in counts:
+        accumulator.add(None, c)
+    return accumulator.summary()
+
+
+def summary_dict(
+    num_sentences: int, sentence_errors: int, totals: AlignmentCounts
+) -> dict[str, int | float]:
+    """합산된 수를 parse_sclite_summary 와 같은 키의 딕셔너리로 만드는 함수"""
+    num_words = totals.correct + totals.substitutions + totals.deletions
+
+    def percent(value: int, total: int) -> float:
+        return float(f"{100 * value / total:.1f}") if total else 0.0
+
+    return {
+        "num_sentences": num_sentences,
+        "num_words": num_words,
+        "correct_percent": percent(totals.correct, num_words),
+        "substitution_percent": percent(totals.substitutions, num_words),
+        "deletion_percent": percent(totals.deletions, num_words),
+        "insertion_percent": percent(totals.insertions, num_words),
+        "wer_percent": percent(totals.errors, num_words),
+        "sentence_error_percent": percent(sentence_errors, num_sentences),
+    }
+
+
+class ErrorAccumulator:
+    """발화 단위로 오류 수를 누적하는 스트리밍 WER 집계기
+
+    문장마다 정렬 결과만 더하므로 ref/hyp 텍스트를 보관하지 않고, 언제든
+    `summary()` 로 중간 WER/SER 을 볼 수 있다. 워커별 집계기는 `merge` 로
+    합치고, `to_dict`/`save` 로 체크포인트를 남길 수 있다.
+    `track_ids` 이면 처리한 id 를 기억해 중복 집계를 막고 재시작 시 건너뛸
+    발화를 알려준다.
+    """
+
+    def __init__(
+        self,
+        ignore_case: bool = True,
+        track_ids: bool = True,
+        unit: str = WORD,
+        ignore_spacing: bool = False,
+    ):
+        _check_unit(unit, ignore_spacing)
+        self._ignore_case = ignore_case
+        self._unit = unit
+        self._ignore_spacing = ignore_spacing
+        self._track_ids = track_ids
+        self._ids: set[str] = set()
+        self._num_sentences = 0
+        self._sentence_errors = 0
+        self._totals = AlignmentCounts(0, 0, 0, 0)
+        self._lock = threading.Lock()
+
+    @property
+    def ids(self) -> frozenset[str]:
+        with self._lock:
+            return frozenset(self._ids)
+
+    @property
+    def num_sentences(self) -> int:
+        return self._num_sentences
+
+    @property
+    def totals(self) -> AlignmentCounts:
+        return self._totals
+
+    @property
+    def wer(self) -> float:
+        num_words = self._num_words(self._totals)
+        return self._totals.errors / num_words if num_words else 0.0
+
+    def __contains__(self, id: str) -> bool:
+        with self._lock:
+            return id in self._ids
+
+    def update(self, ref: TRNFormat, hyp: TRNFormat) -> AlignmentCounts:
+        """ref/hyp 한 쌍을 정렬해 누적하는 함수
+
+        Raises:
+            ValueError: ref 와 hyp 의 id 가 다르거나 이미 집계된 id 일 때
+
+        Returns:
+            AlignmentCounts: 해당 발화의 정렬 결과
+        """
+        return self.update_batch([ref], [hyp])[0]
+
+    def update_batch(
+        self, refs: Sequence[TRNFormat], hyps: Sequence[TRNFormat]
+    ) -> list[AlignmentCounts]:
+        """ref/hyp 쌍들을 한 번에 정렬해 누적하는 함수"""
+        if len(refs) != len(hyps):
+            raise ValueError("refs and hyps must have the same length")
+        for ref, hyp in zip(refs, hyps):
+            if ref.id != hyp.id:
+                raise ValueError(f"ref and hyp ids differ: {ref.id} != {hyp.id}")
+
+        encoded = [self._encode(ref.text, hyp.text) for ref, hyp in zip(refs, hyps)]
+        ops = align_batch([r for r, _ in encoded], [h for _, h in encoded])
+        counts = [count_ops(op) for op in ops]
+        with self._lock:
+            self._check_new([ref.id for ref in refs])
+            for ref, c in zip(refs, counts):
+                self._add(ref.id, c)
+        return counts
+
+    def add(self, id: str | None, counts: AlignmentCounts) -> None:
+        """이미 계산된 발화의 정렬 결과를 누적하는 함수"""
+        with self._lock:
+            if id is not None:
+                self._check_new([id])
+            self._add(id, counts)
+
+    def merge(self, other: ErrorAccumulator) -> Self:
+        """다른 집계기의 결과를 더하는 함수
+
+        Raises:
+            ValueError: 두 집계기가 같은 id 를 집계했을 때
+        """
+        with other._lock:
+            ids = set(other._ids)
+            num_sentences = other._num_sentences
+            sentence_errors = other._sentence_errors
+            totals = other._totals
+        with self._lock:
+            self._check_new(ids)
+            self._track_ids and self._ids.update(ids)
+            self._num_sentences += num_sentences
+            self._sentence_errors += sentence_errors
+            self._totals = AlignmentCounts(*map(sum, zip(self._totals, totals)))
+        return self
+
+    def summary(self) -> dict[str, int | float]:
+        """parse_sclite_summary 와 같은 키의 현재 집계 결과"""
+        with self._lock:
+            num_sentences = self._num_sentences
+            sentence_errors = self._sentence_errors
+            totals = self._totals
+        return summary_dict(num_sentences, sentence_errors, totals)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "ignore_case": self._ignore_case,
+                "unit": self._unit,
+                "ignore_spacing": self._ignore_spacing,
+                "track_ids": self._track_ids,
+                "ids": sorted(self._ids),
+                "num_sentences": self._num_sentences,
+                "sentence_errors": self._sentence_errors,
+                "totals": self._totals._asdict(),
+            }
+
+    def save(self, path: Path) -> None:
+        # 체크포인트가 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        os.replace(temp, path)
+
+    def _encode(self, ref: str, hyp: str) -> tuple[list[int], list[int]]:
+        # 발화마다 어휘를 새로 만들어 메모리가 누적되지 않음
+        vocab: dict[str, int] = {}
+        return tuple(
+            [
+                vocab.setdefault(t, len(vocab))
+                for t in tokenize(
+                    text, self._ignore_case, self._unit, self._ignore_spacing
+                )
+            ]
+            for text in (ref, hyp)
+        )
+
+    def _check_new(self, ids: Iterable[str]) -> None:
+        if not self._track_ids:
+            return
+        duplicated = [id for id in ids if id in self._ids]
+        if duplicated:
+            raise ValueError(f"Already accumulated ids: {sorted(duplicated)[:5]}")
+
+    def _add(self, id: str | None, counts: AlignmentCounts) -> None:
+        if self._track_ids and id is not None:
+            self._ids.add(id)
+        self._num_sentences += 1
+        self._sentence_errors += counts.errors > 0
+        self._totals = AlignmentCounts(*map(sum, zip(self._totals, counts)))
+
+    @staticmethod
+    def _num_words(totals: AlignmentCounts) -> int:
+        return totals.correct + totals.substitutions + totals.deletions
+
+    @staticmethod
+    def from_dict(data: dict) -> ErrorAccumulator:
+        accumulator = ErrorAccumulator(
+            ignore_case=data["ignore_case"],
+            track_ids=data["track_ids"],
+            unit=data.get("unit", WORD),
+            ignore_spacing=data.get("ignore_spacing", False),
+        )
+        accumulator._ids = set(data["ids"])
+        accumulator._num_sentences = data["num_sentences"]
+        accumulator._sentence_errors = data["sentence_errors"]
+        accumulator._totals = AlignmentCounts(**data["totals"])
+        return accumulator
+
+    @staticmethod
+    def load(path: Path) -> ErrorAccumulator:
+        return ErrorAccumulator.from_dict(
+            json.loads(Path(path).read_text(encoding="utf-8"))
+        )
+
+
+def score_trn(
+    ref: Path | Iterable[TRNFormat],
+    hyp: Path | Iterable[TRNFormat],
+    ignore_case: bool = True,
+    unit: str = WORD,
+    ignore_spacing: bool = False,
+) -> dict[str, int | float]:
+    """sclite 없이 trn 평가를 수행하는 함수
+
+    `parse_sclite_summary(sclite_trn(ref, hyp))` 와 같은 결과를 프로세스와
+    임시 파일 없이 계산한다. 정렬 가중치는 sclite 기본값(sub 4, del 3, ins 3).
+    `unit` 이 `char`/`jamo` 면 같은 키로 CER 을 반환한다 (`num_words` 는 토큰 수,
+    `wer_percent` 는 해당 단위의 오류율).
+
+    Args:
+        ref (Path | Iterable[TRNFormat]): 정답 trn 파일 경로 또는 TRNFormat 객체의 iterable
+        hyp (Path | Iterable[TRNFormat]): 예측 trn 파일 경로 또는 TRNFormat 객체의 iterable
+        ignore_case (bool, optional): 대소문자 구분 여부. Defaults to True.
+        unit (str, optional): 채점 단위 (`word`, `char`, `jamo`). Defaults to "word".
+        ignore_spacing (bool, optional): 띄어쓰기 무시 여부. Defaults to False.
+
+    Returns:
+        dict[str, int | float]: parse_sclite_summary 와 같은 키의 딕셔너리
+    """
+    return summarize(score_pairs(ref, hyp, ignore_case, unit, ignore_spacing).values())
+
+
+def _check_unit(unit: str, ignore_spacing: bool) -> None:
+    if unit not in UNITS:
+        raise ValueError(f"Invalid unit: {unit}. Valid units are: {', '.join(UNITS)}")
+    if unit == WORD and ignore_spacing:
+        raise ValueError("ignore_spacing requires the char or jamo unit")
+
+
+def _by_id(items: Iterable[TRNFormat], name: str) -> dict[str, str]:
+    result = {}
+    for item in items:
+        if item.id in result:
+            raise ValueError(f"Duplicated id in {name}: {item.id}")
+        result[item.id] = item.text
+    return result
+
+
+__all__ = [
+    "read_trn_file",
+    "tokenize",
+    "encode_pairs",
+    "decompose_hangul",
+    "score_pairs",
+    "summarize",
+    "summary_dict",
+    "score_trn",
+    "ErrorAccumulator",
+]
@@ -0,0 +1,219 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import os
+import numpy as np
+import multiprocessing as mp
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from sjaipy.evaluator.pipeline import EvaluationPipeline
+from sjaipy.evaluator.scorer import WORD, read_trn_file, score_trn
+from sjaipy.evaluator.sclite_utils import (
+    TRNFormat,
+    make_trn_file,
+    parse_sclite_summary,
+    sclite_trn,
+)
+
+if TYPE_CHECKING:
+    from sjaipy.datasets import Dataset
+
+
+def available_cpus() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def cpu_sets(num_shards: int, cpus: Sequence[int] | None = None) -> list[list[int]]:
+    """사용 가능한 코어를 샤드 수만큼 겹치지 않게 나누는 함수
+
+    Raises:
+        ValueError: 코어 수가 샤드 수보다 적을 때
+    """
+    cpus = available_cpus() if cpus is None else list(cpus)
+    if len(cpus) < num_shards:
+        raise ValueError(
+            f"Cannot pin {num_shards} shards to {len(cpus)} cpus; use fewer shards or pin=False"
+        )
+    return [chunk.tolist() for chunk in np.array_split(np.array(cpus), num_shards)]
+
+
+def check_shard_ids(
+    shards: Sequence[Iterable[TRNFormat]], expected: Iterable[str]
+) -> None:
+    """샤드들의 id 가 서로 겹치지 않고 합쳐서 `expected` 와 같은지 확인하는 함수
+
+    Raises:
+        ValueError: 샤드 안/사이에 중복된 id 가 있거나, 빠지거나 남는 id 가 있을 때
+    """
+    owner: dict[str, int] = {}
+    duplicated = []
+    for k, shard in enumerate(shards):
+        for item in shard:
+            if item.id in owner:
+                duplicated.append((item.id, owner[item.id], k))
+            owner[item.id] = k
+    if duplicated:
+        raise ValueError(f"Ids appear in more than one shard entry: {duplicated[:5]}")
+
+    expected = set(expected)
+    missing = sorted(expected - owner.keys())
+    extra = sorted(owner.keys() - expected)
+    if missing or extra:
+        raise ValueError(
+            f"Shard ids are incomplete (missing: {missing[:5]}, unexpected: {extra[:5]})"
+        )
+
+
+class ShardedEvaluator:
+    """데이터셋을 샤드로 나눠 프로세스마다 전사하고 결과를 합쳐 채점하는 평가기
+
+    샤드 프로세스는 서로 겹치지 않는 코어 집합에 고정되고, 각자
+    `EvaluationPipeline` 으로 전사해 `ref_XXX.trn`/`hyp_XXX.trn` 을 남긴다.
+    조정자는 샤드 파일의 id 가 서로 겹치지 않고 데이터셋 전체를 덮는지 확인한 뒤
+    데이터셋 순서로 합친 `ref.trn`/`hyp.trn` 을 채점한다. `unit` 으로 CER/자모
+    단위 채점을 고를 수 있다.
+
+    `transcriber_factory` 는 프로세스 안에서 호출되어 모델을 만들므로 pickle 가능한
+    모듈 수준 함수(또는 functools.partial)여야 한다.
+    """
+
+    def __init__(
+        self,
+        transcriber_factory: Callable[[], Callable[[np.ndarray], str]],
+        output_dir: Path,
+        num_shards: int,
+        normalizer: Callable[[str], str] | None = None,
+        sr: int | None = None,
+        pin: bool = True,
+        cpus: Sequence[int] | None = None,
+        use_sclite: bool = False,
+        unit: str = WORD,
+        ignore_spacing: bool = False,
+        mp_context: str = "spawn",
+        pipeline_kwargs: dict[str, Any] | None = None,
+    ):
+        if num_shards <= 0:
+            raise ValueError("num_shards must be a positive integer")
+        if use_sclite and (unit != WORD or ignore_spacing):
+            raise ValueError("sclite scoring only supports the word unit")
+        self._transcriber_factory = transcriber_factory
+        self._output_dir = Path(output_dir)
+        self._num_shards = num_shards
+        self._normalizer = normalizer
+        self._sr = sr
+        self._cpu_sets = cpu_sets(num_shards, cpus) if pin else [None] * num_shards
+        self._use_sclite = use_sclite
+        self._unit = unit
+        self._ignore_spacing = ignore_spacing
+        self._mp_context = mp_context
+        self._pipeline_kwargs = pipeline_kwargs or {}
+
+    @property
+    def output_dir(self) -> Path:
+        return self._output_dir
+
+    def shard_paths(self, shard: int) -> tuple[Path, Path]:
+        return (
+            self._output_dir / f"ref_{shard:03d}.trn",
+            self._output_dir / f"hyp_{shard:03d}.trn",
+        )
+
+    def run(self, dataset: Dataset) -> dict[str, int | float]:
+        """샤드 전사, 병합, 채점을 차례로 수행하는 함수
+
+        Returns:
+            dict[str, int | float]: parse_sclite_summary 와 같은 키의 딕셔너리
+        """
+        indices = np.array_split(np.arange(len(dataset)), self._num_shards)
+        shards = [dataset.select(chunk.tolist()) for chunk in indices]
+
+        context = mp.get_context(self._mp_context)
+        with ProcessPoolExecutor(
+            max_workers=self._num_shards, mp_context=context
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_shard,
+                    shard,
+                    self._transcriber_factory,
+                    self._normalizer,
+                    self._sr,
+                    self._cpu_sets[k],
+                    self.shard_paths(k),
+                    self._pipeline_kwargs,
+                )
+                for k, shard in enumerate(shards)
+            ]
+            for future in futures:
+                future.result()
+
+        ref, hyp = self.merge([id for id, _ in dataset.iter_labels()])
+        if self._use_sclite:
+            return parse_sclite_summary(sclite_trn(ref, hyp))
+        return score_trn(ref, hyp, unit=self._unit, ignore_spacing=self._ignore_spacing)
+
+    def merge(self, ids: Sequence[str]) -> tuple[Path, Path]:
+        """샤드 trn 을 확인한 뒤 `ids` 순서로 합친 ref/hyp trn 을 쓰는 함수
+
+        Raises:
+            ValueError: 샤드 id 가 겹치거나 `ids` 와 다를 때, ref 와 hyp 샤드의 id 가 다를 때
+        """
+        refs, hyps = [], []
+        for k in range(self._num_shards):
+            ref_path, hyp_path = self.shard_paths(k)
+            ref, hyp = read_trn_file(ref_path), read_trn_file(hyp_path)
+            if [r.id for r in ref] != [h.id for h in hyp]:
+                raise ValueError(f"ref and hyp ids of shard {k} differ")
+            refs.append(ref)
+            hyps.append(hyp)
+        check_shard_ids(refs, ids)
+
+        position = {id: i for i, id in enumerate(ids)}
+
+        def ordered(shards: list[list[TRNFormat]]) -> list[TRNFormat]:
+            return sorted(
+                (item for shard in shards for item in shard),
+                key=lambda item: position[item.id],
+            )
+
+        ref_path, hyp_path = self._output_dir / "ref.trn", self._output_dir / "hyp.trn"
+        make_trn_file(ordered(refs), ref_path)
+        make_trn_file(ordered(hyps), hyp_path)
+        return ref_path, hyp_path
+
+
+def _run_shard(
+    dataset: Dataset,
+    transcriber_factory: Callable[[], Callable[[np.ndarray], str]],
+    normalizer: Callable[[str], str] | None,
+    sr: int | None,
+    cpus: list[int] | None,
+    paths: tuple[Path, Path],
+    pipeline_kwargs: dict[str, Any],
+) -> tuple[Path, Path]:
+    # 모델을 만들기 전에 고정해야 내부 스레드 풀도 같은 코어를 씀
+    if cpus is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+
+    kwargs = dict(pipeline_kwargs)
+    normalizer is not None and kwargs.setdefault("normalizer", normalizer)
+    pipeline = EvaluationPipeline(transcriber_factory(), sr=sr, **kwargs)
+    refs, hyps = pipeline.run(dataset)
+
+    ref_path, hyp_path = paths
+    make_trn_file(refs, ref_path)
+    make_trn_file(hyps, hyp_path)
+    return ref_path, hyp_path
+
+
+__all__ = [
+    "ShardedEvaluator",
+    "available_cpus",
+    "cpu_sets",
+    "check_shard_ids",
+]
@@ -0,0 +1 @@
+# tests/unit/asr/__init__.py
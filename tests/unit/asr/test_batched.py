@@ -0,0 +1,147 @@
+import time
+import pytest
+import threading
+import numpy as np
+
+from types import SimpleNamespace
+
+from sjaipy.datasets import Sample
+from tests.unit.datasets.dataset._dummy_dataset import _DummyDataset
+
+pytest.importorskip("faster_whisper")
+
+from sjaipy.asr import batched  # noqa: E402
+from sjaipy.asr.batched import (  # noqa: E402
+    MAX_CHUNK_SAMPLES,
+    WHISPER_SR,
+    BatchedTranscriber,
+    _pack,
+)
+
+# _pack 이 짧은 발화를 채우는 길이
+PADDED = MAX_CHUNK_SAMPLES // 2 + WHISPER_SR // 100
+
+
+class _FakePipeline:
+    """발화마다 오디오 값을 문자열로 돌려주는 BatchedInferencePipeline"""
+
+    def __init__(self, model):
+        self.calls: list[dict] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio, clip_timestamps=None, batch_size=8, **kwargs):
+        with self._lock:
+            self.calls.append({"clips": clip_timestamps, "batch_size": batch_size})
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            # 배치마다 지연을 달리 해 끝나는 순서를 섞음
+            time.sleep(0.002 * (int(audio.max()) % 4))
+            if clip_timestamps is None:
+                return iter([_segment(0.0, len(audio) / WHISPER_SR, "long")]), None
+            return list(_clip_segments(audio, clip_timestamps)), None
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _segment(start: float, end: float, text: str) -> SimpleNamespace:
+    return SimpleNamespace(start=start, end=end, text=f" {text} ")
+
+
+def _clip_segments(audio: np.ndarray, clips: list[dict]):
+    for clip in clips:
+        start, end = clip["start"], clip["end"]
+        value = int(audio[int(start * WHISPER_SR)])
+        # 구간 경계를 조금씩 넘는 세그먼트도 중앙이 속한 발화로 가야 함
+        yield _segment(start - 0.5, start + 2.0, f"{value}a")
+        yield _segment(end - 2.0, end + 0.5, f"{value}b")
+
+
+def _dataset(n: int) -> _DummyDataset:
+    samples = [
+        Sample(
+            id=f"utt_{i:03d}",
+            load_audio=np.full(WHISPER_SR // 2, i + 1, dtype=np.float32),
+            Y={"asr": ""},
+        )
+        for i in range(n)
+    ]
+    return _DummyDataset(samples, sr=WHISPER_SR, task=("asr",))
+
+
+class TestBatchedTranscriber:
+    @pytest.fixture(autouse=True)
+    def pipeline(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(batched, "BatchedInferencePipeline", _FakePipeline)
+
+    def test_pack(self):
+        audios = [
+            np.full(WHISPER_SR, 1, dtype=np.float32),
+            np.full(PADDED + 5, 2, dtype=np.float32),
+            np.zeros(0, dtype=np.float32),
+        ]
+        packed, offsets = _pack(audios)
+
+        assert offsets.tolist() == [0, PADDED, 2 * PADDED + 5, 3 * PADDED + 5]
+        assert len(packed) == offsets[-1] and packed.dtype == np.float32
+        for audio, start, end in zip(audios, offsets[:-1], offsets[1:]):
+            np.testing.assert_array_equal(packed[start : start + len(audio)], audio)
+            assert not packed[start + len(audio) : end].any()
+        # 이웃한 두 구간이 창 하나로 합쳐지지 않음
+        assert (np.diff(offsets)[:-1] + np.diff(offsets)[1:] > MAX_CHUNK_SAMPLES).all()
+
+    def test_midpoint_grouping(self):
+        transcriber = BatchedTranscriber(object(), batch_size=4)
+        audios = [
+            np.full(WHISPER_SR * (k + 1), k + 1, dtype=np.float32) for k in range(4)
+        ]
+
+        assert transcriber.transcribe_batch(audios) == [
+            "1a 1b",
+            "2a 2b",
+            "3a 3b",
+            "4a 4b",
+        ]
+        (call,) = transcriber._pipeline.calls
+        assert [clip["start"] for clip in call["clips"]] == [
+            k * PADDED / WHISPER_SR for k in range(4)
+        ]
+
+    def test_long_audio(self):
+        transcriber = BatchedTranscriber(object(), batch_size=4)
+        audios = [
+            np.full(WHISPER_SR, 1, dtype=np.float32),
+            np.full(MAX_CHUNK_SAMPLES + 1, 2, dtype=np.float32),
+            np.full(WHISPER_SR, 3, dtype=np.float32),
+        ]
+
+        assert transcriber.transcribe_batch(audios) == ["1a 1b", "long", "3a 3b"]
+        calls = transcriber._pipeline.calls
+        assert sorted(len(call["clips"] or []) for call in calls) == [0, 2]
+
+    @pytest.mark.parametrize("num_workers,prefetch", [(1, 0), (3, 2)])
+    def test_iter_order(self, num_workers: int, prefetch: int):
+        dataset = _dataset(23)
+        stats = []
+        transcriber = BatchedTranscriber(
+            object(),
+            batch_size=3,
+            num_workers=num_workers,
+            prefetch=prefetch,
+            progress=stats.append,
+        )
+        results = transcriber.run(dataset)
+
+        assert [r.id for r in results] == [s.id for s in dataset]
+        assert [r.text for r in results] == [f"{i + 1}a {i + 1}b" for i in range(23)]
+        assert transcriber._pipeline.max_active <= num_workers
+        assert [s.num_samples for s in stats] == [3 * k for k in range(1, 8)] + [23]
+        assert transcriber.stats.audio_seconds == pytest.approx(23 * 0.5)
+
+    def test_invalid_arguments(self):
+        for kwargs in [{"batch_size": 0}, {"num_workers": 0}, {"prefetch": -1}]:
+            with pytest.raises(ValueError):
+                BatchedTranscriber(object(), **kwargs)
@@ -0,0 +1,150 @@
+import time
+import pytest
+import numpy as np
+
+from dataclasses import dataclass
+
+pytest.importorskip("faster_whisper")
+
+from sjaipy.asr import long_form  # noqa: E402
+from sjaipy.asr.batched import WHISPER_SR  # noqa: E402
+from sjaipy.asr.long_form import (  # noqa: E402
+    LongFormTranscriber,
+    _shift,
+    speech_chunks,
+)
+
+
+@dataclass
+class _Word:
+    start: float
+    end: float
+    word: str
+
+
+@dataclass
+class _Segment:
+    start: float
+    end: float
+    text: str
+    words: list[_Word] | None = None
+
+
+class _FakeModel:
+    """묶음의 첫 샘플 값을 문자열로 돌려주며, 앞 묶음일수록 늦게 끝나는 모델"""
+
+    def __init__(self):
+        self.kwargs: list[dict] = []
+
+    def transcribe(self, audio: np.ndarray, **kwargs):
+        self.kwargs.append(kwargs)
+        value = int(audio[0])
+        time.sleep(0.005 * (5 - value))
+        return iter([_Segment(0.0, len(audio) / WHISPER_SR, f" {value} ")]), None
+
+
+def _seconds(*regions: tuple[float, float]) -> list[dict]:
+    return [
+        {"start": int(start * WHISPER_SR), "end": int(end * WHISPER_SR)}
+        for start, end in regions
+    ]
+
+
+class TestSpeechChunks:
+    @pytest.fixture
+    def regions(self, monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+        regions, options = [], []
+
+        def vad(audio, vad_options, sampling_rate):
+            options.append(vad_options)
+            return list(regions)
+
+        monkeypatch.setattr(long_form, "get_speech_timestamps", vad)
+        self.options = options
+        return regions
+
+    def test_greedy_packing(self, regions: list[dict]):
+        regions += _seconds((1, 10), (12, 31), (33, 40), (41, 62), (63, 70))
+        chunks = speech_chunks(np.ones(WHISPER_SR * 70, dtype=np.float32))
+
+        # 묶음 시작부터 다음 구간 끝까지가 30초 이하일 때만 합침
+        assert chunks == [
+            (1 * WHISPER_SR, 31 * WHISPER_SR),
+            (33 * WHISPER_SR, 62 * WHISPER_SR),
+            (63 * WHISPER_SR, 70 * WHISPER_SR),
+        ]
+        assert self.options[0].max_speech_duration_s == 30
+
+    def test_split_long_region(self, regions: list[dict]):
+        # VAD 의 앞뒤 여유로 max_chunk_seconds 를 넘은 구간
+        regions += _seconds((0, 5), (6, 27.5))
+        chunks = speech_chunks(
+            np.ones(WHISPER_SR * 30, dtype=np.float32), max_chunk_seconds=10
+        )
+
+        assert chunks == [
+            (0, 5 * WHISPER_SR),
+            (6 * WHISPER_SR, 16 * WHISPER_SR),
+            (16 * WHISPER_SR, 26 * WHISPER_SR),
+            (26 * WHISPER_SR, int(27.5 * WHISPER_SR)),
+        ]
+        assert self.options[0].max_speech_duration_s == 10
+
+    def test_empty(self, regions: list[dict]):
+        assert speech_chunks(np.zeros(0, dtype=np.float32)) == []
+        assert speech_chunks(np.zeros(WHISPER_SR, dtype=np.float32)) == []
+        assert len(self.options) == 1
+
+
+class TestLongFormTranscriber:
+    def test_shift(self):
+        segment = _Segment(
+            1.0, 3.0, " a b ", words=[_Word(1.0, 2.0, " a"), _Word(2.0, 3.0, " b")]
+        )
+        shifted = _shift(segment, 10.0)
+
+        assert (shifted.start, shifted.end, shifted.text) == (11.0, 13.0, " a b ")
+        assert [(w.start, w.end, w.word) for w in shifted.words] == [
+            (11.0, 12.0, " a"),
+            (12.0, 13.0, " b"),
+        ]
+        # 원본은 그대로
+        assert (segment.start, segment.words[0].start) == (1.0, 1.0)
+        assert _shift(_Segment(0.0, 1.0, " a "), 2.0).words is None
+
+    def test_segments_in_time_order(self, monkeypatch: pytest.MonkeyPatch):
+        starts = [0, 40, 80, 120, 160]
+        monkeypatch.setattr(
+            long_form,
+            "get_speech_timestamps",
+            lambda *_, **__: _seconds(*((start, start + 20) for start in starts)),
+        )
+        audio = np.zeros(WHISPER_SR * 180, dtype=np.float32)
+        for k, start in enumerate(starts):
+            audio[start * WHISPER_SR : (start + 20) * WHISPER_SR] = k
+
+        model = _FakeModel()
+        with LongFormTranscriber(
+            model, num_workers=4, transcribe_kwargs={"vad_filter": True}
+        ) as transcriber:
+            segments = transcriber.segments(audio)
+            assert transcriber(audio) == "0 1 2 3 4"
+
+        assert [segment.start for segment in segments] == starts
+        assert [segment.end for segment in segments] == [s + 20 for s in starts]
+        assert all(not kwargs["vad_filter"] for kwargs in model.kwargs)
+
+    def test_executor_is_lazy(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(
+            long_form, "get_speech_timestamps", lambda *_, **__: _seconds((0, 1))
+        )
+        transcriber = LongFormTranscriber(_FakeModel(), num_workers=2)
+        assert transcriber._executor is None
+
+        audio = np.ones(WHISPER_SR, dtype=np.float32)
+        assert transcriber(audio) == "1"
+        transcriber.close()
+        assert transcriber._executor is None
+        # 닫은 뒤에도 다시 쓸 수 있음
+        assert transcriber(audio) == "1"
+        transcriber.close()
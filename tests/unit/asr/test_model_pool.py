@@ -0,0 +1,113 @@
+import os
+import time
+import pytest
+import numpy as np
+
+from concurrent.futures import wait
+
+from sjaipy.asr import model_pool
+from sjaipy.asr.model_pool import WhisperModelPool
+
+
+class _FakeTranscriber:
+    """첫 샘플 값으로 동작을 정하는 전사기. 음수면 오류, -99 면 프로세스 종료"""
+
+    def __call__(self, audio: np.ndarray) -> str:
+        value = int(audio[0])
+        if value == -99:
+            os._exit(1)
+        if value < 0:
+            raise ValueError(f"negative {value}")
+        time.sleep(value / 1000)
+        return f"{value}@{os.getpid()}"
+
+    def transcribe_batch(self, audios: list[np.ndarray]) -> list[str]:
+        return [self(audio) for audio in audios]
+
+
+class _FakePool(WhisperModelPool):
+    @staticmethod
+    def _load(config: dict, cpu_threads: int) -> _FakeTranscriber:
+        if config["model"] == "missing":
+            raise FileNotFoundError("missing model")
+        return _FakeTranscriber()
+
+
+def _audio(value: int) -> np.ndarray:
+    return np.full(4, value, dtype=np.float32)
+
+
+class TestWhisperModelPool:
+    @pytest.fixture
+    def pool(self):
+        with _FakePool("fake", 2, pin=False) as pool:
+            yield pool
+
+    def test_routing(self, pool: WhisperModelPool):
+        # 오래 걸리는 요청을 섞어 결과가 제출 순서와 다르게 돌아오게 함
+        values = [30, 1, 20, 2, 10, 3, 0, 5]
+        futures = [pool.submit(_audio(v)) for v in values]
+        batch = pool.submit_batch([_audio(v) for v in [7, 6, 5]])
+
+        texts = [future.result(timeout=30) for future in futures]
+        assert [text.split("@")[0] for text in texts] == [str(v) for v in values]
+        assert [text.split("@")[0] for text in batch.result(timeout=30)] == [
+            "7",
+            "6",
+            "5",
+        ]
+        assert pool(_audio(4)).startswith("4@")
+        assert len({text.split("@")[1] for text in texts}) == 2
+
+    def test_worker_error(self, pool: WhisperModelPool):
+        futures = [pool.submit(_audio(v)) for v in [1, -1, 2]]
+        batch = pool.submit_batch([_audio(3), _audio(-2)])
+
+        assert futures[0].result(timeout=30).startswith("1@")
+        with pytest.raises(ValueError, match="negative -1"):
+            futures[1].result(timeout=30)
+        assert futures[2].result(timeout=30).startswith("2@")
+        with pytest.raises(ValueError, match="negative -2"):
+            batch.result(timeout=30)
+        # 오류 뒤에도 워커는 계속 요청을 받음
+        assert pool(_audio(5)).startswith("5@")
+
+    def test_load_error(self):
+        with pytest.raises(FileNotFoundError, match="missing model"):
+            _FakePool("missing", 2, pin=False)
+
+    def test_killed_worker(self):
+        with _FakePool("fake", 1, pin=False) as pool:
+            slow = pool.submit(_audio(200))
+            killed = pool.submit(_audio(-99))
+            after = pool.submit(_audio(1))
+            wait([slow, killed, after], timeout=30)
+
+            assert slow.result().startswith("200@")
+            for future in [killed, after]:
+                with pytest.raises(RuntimeError, match="died"):
+                    future.result()
+            with pytest.raises(RuntimeError, match="died"):
+                pool.submit(_audio(1))
+
+    def test_close(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(model_pool, "CLOSE_TIMEOUT", 0.5)
+        pool = _FakePool("fake", 1, pin=False)
+        done = pool.submit(_audio(0))
+        assert done.result(timeout=30).startswith("0@")
+
+        # 워커가 CLOSE_TIMEOUT 안에 끝내지 못한 요청은 실패로 끝남
+        leftover = [pool.submit(_audio(5_000)), pool.submit(_audio(1))]
+        pool.close()
+        for future in leftover:
+            with pytest.raises(RuntimeError, match="closed"):
+                future.result(timeout=0)
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.submit(_audio(1))
+        pool.close()
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            _FakePool("fake", 0)
+        with pytest.raises(ValueError):
+            _FakePool("fake", 2, cpus=[0])
@@ -0,0 +1,54 @@
+import pytest
+import numpy as np
+
+from scipy.signal import resample_poly
+
+from sjaipy.audio import resample, resample_batch
+
+
+class TestResampler:
+    @pytest.fixture
+    def rng(self):
+        return np.random.default_rng(seed=42)
+
+    @pytest.mark.parametrize(
+        "orig_sr,target_sr",
+        [(48_000, 16_000), (44_100, 16_000), (8_000, 16_000), (22_050, 16_000)],
+    )
+    def test_matches_resample_poly(
+        self, rng: np.random.Generator, orig_sr: int, target_sr: int
+    ):
+        audio = rng.standard_normal(orig_sr // 3)
+        expected = resample_poly(audio, target_sr, orig_sr)
+        result = resample(audio, orig_sr, target_sr)
+        assert result.shape == expected.shape
+        np.testing.assert_allclose(result, expected, atol=1e-10)
+
+    def test_same_rate(self, rng: np.random.Generator):
+        audio = rng.standard_normal(100)
+        assert resample(audio, 16_000, 16_000) is audio
+
+    def test_keeps_float32(self, rng: np.random.Generator):
+        audio = rng.standard_normal(4_410).astype(np.float32)
+        assert resample(audio, 44_100, 16_000).dtype == np.float32
+
+    def test_batch_matches_single(self, rng: np.random.Generator):
+        audios = [rng.standard_normal(n) for n in (1_000, 4_410, 17, 9_600, 2_205)]
+        srs = [48_000, 44_100, 44_100, 48_000, 16_000]
+        result = resample_batch(audios, srs, 16_000)
+        assert len(result) == len(audios)
+        for audio, sr, out in zip(audios, srs, result):
+            np.testing.assert_allclose(out, resample(audio, sr, 16_000), atol=1e-10)
+
+    def test_batch_shared_rate(self, rng: np.random.Generator):
+        audios = [rng.standard_normal(n) for n in (480, 960)]
+        result = resample_batch(audios, 48_000, 16_000)
+        assert [len(out) for out in result] == [160, 320]
+
+    def test_invalid(self, rng: np.random.Generator):
+        with pytest.raises(ValueError):
+            resample(rng.standard_normal(10), 0, 16_000)
+        with pytest.raises(ValueError):
+            resample_batch([rng.standard_normal(10)], [16_000, 8_000], 16_000)
+        with pytest.raises(ValueError):
+            resample_batch([rng.standard_normal((2, 10))], 8_000, 16_000)
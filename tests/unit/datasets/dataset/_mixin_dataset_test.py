@@ -53,6 +53,52 @@ class _MixinDatasetTest:
         for i, sample in enumerate(dataset):
             assert sample == samples[i]
 
+    def test_iter_labels(self, dataset: Dataset, samples: list[Sample]):
+        labels = list(dataset.iter_labels())
+        assert len(labels) == len(samples)
+        for (_id, Y), sample in zip(labels, samples):
+            assert _id == sample.id
+            assert Y == sample.Y
+
+    def test_get_batch(self, dataset: Dataset, samples: list[Sample]):
+        # contiguous
+        batch = dataset.get_batch(range(0, len(samples) // 2))
+        assert batch == samples[: len(samples) // 2]
+
+        # scattered
+        indices = [i for i in range(len(samples) - 1, -1, -3)]
+        batch = dataset.get_batch(indices)
+        assert batch == [samples[i] for i in indices]
+
+        assert dataset.get_batch([]) == []
+
+    def test_iter_batch(self, dataset: Dataset, samples: list[Sample]):
+        batches = list(dataset.iter_batch(7))
+        assert all(len(batch) <= 7 for batch in batches)
+        assert [s for batch in batches for s in batch] == samples
+
+        with pytest.raises(ValueError):
+            next(dataset.iter_batch(0))
+
+    def test_durations(self, dataset: Dataset, samples: list[Sample]):
+        durations = dataset.durations()
+        assert len(durations) == len(samples)
+        assert all(d >= 0 for d in durations)
+
+    def test_filter(self, dataset: Dataset, samples: list[Sample]):
+        ids = {sample.id for sample in samples[::2]}
+        filtered = dataset.filter(lambda _id, Y: _id in ids)
+        assert filtered.samples_to_list() == samples[::2]
+
+        durations = dataset.durations()
+        bound = float(np.median(durations))
+        filtered = dataset.filter(max_duration=bound)
+        assert len(filtered) == sum(d <= bound for d in durations)
+        filtered = dataset.filter(min_duration=bound)
+        assert len(filtered) == sum(d >= bound for d in durations)
+        filtered = dataset.filter(max_duration=bound, num_proc=2)
+        assert len(filtered) == sum(d <= bound for d in durations)
+
     def test__getitem__(self, dataset: Dataset, samples: list[Sample]):
         # int
         for i in range(len(samples)):
@@ -0,0 +1,67 @@
+import os
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+from sjaipy.datasets.esic_v1 import audio_cache
+from sjaipy.datasets.esic_v1.audio_cache import AudioCache
+
+
+class _FakeStream:
+    def __init__(self, calls: list[dict]):
+        self._calls = calls
+
+    def output(self, _, **kwargs):
+        self._calls.append(kwargs)
+        return self
+
+    def run(self, **_):
+        # 1초 분량의 0.5
+        dtype = "<f4" if self._calls[-1]["format"] == "f32le" else "<i2"
+        value = 0.5 if dtype == "<f4" else 16_384
+        return np.full(self._calls[-1]["ar"], value, dtype=dtype).tobytes(), b""
+
+
+class TestAudioCache:
+    @pytest.fixture
+    def calls(self, monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+        calls = []
+        monkeypatch.setattr(
+            audio_cache.ffmpeg,
+            "input",
+            lambda *_, **__: _FakeStream(calls),
+            raising=False,
+        )
+        return calls
+
+    @pytest.fixture
+    def source(self, tmp_path: Path) -> Path:
+        source = tmp_path / "en.OS.man-diar.mp4"
+        source.write_bytes(b"mp4")
+        return source
+
+    @pytest.mark.parametrize("dtype", ["float32", "int16"])
+    def test_load(self, calls: list[dict], source: Path, tmp_path: Path, dtype: str):
+        cache = AudioCache(tmp_path / "cache", dtype=dtype)
+        audio = cache.load(source, 16_000)
+        assert audio.dtype == np.float32
+        np.testing.assert_allclose(audio, np.full(16_000, 0.5))
+        assert calls[0]["ac"] == 1 and calls[0]["map"] == "0:a:0"
+
+        cache.load(source, 16_000)
+        assert len(calls) == 1
+
+    def test_key(self, calls: list[dict], source: Path, tmp_path: Path):
+        cache = AudioCache(tmp_path / "cache")
+        cache.load(source, 16_000)
+        assert len(cache.load(source, 8_000)) == 8_000
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        cache.load(source, 16_000)
+        assert len(calls) == 3
+
+    def test_invalid_dtype(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            AudioCache(tmp_path, dtype="float16")
@@ -0,0 +1,64 @@
+import os
+import pytest
+
+from pathlib import Path
+
+from sjaipy.datasets.esic_v1.directory_index import DirectoryIndex
+from sjaipy.datasets.esic_v1.file_type import FILE_TYPE, MP4, VERBATIM
+from sjaipy.datasets.esic_v1.service import search_dirs, select_file_from_dir
+
+
+class TestDirectoryIndex:
+    @pytest.fixture
+    def root(self, tmp_path: Path) -> Path:
+        root = tmp_path / "ESIC"
+        for split in ("dev", "test"):
+            for i in range(3):
+                d = root / split / f"speech{i}" / "en"
+                d.mkdir(parents=True)
+                (d / FILE_TYPE[MP4]["file"]).touch()
+                (d / FILE_TYPE[VERBATIM]["file"]).write_text("text")
+        (root / "dev" / "empty").mkdir()
+        return root
+
+    @pytest.fixture
+    def index_dir(self, tmp_path: Path) -> Path:
+        return tmp_path / "index"
+
+    def test_data_dirs(self, root: Path, index_dir: Path):
+        index = DirectoryIndex(root, index_dir=index_dir)
+        dirs = index.data_dirs(root / "dev")
+        assert dirs == [root / "dev" / f"speech{i}" / "en" for i in range(3)]
+        assert len(index.data_dirs()) == 6
+        assert index.data_dirs(root / "dev", excludes={str(dirs[0])}) == dirs[1:]
+        assert search_dirs(root / "dev", index=index) == dirs
+
+    def test_file(self, root: Path, index_dir: Path):
+        index = DirectoryIndex(root, index_dir=index_dir)
+        d = root / "test" / "speech1" / "en"
+        assert index.file(d, VERBATIM) == d / FILE_TYPE[VERBATIM]["file"]
+        assert select_file_from_dir(d, MP4, index) == d / FILE_TYPE[MP4]["file"]
+        with pytest.raises(FileNotFoundError):
+            index.file(d, "o")
+        with pytest.raises(ValueError):
+            index.file(d, "unknown")
+
+    def test_persistent(self, root: Path, index_dir: Path, monkeypatch):
+        DirectoryIndex(root, index_dir=index_dir)
+
+        def fail(path):
+            raise AssertionError("rescanned")
+
+        monkeypatch.setattr(DirectoryIndex, "_scan_dir", staticmethod(fail))
+        assert len(DirectoryIndex(root, index_dir=index_dir).data_dirs()) == 6
+
+    def test_invalidate(self, root: Path, index_dir: Path):
+        index = DirectoryIndex(root, index_dir=index_dir)
+        d = root / "dev" / "speech3" / "en"
+        d.mkdir(parents=True)
+        (d / FILE_TYPE[MP4]["file"]).touch()
+        # 같은 mtime 으로 보이지 않도록 부모 디렉터리 시간을 옮김
+        os.utime(root / "dev", ns=(0, index._dirs["dev"]["mtime"] + 1))
+        assert (
+            len(DirectoryIndex(root, index_dir=index_dir).data_dirs(root / "dev")) == 4
+        )
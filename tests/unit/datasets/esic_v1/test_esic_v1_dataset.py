@@ -0,0 +1,46 @@
+import pytest
+
+from pathlib import Path
+
+from sjaipy.datasets.esic_v1 import ESICv1, ESICv1Dataset
+from sjaipy.datasets.esic_v1.file_type import FILE_TYPE, MP4, VERBATIM
+
+
+class TestESICv1DatasetLabels:
+    @pytest.fixture
+    def root(self, tmp_path: Path) -> Path:
+        root = tmp_path / "ESIC"
+        for i in range(5):
+            d = root / "v1.1" / "dev" / f"speech{i}" / "en"
+            d.mkdir(parents=True)
+            (d / FILE_TYPE[MP4]["file"]).touch()
+            (d / FILE_TYPE[VERBATIM]["file"]).write_text(f"text {i}")
+        return root
+
+    @pytest.fixture
+    def dataset(self, root: Path, tmp_path: Path) -> ESICv1Dataset:
+        return ESICv1(root, index_dir=tmp_path / "index", num_workers=4).dev()
+
+    def test_preloaded(self, dataset: ESICv1Dataset):
+        for y in dataset.args["Y"]:
+            y.unlink()
+        assert [s.ASR for s in dataset] == [f"text {i}" for i in range(5)]
+        assert list(dataset.iter_labels()) == [(s.id, s.Y) for s in dataset]
+
+    def test_save_load(self, dataset: ESICv1Dataset, tmp_path: Path):
+        path = tmp_path / "dataset.json"
+        dataset.save(path)
+        for y in dataset.args["Y"]:
+            y.unlink()
+        loaded = ESICv1Dataset.load(path)
+        assert loaded.samples_to_list() == dataset.samples_to_list()
+        assert [s.Y for s in loaded] == [s.Y for s in dataset]
+
+    def test_parallel(self, dataset: ESICv1Dataset):
+        args = dataset.args
+        sequential = ESICv1Dataset(args["X"], args["Y"])
+        assert [s.Y for s in sequential] == [s.Y for s in dataset]
+        assert [s.Y for s in sequential[[3, 1]]] == [
+            {"asr": "text 3"},
+            {"asr": "text 1"},
+        ]
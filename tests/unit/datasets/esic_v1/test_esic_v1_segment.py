@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+
+from pathlib import Path
+from typing_extensions import override
+
+from sjaipy.datasets import Dataset, Sample, Task
+from sjaipy.datasets.esic_v1 import ESICv1, ESICv1SegmentDataset, Segment
+from sjaipy.datasets.esic_v1.audio_cache import AudioCache
+from sjaipy.datasets.esic_v1.file_type import FILE_TYPE, MP4, ORTO_TS, VERT_TS
+from sjaipy.datasets.esic_v1.segment import parse_orto_ts, parse_vert_ts
+
+from tests.unit.datasets.dataset._mixin_dataset_test import _MixinDatasetTest
+
+SAMPLE_RATE = 16_000
+VERT = """<doc id="1">
+<s>
+0.50\t0.90\thello\tHello\t1\tx
+0.90\t1.20\tworld\tworld.\t1\tx
+</s>
+<s>
+2.00\t2.40\tgood\tGood\t2\tx
+2.40\t3.10\tmorning\tmorning!\t2\tx
+</s>
+</doc>
+"""
+
+
+def _write_session(root: Path, name: str, n: int) -> Path:
+    d = root / "v1.1" / "test" / name / "en"
+    d.mkdir(parents=True)
+    (d / FILE_TYPE[MP4]["file"]).write_bytes(name.encode("utf-8"))
+    lines = [f"{i * 1.5:.2f} {i * 1.5 + 1.0:.2f} sentence {name} {i}" for i in range(n)]
+    (d / FILE_TYPE[ORTO_TS]["file"]).write_text("\n".join(lines), encoding="utf-8")
+    (d / FILE_TYPE[VERT_TS]["file"]).write_text(VERT, encoding="utf-8")
+    return d
+
+
+class TestSegmentParsers:
+    def test_vert_ts(self, tmp_path: Path):
+        path = tmp_path / "vert+ts"
+        path.write_text(VERT, encoding="utf-8")
+        assert parse_vert_ts(path) == [
+            Segment(0.5, 1.2, "hello world"),
+            Segment(2.0, 3.1, "good morning"),
+        ]
+
+    def test_orto_ts(self, tmp_path: Path):
+        path = tmp_path / "o+ts"
+        path.write_text("1.0 2.5 second one\n\n0 0.5 first\nbroken line\n")
+        assert parse_orto_ts(path) == [
+            Segment(0.0, 0.5, "first"),
+            Segment(1.0, 2.5, "second one"),
+        ]
+
+
+class TestESICv1SegmentDataset(_MixinDatasetTest):
+    @pytest.fixture
+    def dataset(self, tmp_path: Path) -> ESICv1SegmentDataset:
+        root = tmp_path / "ESIC"
+        for i in range(4):
+            _write_session(root, f"speech{i}", 8)
+
+        # 디코딩 없이 캐시를 미리 채움
+        cache_dir = tmp_path / "cache"
+        cache = AudioCache(cache_dir)
+        for i in range(4):
+            source = (
+                root / "v1.1" / "test" / f"speech{i}" / "en" / FILE_TYPE[MP4]["file"]
+            )
+            path = cache.path(source, SAMPLE_RATE)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            audio = np.arange(SAMPLE_RATE * 14, dtype=np.float32) / SAMPLE_RATE
+            np.save(path, audio)
+
+        esic = ESICv1(root, index_dir=tmp_path / "index", audio_cache_dir=cache_dir)
+        return esic.segments("test")
+
+    @pytest.fixture
+    def sample_rate(self, dataset: Dataset):
+        return dataset.sr
+
+    @pytest.fixture
+    def task(self, dataset: Dataset):
+        return dataset.task
+
+    @pytest.fixture
+    def samples(self, dataset: Dataset):
+        return [sample for sample in dataset]
+
+    @override
+    def test_task_diarization(
+        self, dataset: Dataset, samples: list[Sample], task: Task
+    ):
+        return  # ESICv1 does not support diarization task
+
+    @override
+    def test_get(self, dataset: Dataset, samples: list[Sample]):
+        for i in range(len(samples)):
+            assert dataset.get(i) == samples[i]
+        dataset.get(-1)
+        with pytest.raises(IndexError):
+            dataset.get(len(samples))
+
+    def test_segment_audio(self, dataset: ESICv1SegmentDataset):
+        assert len(dataset) == 32
+        sample = dataset[1]
+        assert sample.ASR == "sentence speech0 1"
+        audio = sample.audio
+        assert len(audio) == SAMPLE_RATE
+        np.testing.assert_allclose(audio[0], 1.5)
+
+        batch = dataset.get_batch([3, 1], num_workers=2)
+        np.testing.assert_allclose(batch[1].audio, audio)
+
+    def test_segment_durations(self, dataset: ESICv1SegmentDataset):
+        np.testing.assert_allclose(dataset.durations(), [1.0] * len(dataset))
@@ -0,0 +1,90 @@
+import pytest
+
+from pathlib import Path
+from datasets import Dataset as DT, load_from_disk
+
+from sjaipy.datasets.hugging_face import DatasetCache
+from sjaipy.datasets.hugging_face.dataset_cache import CacheKey
+from sjaipy.datasets.hugging_face.zeroth_korean import ZerothKoreanDataset
+
+
+class TestDatasetCache:
+    @pytest.fixture
+    def load(self):
+        def load(n: int = 10) -> ZerothKoreanDataset:
+            table = DT.from_dict(
+                {
+                    "path": [f"p/{i}" for i in range(n)],
+                    "text": [f"t{i}" for i in range(n)],
+                    "speaker_id": [0] * n,
+                }
+            )
+            return ZerothKoreanDataset(table, 16_000, ("asr",))
+
+        return load
+
+    @staticmethod
+    def key(split: str, sr: int = 16_000) -> CacheKey:
+        return CacheKey("org/ds", None, "default", split, sr, ("asr",))
+
+    def test_hit_miss(self, load):
+        cache = DatasetCache()
+        first = cache.get_or_load(self.key("test"), load)
+        second = cache.get_or_load(self.key("test"), load)
+        assert second.args["dataset"] is first.args["dataset"]
+        other = cache.get_or_load(self.key("test", sr=8_000), load)
+        assert other.args["dataset"] is not first.args["dataset"]
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+
+    def test_returns_copy(self, load):
+        cache = DatasetCache()
+        first = cache.get_or_load(self.key("test"), load)
+        first.sr = 8_000
+        first.task = ("diarization",)
+
+        second = cache.get_or_load(self.key("test"), load)
+        assert second is not first
+        assert (second.sr, second.task) == (16_000, ("asr",))
+
+    def test_max_entries(self, load):
+        cache = DatasetCache(max_entries=2)
+        for split in ("train", "validation", "test"):
+            cache.get_or_load(self.key(split), load)
+        assert self.key("train") not in cache
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+    def test_max_bytes(self, load):
+        nbytes = load().args["dataset"].data.nbytes
+        cache = DatasetCache(max_entries=None, max_bytes=nbytes * 2)
+        for split in ("train", "validation", "test"):
+            cache.get_or_load(self.key(split), load)
+        assert len(cache) == 2
+        assert cache.stats.nbytes <= nbytes * 2
+
+    def test_memory_mapped_size(self, load, tmp_path: Path):
+        load().args["dataset"].save_to_disk(tmp_path / "ds")
+
+        def load_from_file() -> ZerothKoreanDataset:
+            table = load_from_disk(tmp_path / "ds")
+            return ZerothKoreanDataset(table, 16_000, ("asr",))
+
+        cache = DatasetCache()
+        cache.get_or_load(self.key("train"), load_from_file)
+        view = cache.get_or_load(
+            self.key("test"), lambda: load_from_file().select([2, 0])
+        )
+        # 파일에 매핑된 블록은 세지 않고, 메모리의 indices 만 셈
+        assert cache.stats.nbytes == view.args["dataset"]._indices.nbytes
+
+    def test_evict(self, load):
+        cache = DatasetCache()
+        for split in ("train", "test"):
+            cache.get_or_load(self.key(split), load)
+        assert cache.evict(split="train") == 1
+        assert self.key("test") in cache
+        assert cache.evict() == 1
+        assert len(cache) == 0
+        with pytest.raises(ValueError):
+            cache.evict(unknown=1)
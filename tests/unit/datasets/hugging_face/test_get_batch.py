@@ -0,0 +1,66 @@
+import io
+import pytest
+import numpy as np
+import soundfile as sf
+
+from datasets import Audio, Dataset as DT, Features, Value
+
+from sjaipy.datasets.hugging_face.zeroth_korean import ZerothKoreanDataset
+
+NUM_ROWS = 10
+
+
+class TestGetBatch:
+    @pytest.fixture(params=[False, True], ids=["raw", "preprocessed"])
+    def dataset(self, request: pytest.FixtureRequest) -> ZerothKoreanDataset:
+        rng = np.random.default_rng(seed=42)
+        audios = []
+        for i in range(NUM_ROWS):
+            buffer = io.BytesIO()
+            audio = (rng.standard_normal(80 * (i + 1)) * 0.1).astype(np.float32)
+            sf.write(buffer, audio, 8_000, format="WAV")
+            audios.append({"bytes": buffer.getvalue(), "path": f"{i}.wav"})
+
+        table = DT.from_dict(
+            {
+                "audio": audios,
+                "path": [f"p/{i}" for i in range(NUM_ROWS)],
+                "text": [f"text {i}" for i in range(NUM_ROWS)],
+                "speaker_id": [i % 2 for i in range(NUM_ROWS)],
+            },
+            features=Features(
+                {
+                    "audio": Audio(),
+                    "path": Value("string"),
+                    "text": Value("string"),
+                    "speaker_id": Value("int64"),
+                }
+            ),
+        )
+        dataset = ZerothKoreanDataset(table, 16_000, ("asr",))
+        return dataset.preprocess() if request.param else dataset
+
+    @pytest.mark.parametrize("decode_audio", [True, False])
+    @pytest.mark.parametrize(
+        "indices", [[8, 9, 10], [NUM_ROWS], [-NUM_ROWS - 1], [0, 12, 1]]
+    )
+    def test_out_of_range(
+        self, dataset: ZerothKoreanDataset, indices: list[int], decode_audio: bool
+    ):
+        with pytest.raises(IndexError):
+            dataset.get_batch(indices, decode_audio=decode_audio)
+
+    @pytest.mark.parametrize("decode_audio", [True, False])
+    def test_negative_index(self, dataset: ZerothKoreanDataset, decode_audio: bool):
+        batch = dataset.get_batch([-1, -2], decode_audio=decode_audio)
+        expected = [dataset.get(NUM_ROWS - 1), dataset.get(NUM_ROWS - 2)]
+        assert [sample.id for sample in batch] == [sample.id for sample in expected]
+        for e, r in zip(expected, batch):
+            np.testing.assert_allclose(e.audio, r.audio, atol=1e-6)
+
+    def test_contiguous_tail(self, dataset: ZerothKoreanDataset):
+        batch = dataset.get_batch([8, 9])
+        assert [sample.id for sample in batch] == [
+            dataset.get(8).id,
+            dataset.get(9).id,
+        ]
@@ -0,0 +1,152 @@
+import io
+import pytest
+import numpy as np
+import soundfile as sf
+
+from pathlib import Path
+from datasets import Audio, Dataset as DT, Features, Value
+
+from sjaipy.datasets.hugging_face.hugging_face_iterable_dataset import (
+    HuggingFaceIterableDataset,
+)
+from sjaipy.datasets.hugging_face.hugging_face_dataset import HuggingFaceDataset
+from sjaipy.datasets.hugging_face.tedlium import DEFAULT_IGNORE_SET, TedliumDataset
+
+
+class TestHuggingFaceIterableDataset:
+    @pytest.fixture
+    def table(self) -> DT:
+        rng = np.random.default_rng(seed=0)
+        audios = []
+        for i in range(7):
+            buffer = io.BytesIO()
+            audio = (rng.standard_normal(400 * (i + 1)) * 0.1).astype(np.float32)
+            sf.write(buffer, audio, 16_000, format="WAV")
+            audios.append({"bytes": buffer.getvalue(), "path": f"{i}.wav"})
+        return DT.from_dict(
+            {
+                "audio": audios,
+                "id": [f"talk-{i}" for i in range(7)],
+                "text": [f"text {i}" for i in range(7)],
+                "speaker_id": [f"spk{i % 2}" for i in range(7)],
+            },
+            features=Features(
+                {
+                    "audio": Audio(),
+                    "id": Value("string"),
+                    "text": Value("string"),
+                    "speaker_id": Value("string"),
+                }
+            ),
+        )
+
+    @pytest.fixture
+    def expected(self, table: DT) -> list[str]:
+        return table["text"]
+
+    @staticmethod
+    def texts(dataset: HuggingFaceIterableDataset) -> list[str]:
+        return [Y["asr"] for _, Y in dataset.iter_labels()]
+
+    @staticmethod
+    def stream(table: DT, **kwargs) -> HuggingFaceIterableDataset:
+        return HuggingFaceIterableDataset(
+            table.to_iterable_dataset(),
+            TedliumDataset,
+            16_000,
+            ("asr",),
+            dataset_kwargs={"ignore_set": DEFAULT_IGNORE_SET},
+            length=len(table),
+            batch_size=3,
+            **kwargs,
+        )
+
+    def test_same_samples(self, table: DT, capsys: pytest.CaptureFixture):
+        expected = TedliumDataset(table, 16_000, ("asr",), DEFAULT_IGNORE_SET)
+        capsys.readouterr()
+
+        dataset = self.stream(table)
+        for sample, result in zip(expected, dataset.iter()):
+            assert (result.id, result.Y) == (sample.id, sample.Y)
+            np.testing.assert_allclose(result.audio, sample.audio)
+        assert list(dataset.iter_labels()) == list(expected.iter_labels())
+        assert dataset.get(4).Y == expected.get(4).Y
+
+        # 배치나 get 마다 dataset_type 을 새로 만들지 않음
+        assert capsys.readouterr().out.count("[WARN]") == 1
+
+    def test_buffer_size(self, table: DT):
+        dataset = self.stream(table, buffer_size=4)
+        assert dataset.get(3).Y == {"asr": "text 3"}
+        with pytest.raises(IndexError):
+            dataset.get(4)
+        with pytest.raises(IndexError):
+            dataset.select([0, 5])
+
+    def test_skip_take(self, table: DT, expected: list[str]):
+        dataset = self.stream(table)
+        result = dataset.skip(2).take(3)
+        assert self.texts(result) == expected[2:5]
+        assert len(result) == 3
+        # 원본은 바뀌지 않음
+        assert self.texts(dataset) == expected
+
+        result = dataset.slice(1, 6, 2)
+        assert self.texts(result) == expected[1:6:2]
+        assert len(result) == len(expected[1:6:2])
+        assert len(dataset.skip(10)) == 0
+
+    def test_shuffle(self, table: DT, expected: list[str]):
+        dataset = self.stream(table)
+        result = self.texts(dataset.shuffle(seed=3, buffer_size=7))
+        assert sorted(result) == sorted(expected)
+        assert result != expected
+        assert self.texts(dataset.shuffle(seed=3, buffer_size=7)) == result
+
+    def test_shard(self, table: DT, expected: list[str]):
+        dataset = self.stream(table)
+        shards = [self.texts(dataset.shard(3, index)) for index in range(3)]
+        assert sorted(text for shard in shards for text in shard) == sorted(expected)
+        assert all(shards)
+        with pytest.raises(TypeError):
+            len(dataset.shard(3, 0))
+        with pytest.raises(IndexError):
+            dataset.shard(3, 3)
+
+    def test_select(self, table: DT, expected: list[str]):
+        selected = self.stream(table).skip(1).select([3, 0])
+        assert isinstance(selected, TedliumDataset)
+        assert isinstance(selected, HuggingFaceDataset)
+        assert [sample.Y["asr"] for sample in selected] == [expected[4], expected[1]]
+
+    def test_serialization(self, table: DT, expected: list[str], tmp_path: Path):
+        path = tmp_path / "train.parquet"
+        table.to_parquet(str(path))
+        source = {"path": "parquet", "data_files": str(path), "split": "train"}
+        dataset = HuggingFaceIterableDataset(
+            DT.from_parquet(str(path)).to_iterable_dataset(),
+            TedliumDataset,
+            16_000,
+            ("asr",),
+            dataset_kwargs={"ignore_set": DEFAULT_IGNORE_SET},
+            source=source,
+            batch_size=3,
+            buffer_size=5,
+        )
+        dataset = dataset.skip(1).shuffle(seed=5, buffer_size=7).take(4)
+
+        data = dataset.to_dict()
+        assert data["ops"] == [
+            ["skip", {"n": 1}],
+            ["shuffle", {"seed": 5, "buffer_size": 7}],
+            ["take", {"n": 4}],
+        ]
+        restored = HuggingFaceIterableDataset.from_dict(data)
+        assert isinstance(restored, HuggingFaceIterableDataset)
+        assert len(self.texts(restored)) == 4
+        assert self.texts(restored) == self.texts(dataset)
+        assert set(self.texts(restored)) <= set(expected[1:])
+        assert restored.to_dict() == data
+
+        with pytest.raises(ValueError):
+            self.stream(table).to_dict()
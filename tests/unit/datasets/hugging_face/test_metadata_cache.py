@@ -0,0 +1,115 @@
+import json
+import pytest
+
+from pathlib import Path
+
+from huggingface_hub.errors import LocalEntryNotFoundError
+
+from sjaipy.datasets.hugging_face import metadata_cache
+from sjaipy.datasets.hugging_face import DatasetLoader, MetadataCache
+
+
+class TestMetadataCache:
+    @pytest.fixture
+    def calls(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[str]:
+        calls = []
+
+        def config_names(path, revision=None):
+            calls.append("configs")
+            return ["cfg", "other"]
+
+        def split_names(path, config_name, revision=None):
+            calls.append("splits")
+            return ["train", "test", "validation"]
+
+        monkeypatch.setattr(metadata_cache, "get_dataset_config_names", config_names)
+        monkeypatch.setattr(metadata_cache, "get_dataset_split_names", split_names)
+        monkeypatch.setattr(metadata_cache.config, "HF_DATASETS_CACHE", str(tmp_path))
+        # 환경의 HF_HUB_OFFLINE 과 무관하게 온라인 경로를 기본으로 함
+        monkeypatch.setattr(metadata_cache.config, "HF_HUB_OFFLINE", False)
+
+        info = tmp_path / "org___ds" / "cfg" / "0.0.0" / "hash"
+        info.mkdir(parents=True)
+        (info / "dataset_info.json").write_text(
+            json.dumps({"config_name": "cfg", "splits": {"train": {}, "test": {}}})
+        )
+        return calls
+
+    @pytest.fixture
+    def cache_path(self, tmp_path: Path) -> Path:
+        return tmp_path / "metadata.json"
+
+    def test_local_validation(self, calls: list[str], cache_path: Path):
+        loader = DatasetLoader("org/ds", metadata_cache=MetadataCache(cache_path))
+        loader._validate("cfg", "train")
+        assert calls == []
+
+    def test_unknown_split(self, calls: list[str], cache_path: Path):
+        loader = DatasetLoader("org/ds", metadata_cache=MetadataCache(cache_path))
+        with pytest.raises(ValueError):
+            loader._validate("cfg", "dev")
+        assert calls == ["splits"]
+
+    def test_persistent(self, calls: list[str], cache_path: Path):
+        cache = MetadataCache(cache_path)
+        assert cache.config_names("org/ds") == ["cfg", "other"]
+        assert cache.split_names("org/ds", "cfg") == ["train", "test", "validation"]
+        calls.clear()
+
+        cache = MetadataCache(cache_path)
+        assert cache.config_names("org/ds") == ["cfg", "other"]
+        assert cache.split_names("org/ds", "cfg") == ["train", "test", "validation"]
+        assert calls == []
+
+    def test_invalidate(self, calls: list[str], cache_path: Path):
+        cache = MetadataCache(cache_path)
+        cache.config_names("org/ds")
+        cache.invalidate("org/ds")
+        cache.config_names("org/ds")
+        assert calls == ["configs", "configs"]
+
+    @pytest.fixture
+    def failing(self, monkeypatch: pytest.MonkeyPatch, calls: list[str]):
+        def fail(error: Exception):
+            def names(*_, **__):
+                calls.append("hub")
+                raise error
+
+            monkeypatch.setattr(metadata_cache, "get_dataset_config_names", names)
+            monkeypatch.setattr(metadata_cache, "get_dataset_split_names", names)
+
+        return fail
+
+    def test_offline(
+        self, calls: list[str], cache_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(metadata_cache.config, "HF_HUB_OFFLINE", True)
+        cache = MetadataCache(cache_path)
+        assert cache.config_names("org/ds") == ["cfg"]
+        assert cache.split_names("org/ds", "cfg") == ["train", "test"]
+        assert calls == []
+
+    def test_unreachable(self, calls: list[str], cache_path: Path, failing):
+        # datasets 가 연결 실패를 감싸 올리는 형태
+        try:
+            raise LocalEntryNotFoundError("cannot reach the hub")
+        except LocalEntryNotFoundError as cause:
+            error = FileNotFoundError("Couldn't find 'org/ds'")
+            error.__cause__ = cause
+        failing(error)
+
+        cache = MetadataCache(cache_path)
+        assert cache.config_names("org/ds") == ["cfg"]
+        assert cache.split_names("org/ds", "cfg") == ["train", "test"]
+        assert calls == ["hub"]
+        with pytest.raises(FileNotFoundError):
+            cache.config_names("org/unknown")
+
+    def test_hub_error(self, calls: list[str], cache_path: Path, failing):
+        failing(FileNotFoundError("Dataset 'org/ds' doesn't exist on the Hub"))
+        cache = MetadataCache(cache_path)
+        with pytest.raises(FileNotFoundError):
+            cache.config_names("org/ds")
+        failing(ValueError("bad revision"))
+        with pytest.raises(ValueError):
+            cache.split_names("org/ds", "cfg")
@@ -0,0 +1,69 @@
+import io
+import pytest
+import numpy as np
+import soundfile as sf
+
+from datasets import Audio, Dataset as DT, Features, Value
+
+from sjaipy.datasets.hugging_face.zeroth_korean import ZerothKoreanDataset
+
+
+class TestPreprocess:
+    @pytest.fixture
+    def dataset(self) -> ZerothKoreanDataset:
+        rng = np.random.default_rng(seed=42)
+        audios = []
+        for i in range(6):
+            buffer = io.BytesIO()
+            audio = (rng.standard_normal(800 * (i + 1)) * 0.1).astype(np.float32)
+            sf.write(buffer, audio, 8_000, format="WAV")
+            audios.append({"bytes": buffer.getvalue(), "path": f"{i}.wav"})
+
+        table = DT.from_dict(
+            {
+                "audio": audios,
+                "path": [f"p/{i}" for i in range(6)],
+                "text": [f"text {i}" for i in range(6)],
+                "speaker_id": [i % 2 for i in range(6)],
+            },
+            features=Features(
+                {
+                    "audio": Audio(),
+                    "path": Value("string"),
+                    "text": Value("string"),
+                    "speaker_id": Value("int64"),
+                }
+            ),
+        )
+        return ZerothKoreanDataset(table, 16_000, ("asr", "diarization"))
+
+    def test_same_samples(self, dataset: ZerothKoreanDataset):
+        preprocessed = dataset.preprocess()
+        assert preprocessed.is_preprocessed
+        for expected, result in zip(dataset, preprocessed):
+            assert expected.id == result.id
+            assert expected.Y == result.Y
+            np.testing.assert_allclose(expected.audio, result.audio, atol=1e-6)
+        assert list(dataset.iter_labels()) == list(preprocessed.iter_labels())
+
+    def test_int16(self, dataset: ZerothKoreanDataset):
+        preprocessed = dataset.preprocess(dtype="int16")
+        result = preprocessed.get_batch([4, 1])
+        expected = dataset.get_batch([4, 1])
+        for e, r in zip(expected, result):
+            assert r.audio.dtype == np.float32
+            np.testing.assert_allclose(e.audio, r.audio, atol=1e-4)
+
+    def test_keeps_state(self, dataset: ZerothKoreanDataset):
+        preprocessed = dataset.preprocess()
+        assert preprocessed.select([2, 0]).is_preprocessed
+        assert preprocessed.slice(1, 3).is_preprocessed
+
+    def test_mismatch(self, dataset: ZerothKoreanDataset):
+        args = dataset.preprocess().args
+        args["sr"] = 8_000
+        assert not ZerothKoreanDataset(**args).is_preprocessed
+
+    def test_invalid_dtype(self, dataset: ZerothKoreanDataset):
+        with pytest.raises(ValueError):
+            dataset.preprocess(dtype="float16")
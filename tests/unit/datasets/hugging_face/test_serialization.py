@@ -0,0 +1,87 @@
+import json
+import pytest
+
+from pathlib import Path
+from datasets import Dataset as DT, load_from_disk
+
+from sjaipy.datasets.hugging_face.zeroth_korean import ZerothKoreanDataset
+
+
+def _table(n: int, prefix: str = "t") -> DT:
+    return DT.from_dict(
+        {
+            "path": [f"p/{i}" for i in range(n)],
+            "text": [f"{prefix}{i}" for i in range(n)],
+            "speaker_id": [i % 3 for i in range(n)],
+            "extra": list(range(n)),
+        }
+    )
+
+
+class TestSerialization:
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> Path:
+        _table(12).save_to_disk(tmp_path / "ds", num_shards=2)
+        return tmp_path / "ds"
+
+    @pytest.fixture
+    def dataset(self, path: Path) -> ZerothKoreanDataset:
+        return ZerothKoreanDataset(load_from_disk(path), 16_000, ("asr",))
+
+    @staticmethod
+    def roundtrip(dataset: ZerothKoreanDataset) -> tuple[dict, ZerothKoreanDataset]:
+        # 워커로 보내거나 설정 파일에 저장하는 경우처럼 JSON 을 거침
+        data = json.loads(json.dumps(dataset.to_dict()))
+        restored = ZerothKoreanDataset.from_dict(data)
+
+        assert len(restored) == len(dataset)
+        assert [s.id for s in restored] == [s.id for s in dataset]
+        assert list(restored.iter_labels()) == list(dataset.iter_labels())
+        inner = restored.args["dataset"]
+        assert inner.column_names == dataset.args["dataset"].column_names
+        assert inner._fingerprint == dataset.args["dataset"]._fingerprint
+        return data, restored
+
+    def test_data_files(self, dataset: ZerothKoreanDataset, path: Path):
+        data, _ = self.roundtrip(dataset)
+        assert "dataset" not in data
+        assert [Path(f).parent for f in data["data_files"]] == [path, path]
+        assert data["indices_file"] is None and data["indices"] is None
+
+    def test_select(self, dataset: ZerothKoreanDataset):
+        view = dataset.select([7, 2, 11, 2])
+        data, restored = self.roundtrip(view)
+        assert data["indices"] == [7, 2, 11, 2] and data["indices_file"] is None
+        # 선택한 뷰의 fingerprint 를 유지
+        assert (
+            restored.args["dataset"]._fingerprint
+            != dataset.args["dataset"]._fingerprint
+        )
+
+    def test_indices_file(self, dataset: ZerothKoreanDataset, tmp_path: Path):
+        inner = dataset.args["dataset"].select(
+            [5, 0, 9], indices_cache_file_name=str(tmp_path / "indices.arrow")
+        )
+        view = ZerothKoreanDataset(inner, 16_000, ("asr",))
+        data, _ = self.roundtrip(view)
+        assert data["indices_file"] == str(tmp_path / "indices.arrow")
+        assert data["indices"] is None
+
+    def test_column_names(self, dataset: ZerothKoreanDataset):
+        inner = dataset.args["dataset"].remove_columns(["extra"])
+        data, restored = self.roundtrip(ZerothKoreanDataset(inner, 16_000, ("asr",)))
+        # 파일에는 있는 컬럼이 복원되지 않아야 함
+        assert data["column_names"] == ["path", "text", "speaker_id"]
+        assert restored.args["dataset"].column_names == ["path", "text", "speaker_id"]
+
+    def test_in_memory(self):
+        dataset = ZerothKoreanDataset(_table(4), 16_000, ("asr",))
+        data, _ = self.roundtrip(dataset)
+        assert "data_files" not in data
+
+    def test_changed_files(self, dataset: ZerothKoreanDataset, path: Path):
+        data = dataset.select([1, 0]).to_dict()
+        # 같은 위치에 다른 내용을 다시 저장하면 fingerprint 가 맞지 않음
+        _table(12, prefix="u").save_to_disk(path, num_shards=2)
+        with pytest.raises(ValueError, match="changed since to_dict"):
+            ZerothKoreanDataset.from_dict(data)
@@ -0,0 +1 @@
+# tests/unit/evaluator/__init__.py
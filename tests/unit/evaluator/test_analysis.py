@@ -0,0 +1,103 @@
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+from sjaipy.evaluator.alignment import (
+    CORRECT,
+    DELETION,
+    INSERTION,
+    SUBSTITUTION,
+    AlignmentCounts,
+)
+from sjaipy.evaluator.analysis import AlignmentTable, align_trn
+from sjaipy.evaluator.scorer import CHAR, score_pairs, score_trn
+from sjaipy.evaluator.sclite_utils import TRNFormat
+
+REF = [
+    TRNFormat("spk1_a", "the cat sat on the mat"),
+    TRNFormat("spk1_b", "hello world"),
+    TRNFormat("spk2_a", "a b c"),
+    TRNFormat("spk2_b", ""),
+]
+HYP = [
+    TRNFormat("spk1_a", "a cat sat the mat mat"),
+    TRNFormat("spk1_b", "hello word"),
+    TRNFormat("spk2_a", "a b c"),
+    TRNFormat("spk2_b", "uh"),
+]
+
+
+@pytest.fixture
+def table() -> AlignmentTable:
+    return align_trn(REF, HYP)
+
+
+class TestAlignmentTable:
+    def test_counts_match_scorer(self, table: AlignmentTable):
+        expected = score_pairs(REF, HYP)
+        assert table.ids == list(expected)
+        for id, counts in expected.items():
+            assert table.utterance_counts(id) == counts
+        assert table.summary() == score_trn(REF, HYP)
+
+    def test_utterance(self, table: AlignmentTable):
+        assert table.utterance("spk1_a") == [
+            ("THE", "A", SUBSTITUTION),
+            ("CAT", "CAT", CORRECT),
+            ("SAT", "SAT", CORRECT),
+            ("ON", None, DELETION),
+            ("THE", "THE", CORRECT),
+            (None, "MAT", INSERTION),
+            ("MAT", "MAT", CORRECT),
+        ]
+        assert table.utterance("spk2_b") == [(None, "UH", INSERTION)]
+
+    def test_csr_layout(self, table: AlignmentTable):
+        assert table.offsets.tolist() == [0, 7, 9, 12, 13]
+        assert len(table.ops) == len(table.ref_tokens) == len(table.hyp_tokens) == 13
+        assert table.counts.shape == (4, 4)
+
+    def test_confusions(self, table: AlignmentTable):
+        assert table.confusions() == [("THE", "A", 1), ("WORLD", "WORD", 1)]
+        errors = table.confusions(ops=(DELETION, INSERTION), top=5)
+        assert sorted(errors, key=str) == sorted(
+            [("ON", None, 1), (None, "MAT", 1), (None, "UH", 1)], key=str
+        )
+        assert table.confusions(top=1) == [("THE", "A", 1)]
+
+    def test_breakdown(self, table: AlignmentTable):
+        result = table.breakdown(lambda id: id.split("_")[0])
+        assert result["spk1"] == score_trn(REF[:2], HYP[:2])
+        assert result["spk2"] == score_trn(REF[2:], HYP[2:])
+
+        by_dataset = table.breakdown({r.id: "test" for r in REF})
+        assert by_dataset == {"test": table.summary()}
+
+    @pytest.mark.parametrize("name", ["alignment.npz", "alignment", "alignment.bin"])
+    def test_save_and_load(self, table: AlignmentTable, tmp_path: Path, name: str):
+        table.save(tmp_path / name)
+        assert [p.name for p in tmp_path.iterdir()] == [name]
+
+        loaded = AlignmentTable.load(tmp_path / name)
+        assert loaded.ids == table.ids
+        assert loaded.vocab == table.vocab
+        np.testing.assert_array_equal(loaded.ops, table.ops)
+        assert loaded.utterance("spk1_b") == table.utterance("spk1_b")
+
+    def test_to_arrow(self, table: AlignmentTable):
+        pytest.importorskip("pyarrow")
+        arrow = table.to_arrow()
+        assert arrow.num_rows == 4
+        row = arrow.slice(1, 1).to_pylist()[0]
+        assert row["id"] == "spk1_b"
+        assert row["ref"] == ["HELLO", "WORLD"]
+        assert row["hyp"] == ["HELLO", "WORD"]
+        assert row["ops"] == [CORRECT, SUBSTITUTION]
+        assert row["substitutions"] == 1
+        assert arrow.slice(0, 1).to_pylist()[0]["hyp"][3] is None
+
+    def test_char_unit(self):
+        table = align_trn([TRNFormat("a", "가나")], [TRNFormat("a", "가다")], unit=CHAR)
+        assert table.utterance_counts("a") == AlignmentCounts(1, 1, 0, 0)
+        assert table.confusions() == [("나", "다", 1)]
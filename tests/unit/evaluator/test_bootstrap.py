@@ -0,0 +1,81 @@
+import pytest
+import numpy as np
+
+from sjaipy.evaluator.alignment import AlignmentCounts
+from sjaipy.evaluator.bootstrap import (
+    bootstrap_wer,
+    paired_bootstrap,
+    paired_counts,
+    utterance_counts,
+)
+
+
+def _counts(n: int, error_rate: float, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(1, 30, size=n)
+    return rng.binomial(lengths, error_rate), lengths
+
+
+class TestBootstrapWer:
+    def test_interval(self):
+        errors, lengths = _counts(5_000, 0.2, 0)
+        result = bootstrap_wer(
+            errors, lengths, num_resamples=2_000, rng=np.random.default_rng(1)
+        )
+
+        assert result.wer_percent == pytest.approx(100 * errors.sum() / lengths.sum())
+        assert result.low < result.wer_percent < result.high
+
+        # 발화를 직접 복원 추출한 bootstrap 과 표준 오차가 비슷해야 함
+        rng = np.random.default_rng(2)
+        indices = rng.integers(0, len(errors), size=(2_000, len(errors)))
+        naive = 100 * errors[indices].sum(axis=1) / lengths[indices].sum(axis=1)
+        assert result.std == pytest.approx(naive.std(ddof=1), rel=0.1)
+
+    def test_reproducible(self):
+        errors, lengths = _counts(1_000, 0.1, 3)
+        a = bootstrap_wer(errors, lengths, 500, rng=np.random.default_rng(4))
+        b = bootstrap_wer(errors, lengths, 500, rng=np.random.default_rng(4))
+        assert a == b
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            bootstrap_wer([], [])
+        with pytest.raises(ValueError):
+            bootstrap_wer([1, 2], [3])
+        with pytest.raises(ValueError):
+            bootstrap_wer([1], [3], confidence=1.5)
+
+
+class TestPairedBootstrap:
+    def test_same_system(self):
+        errors, lengths = _counts(1_000, 0.2, 5)
+        result = paired_bootstrap(errors, errors, lengths, 500)
+        assert result.delta_percent == 0.0
+        assert result.low == result.high == 0.0
+        assert result.p_value == 1.0
+
+    def test_better_system(self):
+        errors_b, lengths = _counts(5_000, 0.2, 6)
+        errors_a = np.maximum(errors_b - (np.arange(5_000) % 2), 0)
+        result = paired_bootstrap(
+            errors_a, errors_b, lengths, 1_000, rng=np.random.default_rng(7)
+        )
+        assert result.delta_percent < 0
+        assert result.high < 0
+        assert result.p_value < 0.01
+        assert result.a_better_percent == 100.0
+
+    def test_paired_counts(self):
+        a = {"x": AlignmentCounts(2, 1, 0, 1), "y": AlignmentCounts(1, 0, 0, 0)}
+        b = {"y": AlignmentCounts(0, 1, 0, 0), "x": AlignmentCounts(3, 0, 0, 0)}
+        errors_a, errors_b, lengths = paired_counts(a, b)
+        np.testing.assert_array_equal(errors_a, [2, 0])
+        np.testing.assert_array_equal(errors_b, [0, 1])
+        np.testing.assert_array_equal(lengths, [3, 1])
+        np.testing.assert_array_equal(utterance_counts(a)[0], errors_a)
+
+        with pytest.raises(ValueError):
+            paired_counts(a, {"x": b["x"]})
+        with pytest.raises(ValueError):
+            paired_counts(a, {**b, "y": AlignmentCounts(0, 0, 0, 0)})
@@ -0,0 +1,132 @@
+import pytest
+import numpy as np
+
+from scipy.optimize import linear_sum_assignment
+
+from sjaipy.evaluator.diarization import (
+    diarization_counts,
+    make_rttm_file,
+    read_rttm,
+    score_diarization,
+    speaker_jaccard_errors,
+)
+
+REF = [
+    {"start": 0.0, "end": 10.0, "label": "A"},
+    {"start": 5.0, "end": 15.0, "label": "B"},
+]
+HYP = [
+    {"start": 0.0, "end": 10.0, "label": 0},
+    {"start": 5.0, "end": 12.0, "label": 1},
+    {"start": 12.0, "end": 15.0, "label": 2},
+]
+
+
+def _random_labels(rng: np.random.Generator, n: int, speakers: int) -> list[dict]:
+    # 0.1 초 격자 위의 구간
+    starts = rng.integers(0, 36_000, size=n)
+    lengths = rng.integers(1, 100, size=n)
+    labels = rng.integers(0, speakers, size=n)
+    return [
+        {"start": s / 10, "end": (s + d) / 10, "label": int(k)}
+        for s, d, k in zip(starts, lengths, labels)
+    ]
+
+
+def _frame_der(ref: list[dict], hyp: list[dict]) -> tuple[float, float, float, float]:
+    # 0.1 초 프레임 단위로 직접 계산한 (scored, missed, false alarm, confusion)
+    def frames(labels: list[dict]) -> np.ndarray:
+        names = sorted({x["label"] for x in labels})
+        result = np.zeros((36_200, len(names)), dtype=bool)
+        for x in labels:
+            start, end = round(x["start"] * 10), round(x["end"] * 10)
+            result[start:end, names.index(x["label"])] = True
+        return result
+
+    R, H = frames(ref), frames(hyp)
+    rows, cols = linear_sum_assignment(R.T.astype(int) @ H, maximize=True)
+    num_ref, num_hyp = R.sum(axis=1), H.sum(axis=1)
+    correct = (R[:, rows] & H[:, cols]).sum(axis=1)
+    return (
+        num_ref.sum() / 10,
+        np.maximum(num_ref - num_hyp, 0).sum() / 10,
+        np.maximum(num_hyp - num_ref, 0).sum() / 10,
+        (np.minimum(num_ref, num_hyp) - correct).sum() / 10,
+    )
+
+
+class TestDiarizationCounts:
+    def test_overlap_and_confusion(self):
+        counts = diarization_counts(REF, HYP)
+        assert counts == pytest.approx((20.0, 0.0, 0.0, 3.0))
+        assert counts.errors == pytest.approx(3.0)
+
+    def test_collar(self):
+        ref = [{"start": 0.0, "end": 10.0, "label": "A"}]
+        hyp = [{"start": 1.0, "end": 10.0, "label": "x"}]
+        assert diarization_counts(ref, hyp) == pytest.approx((10.0, 1.0, 0.0, 0.0))
+        # [-1, 1], [9, 11] 은 채점하지 않음
+        assert diarization_counts(ref, hyp, collar=1.0) == pytest.approx(
+            (8.0, 0.0, 0.0, 0.0)
+        )
+
+    def test_skip_overlap(self):
+        # 매칭도 채점 구간에서만 하므로 B 는 z 와 짝지어짐
+        counts = diarization_counts(REF, HYP, skip_overlap=True)
+        assert counts == pytest.approx((10.0, 0.0, 0.0, 2.0))
+
+    def test_missed_and_false_alarm(self):
+        ref = [{"start": 0.0, "end": 4.0, "label": "A"}]
+        hyp = [{"start": 2.0, "end": 6.0, "label": "x"}]
+        assert diarization_counts(ref, hyp) == pytest.approx((4.0, 2.0, 2.0, 0.0))
+        assert diarization_counts(ref, []) == pytest.approx((4.0, 4.0, 0.0, 0.0))
+        assert diarization_counts([], []) == pytest.approx((0.0, 0.0, 0.0, 0.0))
+
+    def test_matches_frame_level(self):
+        rng = np.random.default_rng(0)
+        ref = _random_labels(rng, 2_000, 4)
+        hyp = _random_labels(rng, 2_000, 5)
+        assert diarization_counts(ref, hyp) == pytest.approx(_frame_der(ref, hyp))
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            diarization_counts([{"start": 2.0, "end": 1.0, "label": "A"}], [])
+        with pytest.raises(ValueError):
+            diarization_counts(REF, HYP, collar=-1.0)
+
+
+class TestSpeakerJaccardErrors:
+    def test_errors(self):
+        errors = speaker_jaccard_errors(REF, HYP)
+        assert errors == pytest.approx({"A": 0.0, "B": 0.3})
+
+    def test_unmapped_speaker(self):
+        errors = speaker_jaccard_errors(REF, HYP[:1])
+        assert errors == pytest.approx({"A": 0.0, "B": 1.0})
+
+
+class TestScoreDiarization:
+    def test_summary(self):
+        result = score_diarization({"a": REF, "b": REF[:1]}, {"a": HYP})
+        # b 는 예측이 없어 전부 miss
+        assert result == {
+            "num_recordings": 2,
+            "scored_speech": 30.0,
+            "missed_percent": 33.33,
+            "false_alarm_percent": 0.0,
+            "confusion_percent": 10.0,
+            "der_percent": 43.33,
+            "jer_percent": 43.33,
+        }
+
+    def test_rttm(self, tmp_path):
+        make_rttm_file({"a": REF}, tmp_path / "ref.rttm")
+        make_rttm_file({"a": HYP}, tmp_path / "hyp.rttm")
+
+        labels = read_rttm(tmp_path / "ref.rttm")
+        assert labels == {"a": REF}
+        assert read_rttm(tmp_path / "hyp.rttm")["a"][2]["label"] == "2"
+
+        result = score_diarization(tmp_path / "ref.rttm", tmp_path / "hyp.rttm")
+        assert result["der_percent"] == 15.0
+        assert result["jer_percent"] == 15.0
@@ -0,0 +1,125 @@
+import pickle
+import numpy as np
+
+from pathlib import Path
+
+from sjaipy.datasets import Sample
+from sjaipy.evaluator.pipeline import EvaluationPipeline
+from sjaipy.evaluator.hypothesis_store import (
+    HypothesisStore,
+    audio_fingerprint,
+    config_fingerprint,
+)
+from sjaipy.evaluator.sclite_utils import TRNFormat, generate_ref_and_hyp
+
+from tests.unit.datasets.dataset._dummy_dataset import _DummyDataset
+
+SAMPLE_RATE = 8_000
+
+
+def _dataset(n: int) -> _DummyDataset:
+    samples = [
+        Sample(
+            id=f"utt_{i:03d}",
+            load_audio=np.full(100, i, dtype=np.float32),
+            Y={"asr": f"word {i}"},
+        )
+        for i in range(n)
+    ]
+    return _DummyDataset(samples, sr=SAMPLE_RATE, task=("asr",))
+
+
+class _CountingTranscriber:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, audio: np.ndarray, *_) -> str:
+        self.calls += 1
+        return f"Word {int(audio[0])}"
+
+
+class TestFingerprint:
+    def test_audio(self):
+        audio = np.arange(10, dtype=np.float32)
+        assert audio_fingerprint(audio) == audio_fingerprint(audio.copy())
+        assert audio_fingerprint(audio) != audio_fingerprint(audio + 1)
+        assert audio_fingerprint(audio) != audio_fingerprint(audio.astype(np.float64))
+        assert audio_fingerprint(audio[::2]) == audio_fingerprint(audio[::2].copy())
+
+    def test_config(self):
+        assert config_fingerprint({"a": 1, "b": 2}) == config_fingerprint(
+            {"b": 2, "a": 1}
+        )
+        assert config_fingerprint({"a": 1}) != config_fingerprint({"a": 2})
+
+
+class TestHypothesisStore:
+    def test_get_put(self, tmp_path: Path):
+        store = HypothesisStore(tmp_path / "store.sqlite3")
+        assert store.get("a", "h", "c") is None
+
+        store.put("a", "h", "c", "text")
+        assert store.get("a", "h", "c") == "text"
+        assert store.get("a", "other", "c") is None
+        assert store.get("a", "h", "other") is None
+        assert len(store) == 1
+        assert store.sample_ids("c") == {"a"}
+
+    def test_persistent_and_picklable(self, tmp_path: Path):
+        store = HypothesisStore(tmp_path / "store.sqlite3")
+        store.put("a", "h", "c", "text")
+        store.close()
+
+        assert HypothesisStore(tmp_path / "store.sqlite3").get("a", "h", "c") == "text"
+        assert pickle.loads(pickle.dumps(store)).get("a", "h", "c") == "text"
+
+    def test_pipeline_resumes(self, tmp_path: Path):
+        dataset = _dataset(10)
+        store = HypothesisStore(tmp_path / "store.sqlite3")
+        config = {"model": "dummy", "beam_size": 1}
+
+        transcriber = _CountingTranscriber()
+        EvaluationPipeline(transcriber, store=store, transcriber_config=config).run(
+            dataset[:6]
+        )
+        assert transcriber.calls == 6
+
+        # 정규화만 바뀐 재실행은 끝난 발화를 다시 전사하지 않음
+        transcriber = _CountingTranscriber()
+        refs, hyps = EvaluationPipeline(
+            transcriber,
+            normalizer=str.upper,
+            store=store,
+            transcriber_config=config,
+            transcribe_workers=2,
+        ).run(dataset)
+        assert transcriber.calls == 4
+        assert hyps[0] == TRNFormat("utt_000", "WORD 0")
+        assert len(store) == 10
+
+        # 설정이 바뀌면 다시 전사
+        transcriber = _CountingTranscriber()
+        EvaluationPipeline(
+            transcriber, store=store, transcriber_config={**config, "beam_size": 5}
+        ).run(dataset)
+        assert transcriber.calls == 10
+
+    def test_generate_ref_and_hyp(self, tmp_path: Path):
+        store = HypothesisStore(tmp_path / "store.sqlite3")
+        items = [("k0", "a"), ("k1", "b")]
+
+        def data_loader(datasets, sr, sample_size, rng):
+            for i, (key, y) in enumerate(items):
+                yield np.full(4, i, dtype=np.float32), key, y, Path(key)
+
+        for expected_calls in (2, 0):
+            transcriber = _CountingTranscriber()
+            _, hyps = generate_ref_and_hyp(
+                None,
+                transcriber=transcriber,
+                data_loader=data_loader,
+                store=store,
+                transcriber_config={"model": "dummy"},
+            )
+            assert transcriber.calls == expected_calls
+            assert [h.text for h in hyps] == ["Word 0", "Word 1"]
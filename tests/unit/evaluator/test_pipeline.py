@@ -0,0 +1,112 @@
+import time
+import threading
+import pytest
+import numpy as np
+
+from sjaipy.datasets import Sample
+from sjaipy.evaluator.pipeline import EvaluationPipeline
+from sjaipy.evaluator.scorer import ErrorAccumulator, score_trn
+from sjaipy.evaluator.sclite_utils import TRNFormat
+
+from tests.unit.datasets.dataset._dummy_dataset import _DummyDataset
+
+SAMPLE_RATE = 8_000
+WORDS = ["zero", "one", "two", "three", "four", "five", "six", "seven"]
+
+
+def _dataset(n: int) -> _DummyDataset:
+    samples = [
+        Sample(
+            id=f"utt_{i:03d}",
+            load_audio=np.full(SAMPLE_RATE, i, dtype=np.float32),
+            Y={"asr": f"{WORDS[i % 8]} {WORDS[(i + 1) % 8]}"},
+        )
+        for i in range(n)
+    ]
+    return _DummyDataset(samples, sr=SAMPLE_RATE, task=("asr",))
+
+
+def _transcriber(audio: np.ndarray) -> str:
+    # 처리 순서가 섞이도록 발화마다 지연을 다르게 줌
+    i = int(round(audio.mean()))
+    time.sleep(0.001 * (i % 5))
+    return WORDS[i % 8] if i % 3 else f"{WORDS[i % 8]} {WORDS[(i + 1) % 8]}"
+
+
+class TestEvaluationPipeline:
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_ordered_results(self, workers: int):
+        dataset = _dataset(40)
+        pipeline = EvaluationPipeline(
+            _transcriber,
+            normalizer=str.upper,
+            load_workers=workers,
+            transcribe_workers=workers,
+            score_workers=workers,
+            queue_size=2,
+        )
+        refs, hyps = pipeline.run(dataset)
+
+        assert [r.id for r in refs] == [s.id for s in dataset]
+        assert [h.id for h in hyps] == [s.id for s in dataset]
+        assert refs[1] == TRNFormat("utt_001", "ONE TWO")
+        assert hyps[1] == TRNFormat("utt_001", "ONE")
+        assert hyps[3] == TRNFormat("utt_003", "THREE FOUR")
+
+    def test_accumulator(self):
+        dataset = _dataset(30)
+        accumulator = ErrorAccumulator()
+        refs, hyps = EvaluationPipeline(
+            _transcriber, accumulator=accumulator, transcribe_workers=3
+        ).run(dataset)
+        assert accumulator.summary() == score_trn(refs, hyps)
+
+        # 이미 집계된 발화는 다시 전사하지 않음
+        calls = []
+        pipeline = EvaluationPipeline(
+            lambda audio: calls.append(audio) or "", accumulator=accumulator
+        )
+        assert pipeline.run(dataset) == ([], [])
+        assert calls == []
+
+    def test_resample(self):
+        lengths = []
+
+        def transcriber(audio: np.ndarray) -> str:
+            lengths.append(len(audio))
+            return ""
+
+        EvaluationPipeline(transcriber, sr=16_000).run(_dataset(3))
+        assert lengths == [16_000] * 3
+
+    def test_error_propagates(self):
+        def transcriber(audio: np.ndarray) -> str:
+            if audio.mean() == 5:
+                raise RuntimeError("boom")
+            return ""
+
+        pipeline = EvaluationPipeline(transcriber, transcribe_workers=2, queue_size=1)
+        with pytest.raises(RuntimeError, match="boom"):
+            pipeline.run(_dataset(50))
+
+    def test_early_close(self):
+        pipeline = EvaluationPipeline(_transcriber, queue_size=1)
+        iterator = pipeline.iter(_dataset(50))
+        first = next(iterator)
+        iterator.close()
+        assert first[0].id == "utt_000"
+
+    def test_transcriber_processes(self):
+        # WhisperModelPool 처럼 num_processes 를 가진 전사기는 그만큼 동시에 호출됨
+        class PoolTranscriber:
+            num_processes = 3
+
+            def __init__(self):
+                self.barrier = threading.Barrier(self.num_processes, timeout=5)
+
+            def __call__(self, audio: np.ndarray) -> str:
+                self.barrier.wait()
+                return ""
+
+        _, hyps = EvaluationPipeline(PoolTranscriber()).run(_dataset(6))
+        assert len(hyps) == 6
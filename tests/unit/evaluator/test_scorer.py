@@ -0,0 +1,384 @@
+import shutil
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+from sjaipy.evaluator.alignment import (
+    CORRECT,
+    DELETION,
+    DELETION_COST,
+    INSERTION,
+    INSERTION_COST,
+    SUBSTITUTION,
+    SUBSTITUTION_COST,
+    AlignmentCounts,
+    align,
+    align_batch,
+    cost_matrix,
+    count_ops,
+)
+from sjaipy.evaluator.analysis import align_trn
+from sjaipy.evaluator.scorer import (
+    CHAR,
+    JAMO,
+    SPACE_TOKEN,
+    ErrorAccumulator,
+    decompose_hangul,
+    read_trn_file,
+    score_pairs,
+    score_trn,
+    tokenize,
+)
+from sjaipy.evaluator.sclite_utils import (
+    TRNFormat,
+    generate_ref_and_hyp,
+    make_trn_file,
+    parse_sclite_summary,
+    sclite_trn,
+    sclite_trn_file,
+)
+
+# (ref, hyp, correct, substitutions, deletions, insertions)
+CASES = [
+    ("a b c", "a b c", 3, 0, 0, 0),
+    ("a b c", "a x c", 2, 1, 0, 0),
+    ("a b c", "a c", 2, 0, 1, 0),
+    ("a c", "a b c", 2, 0, 0, 1),
+    ("a b", "b a", 1, 0, 1, 1),
+    ("a b", "", 0, 0, 2, 0),
+    ("", "a", 0, 0, 0, 1),
+    ("", "", 0, 0, 0, 0),
+    ("Hello World", "hello  world", 2, 0, 0, 0),
+    ("the cat sat on the mat", "a cat sat the mat mat", 4, 1, 1, 1),
+]
+
+# sclite 의 pra/sys 형식 기준 결과. 비용이 같은 경로(fix-002 ~ fix-005)를 포함한다.
+# sctk 없이 sclite 규칙대로 직접 계산한 값이므로, sctk 가 있으면
+# test_fixtures_match_sclite 가 실제 sclite 출력과 비교한다.
+# 다시 만들 때: sctk sclite -r ref.trn trn -h hyp.trn trn -i rm -o sum pra
+SCLITE_DIR = Path(__file__).parent / "sclite"
+
+
+def _naive_cost_matrix(ref: list[int], hyp: list[int]) -> np.ndarray:
+    D = np.zeros((len(ref) + 1, len(hyp) + 1), dtype=np.int64)
+    D[:, 0] = np.arange(len(ref) + 1) * DELETION_COST
+    D[0, :] = np.arange(len(hyp) + 1) * INSERTION_COST
+    for i in range(1, len(ref) + 1):
+        for j in range(1, len(hyp) + 1):
+            D[i, j] = min(
+                D[i - 1, j - 1]
+                + (0 if ref[i - 1] == hyp[j - 1] else SUBSTITUTION_COST),
+                D[i - 1, j] + DELETION_COST,
+                D[i, j - 1] + INSERTION_COST,
+            )
+    return D
+
+
+def _read_pra(path: Path) -> dict[str, tuple[AlignmentCounts, list]]:
+    # id 별 (Scores 줄, [(ref, hyp, 연산 코드)]). 정렬 줄의 "***" 는 빈 칸
+    result, id, scores, ref = {}, None, None, None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        key, _, value = line.partition(":")
+        if key == "id":
+            id = value.strip()[1:-1]
+        elif key == "Scores":
+            scores = AlignmentCounts(*map(int, value.split()[-4:]))
+        elif key == "REF":
+            ref = [None if set(t) == {"*"} else t.upper() for t in value.split()]
+        elif key == "HYP":
+            hyp = [None if set(t) == {"*"} else t.upper() for t in value.split()]
+            ops = [_pra_op(r, h) for r, h in zip(ref, hyp)]
+            result[id] = (scores, list(zip(ref, hyp, ops)))
+    return result
+
+
+def _pra_op(ref: str | None, hyp: str | None) -> int:
+    if ref is None:
+        return INSERTION
+    if hyp is None:
+        return DELETION
+    return CORRECT if ref == hyp else SUBSTITUTION
+
+
+def _random_corpus(rng: np.random.Generator, n: int) -> tuple[list, list]:
+    words = ["A", "B", "C", "D", "E", "F"]
+    refs, hyps = [], []
+    for i in range(n):
+        ref = rng.choice(words, size=rng.integers(0, 12)).tolist()
+        hyp = rng.choice(words, size=rng.integers(0, 12)).tolist()
+        refs.append(TRNFormat(id=f"utt_{i:04d}", text=" ".join(ref)))
+        hyps.append(TRNFormat(id=f"utt_{i:04d}", text=" ".join(hyp)))
+    return refs, hyps
+
+
+class TestAlignment:
+    def test_cost_matrix_matches_naive_dp(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            ref = rng.integers(0, 4, size=rng.integers(0, 10)).tolist()
+            hyp = rng.integers(0, 4, size=rng.integers(0, 10)).tolist()
+            np.testing.assert_array_equal(
+                cost_matrix(np.array(ref), np.array(hyp)),
+                _naive_cost_matrix(ref, hyp),
+            )
+
+    def test_ops_are_consistent(self):
+        rng = np.random.default_rng(1)
+        for _ in range(200):
+            ref = rng.integers(0, 4, size=rng.integers(0, 10)).tolist()
+            hyp = rng.integers(0, 4, size=rng.integers(0, 10)).tolist()
+            counts = count_ops(align(ref, hyp))
+            assert counts.correct + counts.substitutions + counts.deletions == len(ref)
+            assert counts.correct + counts.substitutions + counts.insertions == len(hyp)
+            cost = (
+                SUBSTITUTION_COST * counts.substitutions
+                + DELETION_COST * counts.deletions
+                + INSERTION_COST * counts.insertions
+            )
+            assert cost == _naive_cost_matrix(ref, hyp)[-1, -1]
+
+    def test_batch_matches_single(self):
+        rng = np.random.default_rng(4)
+        refs = [
+            rng.integers(0, 4, size=rng.integers(0, 10)).tolist() for _ in range(50)
+        ]
+        hyps = [
+            rng.integers(0, 4, size=rng.integers(0, 10)).tolist() for _ in range(50)
+        ]
+        for ops, ref, hyp in zip(align_batch(refs, hyps, batch_size=8), refs, hyps):
+            np.testing.assert_array_equal(ops, align(ref, hyp))
+
+    def test_max_cells(self):
+        # 칸 수 제한으로 배치가 잘리거나 한 쌍만 따로 정렬돼도 결과는 같아야 함
+        rng = np.random.default_rng(5)
+        refs = [
+            rng.integers(0, 6, size=rng.integers(0, 60)).tolist() for _ in range(40)
+        ]
+        hyps = [
+            rng.integers(0, 6, size=rng.integers(0, 60)).tolist() for _ in range(40)
+        ]
+        expected = align_batch(refs, hyps)
+        for max_cells in (1, 500, 5_000):
+            for ops, exp in zip(align_batch(refs, hyps, max_cells=max_cells), expected):
+                np.testing.assert_array_equal(ops, exp)
+
+
+class TestScorer:
+    @pytest.mark.parametrize("ref, hyp, c, s, d, i", CASES)
+    def test_counts(self, ref: str, hyp: str, c: int, s: int, d: int, i: int):
+        result = score_pairs([TRNFormat("x", ref)], [TRNFormat("x", hyp)])
+        assert result["x"] == AlignmentCounts(c, s, d, i)
+
+    def test_summary(self):
+        ref = [TRNFormat(f"{k}", r) for k, (r, *_) in enumerate(CASES)]
+        hyp = [
+            TRNFormat(f"{k}", h) for k, (_, h, *_) in reversed(list(enumerate(CASES)))
+        ]
+        summary = score_trn(ref, hyp)
+
+        assert summary == {
+            "num_sentences": 10,
+            "num_words": 23,
+            "correct_percent": 69.6,
+            "substitution_percent": 8.7,
+            "deletion_percent": 21.7,
+            "insertion_percent": 17.4,
+            "wer_percent": 47.8,
+            "sentence_error_percent": 70.0,
+        }
+
+    def test_trn_file_roundtrip(self, tmp_path: Path):
+        ref, hyp = _random_corpus(np.random.default_rng(2), 20)
+        make_trn_file(ref, tmp_path / "ref.trn")
+        make_trn_file(hyp, tmp_path / "hyp.trn")
+
+        items = read_trn_file(tmp_path / "ref.trn")
+        assert [item.id for item in items] == [item.id for item in ref]
+        assert score_trn(tmp_path / "ref.trn", tmp_path / "hyp.trn") == score_trn(
+            ref, hyp
+        )
+
+    def test_ids_must_match(self):
+        with pytest.raises(ValueError):
+            score_trn([TRNFormat("a", "x")], [TRNFormat("b", "x")])
+        with pytest.raises(ValueError):
+            score_trn([TRNFormat("a", "x")] * 2, [TRNFormat("a", "x")])
+
+    def test_matches_sclite_report(self):
+        expected = parse_sclite_summary((SCLITE_DIR / "hyp.trn.sys").read_text())
+        assert score_trn(SCLITE_DIR / "ref.trn", SCLITE_DIR / "hyp.trn") == expected
+
+        expected = _read_pra(SCLITE_DIR / "hyp.trn.pra")
+        table = align_trn(SCLITE_DIR / "ref.trn", SCLITE_DIR / "hyp.trn")
+        assert table.ids == list(expected)
+        for id, (counts, alignment) in expected.items():
+            assert table.utterance_counts(id) == counts
+            assert table.utterance(id) == alignment
+
+    @pytest.mark.skipif(shutil.which("sctk") is None, reason="sctk is not installed")
+    def test_matches_sclite(self):
+        rng = np.random.default_rng(3)
+        for _ in range(5):
+            ref, hyp = _random_corpus(rng, 200)
+            assert score_trn(ref, hyp) == parse_sclite_summary(sclite_trn(ref, hyp))
+
+        expected = parse_sclite_summary((SCLITE_DIR / "hyp.trn.sys").read_text())
+        output = sclite_trn(SCLITE_DIR / "ref.trn", SCLITE_DIR / "hyp.trn")
+        assert parse_sclite_summary(output) == expected
+
+    @pytest.mark.skipif(shutil.which("sctk") is None, reason="sctk is not installed")
+    def test_fixtures_match_sclite(self, tmp_path: Path):
+        # sclite 는 결과를 hyp 파일 옆에 쓰므로 입력을 복사해서 실행
+        for name in ("ref.trn", "hyp.trn"):
+            shutil.copy(SCLITE_DIR / name, tmp_path / name)
+        sclite_trn_file(
+            tmp_path / "ref.trn",
+            tmp_path / "hyp.trn",
+            tmp_path,
+            output_format=["sum", "pra"],
+            verbose=False,
+        )
+        assert _read_pra(tmp_path / "hyp.trn.pra") == _read_pra(
+            SCLITE_DIR / "hyp.trn.pra"
+        )
+        assert parse_sclite_summary(
+            (tmp_path / "hyp.trn.sys").read_text()
+        ) == parse_sclite_summary((SCLITE_DIR / "hyp.trn.sys").read_text())
+
+
+class TestErrorAccumulator:
+    def test_matches_score_trn(self):
+        ref, hyp = _random_corpus(np.random.default_rng(5), 50)
+        accumulator = ErrorAccumulator()
+        for r, h in zip(ref, hyp):
+            accumulator.update(r, h)
+        assert accumulator.summary() == score_trn(ref, hyp)
+        assert accumulator.num_sentences == 50
+
+    def test_interim_summary(self):
+        accumulator = ErrorAccumulator()
+        assert accumulator.summary()["wer_percent"] == 0.0
+
+        accumulator.update(TRNFormat("a", "x y"), TRNFormat("a", "x y"))
+        assert accumulator.wer == 0.0
+        accumulator.update(TRNFormat("b", "x y"), TRNFormat("b", "x"))
+        assert accumulator.wer == 0.25
+        assert accumulator.summary()["sentence_error_percent"] == 50.0
+
+    def test_rejects_duplicates(self):
+        accumulator = ErrorAccumulator()
+        accumulator.update(TRNFormat("a", "x"), TRNFormat("a", "x"))
+        assert "a" in accumulator
+        with pytest.raises(ValueError):
+            accumulator.update(TRNFormat("a", "x"), TRNFormat("a", "x"))
+        with pytest.raises(ValueError):
+            accumulator.update(TRNFormat("b", "x"), TRNFormat("c", "x"))
+
+    def test_merge(self):
+        ref, hyp = _random_corpus(np.random.default_rng(6), 40)
+        left, right = ErrorAccumulator(), ErrorAccumulator()
+        left.update_batch(ref[:25], hyp[:25])
+        right.update_batch(ref[25:], hyp[25:])
+
+        merged = left.merge(right)
+        assert merged.summary() == score_trn(ref, hyp)
+        assert merged.ids == {r.id for r in ref}
+        with pytest.raises(ValueError):
+            merged.merge(right)
+
+    def test_save_and_load(self, tmp_path: Path):
+        ref, hyp = _random_corpus(np.random.default_rng(7), 20)
+        accumulator = ErrorAccumulator()
+        accumulator.update_batch(ref, hyp)
+        accumulator.save(tmp_path / "checkpoint.json")
+
+        loaded = ErrorAccumulator.load(tmp_path / "checkpoint.json")
+        assert loaded.summary() == accumulator.summary()
+        assert loaded.ids == accumulator.ids
+        assert loaded.to_dict() == accumulator.to_dict()
+
+    def test_generate_ref_and_hyp(self):
+        items = [("k0", "a b"), ("k1", "c d"), ("k2", "e")]
+
+        def data_loader(datasets, sr, sample_size, rng):
+            for key, y in items:
+                yield np.zeros(1), key, y, Path(key)
+
+        accumulator = ErrorAccumulator()
+        accumulator.update(TRNFormat("k0", "a b"), TRNFormat("k0", "a b"))
+        refs, hyps = generate_ref_and_hyp(
+            None,
+            transcriber=lambda audio, path: "c",
+            data_loader=data_loader,
+            accumulator=accumulator,
+            keep_results=False,
+        )
+
+        assert refs == [] and hyps == []
+        assert accumulator.ids == {"k0", "k1", "k2"}
+        assert accumulator.totals == AlignmentCounts(3, 1, 1, 0)
+
+
+class TestTokenUnits:
+    def test_tokenize(self):
+        assert tokenize("안녕 하세요") == ["안녕", "하세요"]
+        assert tokenize("안녕 하세요", unit=CHAR) == [
+            "안",
+            "녕",
+            SPACE_TOKEN,
+            "하",
+            "세",
+            "요",
+        ]
+        assert tokenize("안녕 하세요", unit=CHAR, ignore_spacing=True) == list(
+            "안녕하세요"
+        )
+        assert tokenize("ab c", unit=CHAR) == ["A", "B", SPACE_TOKEN, "C"]
+        with pytest.raises(ValueError):
+            tokenize("a", unit="phone")
+        with pytest.raises(ValueError):
+            tokenize("a", ignore_spacing=True)
+
+    def test_decompose_hangul(self):
+        assert decompose_hangul("각") == "\u1100\u1161\u11a8"
+        assert decompose_hangul("가") == "\u1100\u1161"
+        assert decompose_hangul("힣") == "\u1112\u1175\u11c2"
+        assert decompose_hangul("a가ㄱ") == "a\u1100\u1161ㄱ"
+        assert tokenize("각 가", unit=JAMO, ignore_spacing=True) == list(
+            "\u1100\u1161\u11a8\u1100\u1161"
+        )
+
+    def test_cer(self):
+        ref = [TRNFormat("a", "오늘 날씨가 좋다")]
+        hyp = [TRNFormat("a", "오늘날씨가 좋다")]
+
+        assert score_trn(ref, hyp)["wer_percent"] == 66.7
+        cer = score_trn(ref, hyp, unit=CHAR)
+        assert cer["num_words"] == 9
+        assert cer["deletion_percent"] == 11.1
+        assert cer["wer_percent"] == 11.1
+        assert score_trn(ref, hyp, unit=CHAR, ignore_spacing=True)["wer_percent"] == 0.0
+        assert set(cer) == set(score_trn(ref, hyp))
+
+    def test_jamo(self):
+        ref = [TRNFormat("a", "각")]
+        hyp = [TRNFormat("a", "갂")]
+        assert score_trn(ref, hyp, unit=CHAR)["wer_percent"] == 100.0
+        jamo = score_trn(ref, hyp, unit=JAMO)
+        assert jamo["num_words"] == 3
+        assert jamo["substitution_percent"] == 33.3
+
+    def test_accumulator_units(self):
+        ref, hyp = TRNFormat("a", "오늘 날씨가"), TRNFormat("a", "오늘날씨 가")
+        accumulator = ErrorAccumulator(unit=CHAR, ignore_spacing=True)
+        accumulator.update(ref, hyp)
+        assert accumulator.wer == 0.0
+        restored = ErrorAccumulator.from_dict(accumulator.to_dict())
+        restored.update(TRNFormat("b", "가"), TRNFormat("b", "나"))
+        assert restored.summary() == score_trn(
+            [ref, TRNFormat("b", "가")],
+            [hyp, TRNFormat("b", "나")],
+            unit=CHAR,
+            ignore_spacing=True,
+        )
@@ -0,0 +1,99 @@
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+from sjaipy.datasets import Sample
+from sjaipy.evaluator.scorer import read_trn_file, score_trn
+from sjaipy.evaluator.sclite_utils import TRNFormat
+from sjaipy.evaluator.sharded import ShardedEvaluator, check_shard_ids, cpu_sets
+
+from tests.unit.datasets.dataset._dummy_dataset import _DummyDataset
+
+SAMPLE_RATE = 8_000
+WORDS = ["zero", "one", "two", "three"]
+
+
+def _dataset(n: int) -> _DummyDataset:
+    samples = [
+        Sample(
+            id=f"utt_{i:03d}",
+            load_audio=np.full(10, i, dtype=np.float32),
+            Y={"asr": f"{WORDS[i % 4]} {WORDS[(i + 1) % 4]}"},
+        )
+        for i in range(n)
+    ]
+    return _DummyDataset(samples, sr=SAMPLE_RATE, task=("asr",))
+
+
+def _transcribe(audio: np.ndarray) -> str:
+    i = int(audio[0])
+    return WORDS[i % 4] if i % 2 else f"{WORDS[i % 4]} {WORDS[(i + 1) % 4]}"
+
+
+def _transcriber_factory():
+    return _transcribe
+
+
+class TestCpuSets:
+    def test_disjoint(self):
+        sets = cpu_sets(3, cpus=range(8))
+        assert sets == [[0, 1, 2], [3, 4, 5], [6, 7]]
+
+    def test_too_many_shards(self):
+        with pytest.raises(ValueError):
+            cpu_sets(3, cpus=[0, 1])
+
+
+class TestCheckShardIds:
+    def test_valid(self):
+        check_shard_ids(
+            [[TRNFormat("a", "")], [TRNFormat("b", ""), TRNFormat("c", "")]],
+            ["a", "b", "c"],
+        )
+
+    def test_overlap(self):
+        with pytest.raises(ValueError, match="more than one"):
+            check_shard_ids([[TRNFormat("a", "")], [TRNFormat("a", "")]], ["a"])
+
+    def test_incomplete(self):
+        with pytest.raises(ValueError, match="incomplete"):
+            check_shard_ids([[TRNFormat("a", "")]], ["a", "b"])
+        with pytest.raises(ValueError, match="incomplete"):
+            check_shard_ids([[TRNFormat("a", "")], [TRNFormat("c", "")]], ["a"])
+
+
+class TestShardedEvaluator:
+    def test_run(self, tmp_path: Path):
+        dataset = _dataset(13)
+        evaluator = ShardedEvaluator(
+            _transcriber_factory,
+            output_dir=tmp_path,
+            num_shards=3,
+            normalizer=str.upper,
+            pin=False,
+        )
+        summary = evaluator.run(dataset)
+
+        refs = [TRNFormat(s.id, s.ASR) for s in dataset]
+        hyps = [TRNFormat(s.id, _transcribe(s.audio)) for s in dataset]
+        assert summary == score_trn(refs, hyps)
+        assert [r.id for r in read_trn_file(tmp_path / "ref.trn")] == [
+            s.id for s in dataset
+        ]
+        for k in range(3):
+            assert all(p.exists() for p in evaluator.shard_paths(k))
+
+    def test_merge_detects_missing_shard_entries(self, tmp_path: Path):
+        dataset = _dataset(6)
+        evaluator = ShardedEvaluator(
+            _transcriber_factory, output_dir=tmp_path, num_shards=2, pin=False
+        )
+        evaluator.run(dataset)
+
+        ref_path, hyp_path = evaluator.shard_paths(1)
+        for path in (ref_path, hyp_path):
+            lines = path.read_text(encoding="utf-8").splitlines()
+            path.write_text("\n".join(lines[:-1]) + "\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="incomplete"):
+            evaluator.merge([s.id for s in dataset])